@@ -0,0 +1,105 @@
+"""Benchmark: per packet cost of the forwarder data structs, synced by a manager or living in the layer process
+
+Compares the data structs of the PiCNSyncDataStructFactory in both modes:
+  * table operations an ICN layer performs to forward one interest and its content object
+  * round trip time of interests answered by a forwarder from its content store, with one process per layer and with
+    all layers in a single process (see AsyncioLayerStack)
+
+Run: python3 -m PiCN.Benchmarks.DataStructBenchmark
+"""
+
+import argparse
+import socket
+import statistics
+import time
+
+from PiCN.Layers.ICNLayer.ContentStore import ContentStoreMemoryBounded
+from PiCN.Layers.ICNLayer.ForwardingInformationBase import ForwardingInformationBaseMemoryTrie
+from PiCN.Layers.ICNLayer.PendingInterestTable import PendingInterestTableMemoryHashed
+from PiCN.Layers.PacketEncodingLayer.Encoder import SimpleStringEncoder
+from PiCN.Packets import Content, Interest, Name
+from PiCN.Processes import PiCNSyncDataStructFactory
+from PiCN.ProgramLibs.ICNForwarder import ICNForwarder
+
+
+def table_operations(in_process: bool, packets: int) -> float:
+    """forward interests and content objects through CS, FIB and PIT as done by the ICN layer
+    :param in_process: use data structs living in this process instead of a manager
+    :param packets: number of interests to forward
+    :return: mean time per interest/content pair in microseconds
+    """
+    synced_data_struct_factory = PiCNSyncDataStructFactory(in_process=in_process)
+    synced_data_struct_factory.register("cs", ContentStoreMemoryBounded)
+    synced_data_struct_factory.register("fib", ForwardingInformationBaseMemoryTrie)
+    synced_data_struct_factory.register("pit", PendingInterestTableMemoryHashed)
+    synced_data_struct_factory.create_manager()
+    cs = synced_data_struct_factory.manager.cs()
+    fib = synced_data_struct_factory.manager.fib()
+    pit = synced_data_struct_factory.manager.pit()
+    if in_process:
+        for data_struct in [cs, fib, pit]:
+            data_struct.start_owner()
+            data_struct.bind_owner()
+    fib.add_fib_entry(Name("/bench"), 1, static=True)
+    names = [Name("/bench/data/" + str(i)) for i in range(packets)]
+
+    start = time.perf_counter()
+    for name in names:
+        # interest from face 2
+        if cs.find_content_object(name) is None and pit.find_pit_entry(name) is None:
+            fib_entry = fib.find_fib_entry(name, pit.get_already_used_pit_entries(name), [2])
+            pit.add_pit_entry(name, 2)
+            pit.add_used_fib_entry(name, fib_entry)
+        # content from face 1
+        pit_entry = pit.find_pit_entry(name)
+        cs.add_content_object(Content(name, "data"))
+        pit.remove_pit_entry(pit_entry.name)
+    return (time.perf_counter() - start) / packets * 1e6
+
+
+def forwarder_rtt(in_process: bool, packets: int, single_process: bool=False) -> float:
+    """send interests to a forwarder answering them from its content store
+    :param in_process: start the forwarder with data structs living in the layer processes
+    :param packets: number of interests to send, one after another
+    :param single_process: run all layers of the forwarder in a single process
+    :return: median round trip time in microseconds
+    """
+    encoder = SimpleStringEncoder()
+    forwarder = ICNForwarder(0, encoder=SimpleStringEncoder(), log_level=255, in_process_data_structs=in_process,
+                             single_process=single_process)
+    port = forwarder.linklayer.interfaces[0].get_port()
+    forwarder.icnlayer.cs.add_content_object(Content("/bench/data", "data"), static=True)
+    forwarder.start_forwarder()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(5)
+    encoded_interest = encoder.encode(Interest("/bench/data"))
+    rtts = []
+    try:
+        for i in range(packets):
+            start = time.perf_counter()
+            sock.sendto(encoded_interest, ("127.0.0.1", port))
+            sock.recvfrom(8192)
+            rtts.append(time.perf_counter() - start)
+    finally:
+        sock.close()
+        forwarder.stop_forwarder()
+    return statistics.median(rtts) * 1e6
+
+
+def main(args):
+    print("{:<32}{:>16}{:>16}".format("", "manager [us]", "in process [us]"))
+    print("{:<32}{:>16.1f}{:>16.1f}".format("table operations per packet", table_operations(False, args.packets),
+                                            table_operations(True, args.packets)))
+    print("{:<32}{:>16.1f}{:>16.1f}".format("forwarder rtt (median)", forwarder_rtt(False, args.interests),
+                                            forwarder_rtt(True, args.interests)))
+    print("{:<32}{:>16.1f}{:>16.1f}".format("single process rtt (median)", forwarder_rtt(False, args.interests, True),
+                                            forwarder_rtt(True, args.interests, True)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='PiCN Data Struct Benchmark')
+    parser.add_argument('-n', '--packets', type=int, default=2000, help="number of packets for table operations (default: 2000)")
+    parser.add_argument('-i', '--interests', type=int, default=500, help="number of interests sent to the forwarder (default: 500)")
+    args = parser.parse_args()
+    main(args)
@@ -0,0 +1,45 @@
+"""Benchmark: packets/s encoded by the NdnTlvEncoder and the NdnTlvFastEncoder
+
+Encodes interests and content objects for chunk names sharing a prefix, as requested and served when fetching a large
+content object.
+
+Run: python3 -m PiCN.Benchmarks.EncoderBenchmark
+"""
+
+import argparse
+import time
+
+from PiCN.Layers.PacketEncodingLayer.Encoder import BasicEncoder, NdnTlvEncoder, NdnTlvFastEncoder
+from PiCN.Packets import Content, Interest, Name
+
+
+def encode_rate(encoder: BasicEncoder, packets: list) -> float:
+    """encode packets
+    :param encoder: encoder to use
+    :param packets: packets to encode
+    :return: packets per second
+    """
+    start = time.perf_counter()
+    for packet in packets:
+        encoder.encode(packet)
+    return len(packets) / (time.perf_counter() - start)
+
+
+def main(args):
+    names = [Name("/picn/benchmark/data/c" + str(i)) for i in range(args.packets)]
+    payload = b"x" * args.size
+    interests = [Interest(name) for name in names]
+    contents = [Content(name, payload) for name in names]
+    print("{:<16}{:>16}{:>16}".format("", "NdnTlvEncoder", "fast encoder"))
+    print("{:<16}{:>16.0f}{:>16.0f}".format("interests/s", encode_rate(NdnTlvEncoder(), interests),
+                                            encode_rate(NdnTlvFastEncoder(), interests)))
+    print("{:<16}{:>16.0f}{:>16.0f}".format("contents/s", encode_rate(NdnTlvEncoder(), contents),
+                                            encode_rate(NdnTlvFastEncoder(), contents)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='PiCN Encoder Benchmark')
+    parser.add_argument('-n', '--packets', type=int, default=20000, help="number of packets (default: 20000)")
+    parser.add_argument('-s', '--size', type=int, default=4096, help="payload size of content objects (default: 4096)")
+    args = parser.parse_args()
+    main(args)
@@ -0,0 +1,96 @@
+"""Benchmark: cost of forwarding content objects through a relay forwarder
+
+  * relay rtt: a consumer sends interests through an ICN forwarder (NDN-TLV) to a producer socket, which answers each
+    interest with a content object of a given size. Each interest has a new name, so every packet is handled by link,
+    packet encoding and ICN layer of the forwarder in both directions.
+  * per packet CPU time the packet encoding layer and the queues to and from the ICN layer spend on a forwarded
+    content object (decode, pickle to the ICN layer and back, encode)
+
+Run: python3 -m PiCN.Benchmarks.ForwardingBenchmark
+"""
+
+import argparse
+import pickle
+import socket
+import statistics
+import time
+
+from PiCN.Layers.LinkLayer.Interfaces import AddressInfo
+from PiCN.Layers.PacketEncodingLayer.Encoder import NdnTlvEncoder
+from PiCN.Packets import Content, Interest, Name
+from PiCN.ProgramLibs.ICNForwarder import ICNForwarder
+
+
+def relay_rtt(packets: int, size: int, in_process: bool=False, single_process: bool=False) -> float:
+    """send interests through a relay forwarder to a producer
+    :param packets: number of interests to send, one after another
+    :param size: payload size of the content objects
+    :param in_process: start the forwarder with data structs living in the layer processes
+    :param single_process: run all layers of the forwarder in a single process
+    :return: median round trip time in microseconds
+    """
+    encoder = NdnTlvEncoder()
+    producer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    producer.bind(("127.0.0.1", 0))
+    producer.settimeout(5)
+    consumer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    consumer.bind(("127.0.0.1", 0))
+    consumer.settimeout(5)
+    forwarder = ICNForwarder(0, encoder=NdnTlvEncoder(), log_level=255, in_process_data_structs=in_process,
+                             single_process=single_process)
+    port = forwarder.linklayer.interfaces[0].get_port()
+    face_id = forwarder.linklayer.faceidtable.get_or_create_faceid(AddressInfo(producer.getsockname(), 0))
+    forwarder.icnlayer.fib.add_fib_entry(Name("/bench"), face_id, static=True)
+    names = [Name("/bench/data/" + str(i)) for i in range(packets)]
+    interests = [encoder.encode(Interest(name)) for name in names]
+    contents = [encoder.encode(Content(name, b"x" * size)) for name in names]
+    forwarder.start_forwarder()
+    rtts = []
+    try:
+        for i in range(packets):
+            start = time.perf_counter()
+            consumer.sendto(interests[i], ("127.0.0.1", port))
+            producer.recvfrom(65535)
+            producer.sendto(contents[i], ("127.0.0.1", port))
+            consumer.recvfrom(65535)
+            rtts.append(time.perf_counter() - start)
+    finally:
+        consumer.close()
+        producer.close()
+        forwarder.stop_forwarder()
+    return statistics.median(rtts) * 1e6
+
+
+def encoding_path_cost(packets: int, size: int) -> float:
+    """decode content objects, pass them to the ICN layer and back and encode them, as done for forwarded packets
+    :param packets: number of content objects
+    :param size: payload size of the content objects
+    :return: mean time per content object in microseconds
+    """
+    encoder = NdnTlvEncoder()
+    wire_packets = [encoder.encode(Content(Name("/bench/data/" + str(i)), b"x" * size)) for i in range(packets)]
+    start = time.perf_counter()
+    for wire_packet in wire_packets:
+        packet = encoder.decode(wire_packet)
+        packet = pickle.loads(pickle.dumps([1, packet]))[1]
+        packet = pickle.loads(pickle.dumps([1, packet]))[1]
+        encoder.encode(packet)
+    return (time.perf_counter() - start) / packets * 1e6
+
+
+def main(args):
+    print("{:<24}{:>24}{:>24}".format("payload size [bytes]", "encoding path [us]", "relay rtt [us]"))
+    for size in args.sizes:
+        print("{:<24}{:>24.1f}{:>24.1f}".format(size, encoding_path_cost(args.packets, size),
+                                                relay_rtt(args.interests, size)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='PiCN Forwarding Benchmark')
+    parser.add_argument('-n', '--packets', type=int, default=5000, help="number of packets for the encoding path "
+                                                                       "(default: 5000)")
+    parser.add_argument('-i', '--interests', type=int, default=500, help="number of interests (default: 500)")
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=[100, 1024, 8000],
+                        help="payload sizes of the content objects (default: 100 1024 8000)")
+    args = parser.parse_args()
+    main(args)
@@ -0,0 +1,60 @@
+"""Benchmark: throughput of a LayerStack with and without batched queues between the layers
+
+Pushes packets through a stack of layers passing all data on to the next layer, once with a batch size of one (each
+wakeup of a layer handles a single packet) and once with larger batch sizes (see QueueBatch).
+
+Run: python3 -m PiCN.Benchmarks.LayerStackBenchmark
+"""
+
+import argparse
+import multiprocessing
+import time
+
+from PiCN.LayerStack import LayerStack
+from PiCN.Processes import LayerProcess
+
+
+class PassThroughLayer(LayerProcess):
+    """Layer passing all data on to the next layer"""
+
+    def data_from_lower(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue, data):
+        to_higher.put(data)
+
+    def data_from_higher(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue, data):
+        to_lower.put(data)
+
+
+def stack_throughput(batch_size: int, layers: int, packets: int) -> float:
+    """send packets from the bottom to the top of a layer stack
+    :param batch_size: batch size of the layer stack
+    :param layers: number of layers in the stack
+    :param packets: number of packets to send
+    :return: packets per second
+    """
+    lstack = LayerStack([PassThroughLayer() for i in range(layers)], batch_size=batch_size)
+    lstack.start_all()
+    try:
+        start = time.perf_counter()
+        for i in range(packets):
+            lstack.queue_from_lower.put([1, "packet" + str(i)])
+        for i in range(packets):
+            lstack.queue_to_higher.get(timeout=30)
+        return packets / (time.perf_counter() - start)
+    finally:
+        lstack.stop_all()
+        lstack.close_all()
+
+
+def main(args):
+    print("{:<16}{:>16}".format("batch size", "packets/s"))
+    for batch_size in args.batch_sizes:
+        print("{:<16}{:>16.0f}".format(batch_size, stack_throughput(batch_size, args.layers, args.packets)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='PiCN LayerStack Benchmark')
+    parser.add_argument('-n', '--packets', type=int, default=20000, help="number of packets (default: 20000)")
+    parser.add_argument('-l', '--layers', type=int, default=3, help="number of layers (default: 3)")
+    parser.add_argument('-b', '--batch-sizes', type=int, nargs='+', default=[1, 8, 32], help="batch sizes (default: 1 8 32)")
+    args = parser.parse_args()
+    main(args)
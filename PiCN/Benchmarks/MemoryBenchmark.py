@@ -0,0 +1,56 @@
+"""Benchmark: memory used per packet and per entry of the forwarder data structs
+
+Measures the memory allocated for names, packets and the entries of CS, PIT and FIB, as held by a forwarder caching
+many content objects and keeping many interests pending.
+
+Run: python3 -m PiCN.Benchmarks.MemoryBenchmark
+"""
+
+import argparse
+import tracemalloc
+
+from PiCN.Layers.ICNLayer.ContentStore import ContentStoreEntry
+from PiCN.Layers.ICNLayer.ForwardingInformationBase import ForwardingInformationBaseEntry
+from PiCN.Layers.ICNLayer.PendingInterestTable import PendingInterestTableEntry
+from PiCN.Packets import Content, Interest, Name
+
+
+def bytes_per_object(create, count: int) -> float:
+    """allocate objects and measure the memory they use
+    :param create: function creating an object from its index
+    :param count: number of objects to create
+    :return: mean number of bytes allocated per object
+    """
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    objects = [create(i) for i in range(count)]
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del objects
+    return size / count
+
+
+def main(args):
+    prefix = "/picn/benchmark/data/c"
+    payload = b"x" * args.size
+    objects = [
+        ("Name", lambda i: Name(prefix + str(i))),
+        ("Interest", lambda i: Interest(Name(prefix + str(i)))),
+        ("Content", lambda i: Content(Name(prefix + str(i)), payload)),
+        ("ContentStoreEntry", lambda i: ContentStoreEntry(Content(Name(prefix + str(i)), payload))),
+        ("PendingInterestTableEntry", lambda i: PendingInterestTableEntry(Name(prefix + str(i)), 1,
+                                                                          Interest(Name(prefix + str(i))))),
+        ("ForwardingInformationBaseEntry", lambda i: ForwardingInformationBaseEntry(Name(prefix + str(i)), 1)),
+    ]
+    print("{:<32}{:>16}".format("object (incl. name/packets)", "bytes"))
+    for (description, create) in objects:
+        print("{:<32}{:>16.0f}".format(description, bytes_per_object(create, args.objects)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='PiCN Memory Benchmark')
+    parser.add_argument('-n', '--objects', type=int, default=20000, help="number of objects (default: 20000)")
+    parser.add_argument('-s', '--size', type=int, default=0, help="payload size of content objects, shared by all "
+                                                                   "content objects (default: 0)")
+    args = parser.parse_args()
+    main(args)
@@ -0,0 +1,98 @@
+"""Benchmark: NFN expressions/s tokenized and parsed by the DefaultNFNParser
+
+Creates network names of nested NFN expressions, as requested from an NFN forwarder: a function call on a prepended
+data name, with names, numbers, strings and inner calls as parameters. The expressions are tokenized by matching each
+Token char by char (the tokenizer before using a master regular expression) and by the DefaultNFNTokenizer, and the
+network names are converted and parsed with and without the parser cache. Each name is requested --repeat times, like
+retransmitted interests and computations requested by several consumers.
+
+Run: python3 -m PiCN.Benchmarks.NFNParserBenchmark
+"""
+
+import argparse
+import random
+import time
+
+from PiCN.Layers.NFNLayer.Parser import DefaultNFNParser, DefaultNFNTokenizer, TokenType
+from PiCN.Packets import Name
+
+
+def expression(rnd: random.Random, depth: int, i: int) -> str:
+    """create a nested call
+    :param rnd: random generator
+    :param depth: number of nested calls
+    :param i: number of the expression, used in names
+    :return: nfn string of the call, the innermost call gets the prepended name (_) as first parameter
+    """
+    params = []
+    for p in range(rnd.randint(1, 3)):
+        kind = rnd.randint(0, 3)
+        if kind == 0:
+            params.append("/picn/data/sensor" + str(i) + "/values" + str(p))
+        elif kind == 1:
+            params.append(str(rnd.randint(-1000, 1000)))
+        elif kind == 2:
+            params.append(str(rnd.randint(0, 1000)) + "." + str(rnd.randint(0, 99)))
+        else:
+            params.append('"param' + str(p) + '"')
+    if depth > 0:
+        params.insert(rnd.randint(0, len(params)), expression(rnd, depth - 1, i))
+    else:
+        params.insert(0, "_")
+    return "/picn/lib/func" + str(rnd.randint(0, 9)) + "(" + ",".join(params) + ")"
+
+
+def network_name(rnd: random.Random, depth: int, i: int) -> Name:
+    """create the network name of a nested call on a prepended data name"""
+    name = Name("/picn/data/sensor" + str(i))
+    name += expression(rnd, depth, i)
+    name += "NFN"
+    return name
+
+
+def tokenize_char_by_char(tokenizer: DefaultNFNTokenizer, input: str):
+    """tokenize by matching each Token char by char, using the longest match"""
+    res = []
+    while input != "":
+        token = max(map(lambda t: t.getToken(input), tokenizer._tokens), key=lambda t: len(t[1]))
+        if token[0] == TokenType.NONE:
+            return None
+        res.append(token)
+        input = input[len(token[1]):]
+    return res
+
+
+def rate(function, items: list) -> float:
+    """call a function for all items
+    :return: items per second
+    """
+    start = time.perf_counter()
+    for item in items:
+        function(item)
+    return len(items) / (time.perf_counter() - start)
+
+
+def main(args):
+    rnd = random.Random(0)
+    names = [network_name(rnd, args.depth, i) for i in range(args.names)]
+    requests = names * args.repeat
+    rnd.shuffle(requests)
+    tokenizer = DefaultNFNParser().tokenizer
+    strings = [DefaultNFNParser(cache_size=0).network_name_to_nfn_str(name)[0] for name in requests]
+    uncached = DefaultNFNParser(cache_size=0)
+    cached = DefaultNFNParser(cache_size=args.names)
+    print("{:<24}{:>16}".format("expressions/s", ""))
+    print("{:<24}{:>16.0f}".format("tokenize char by char", rate(lambda s: tokenize_char_by_char(tokenizer, s),
+                                                                   strings)))
+    print("{:<24}{:>16.0f}".format("tokenize master regex", rate(tokenizer.tokenize, strings)))
+    print("{:<24}{:>16.0f}".format("name to AST", rate(uncached.network_name_to_ast, requests)))
+    print("{:<24}{:>16.0f}".format("name to AST, cached", rate(cached.network_name_to_ast, requests)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='PiCN NFN Parser Benchmark')
+    parser.add_argument('-n', '--names', type=int, default=1000, help="number of different names (default: 1000)")
+    parser.add_argument('-r', '--repeat', type=int, default=5, help="requests per name (default: 5)")
+    parser.add_argument('-d', '--depth', type=int, default=3, help="depth of nested calls (default: 3)")
+    args = parser.parse_args()
+    main(args)
@@ -0,0 +1,65 @@
+"""Benchmark: operations per second of the persistent content stores
+
+Adds content objects to a ContentStorePersistentExact (shelve) and a ContentStorePersistentLog, looks them up, runs
+ageing (nothing expires) and reopens the content store.
+
+Run: python3 -m PiCN.Benchmarks.PersistentContentStoreBenchmark
+"""
+
+import argparse
+import glob
+import os
+import time
+
+from PiCN.Layers.ICNLayer.ContentStore import ContentStorePersistentExact, ContentStorePersistentLog
+from PiCN.Packets import Content, Name
+
+
+def measure(cs_class, entries: int, size: int) -> dict:
+    """measure the content store operations
+    :param cs_class: content store class, taking a db_path
+    :param entries: number of content objects
+    :param size: payload size of the content objects
+    :return: dict of operation to operations per second
+    """
+    cs = cs_class(cs_timeout=3600)
+    db_path = cs.get_db_path()
+    names = [Name("/picn/benchmark/data/c" + str(i)) for i in range(entries)]
+    payload = b"x" * size
+    results = {}
+    start = time.perf_counter()
+    for name in names:
+        cs.add_content_object(Content(name, payload))
+    results["add"] = entries / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for name in names:
+        cs.find_content_object(name)
+    results["find"] = entries / (time.perf_counter() - start)
+    start = time.perf_counter()
+    cs.ageing()
+    results["ageing"] = 1 / (time.perf_counter() - start)
+    cs.close_cs()
+    start = time.perf_counter()
+    cs = cs_class(db_path=db_path)
+    cs.find_content_object(names[0])
+    results["reopen"] = 1 / (time.perf_counter() - start)
+    cs.close_cs()
+    for path in glob.glob(db_path + "*"):
+        os.remove(path)
+    return results
+
+
+def main(args):
+    shelve_results = measure(ContentStorePersistentExact, args.entries, args.size)
+    log_results = measure(ContentStorePersistentLog, args.entries, args.size)
+    print("{:<16}{:>20}{:>20}".format("ops/s", "shelve", "log"))
+    for operation in ["add", "find", "ageing", "reopen"]:
+        print("{:<16}{:>20.1f}{:>20.1f}".format(operation, shelve_results[operation], log_results[operation]))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='PiCN Persistent Content Store Benchmark')
+    parser.add_argument('-n', '--entries', type=int, default=5000, help="number of content objects (default: 5000)")
+    parser.add_argument('-s', '--size', type=int, default=1024, help="payload size (default: 1024)")
+    args = parser.parse_args()
+    main(args)
@@ -0,0 +1,97 @@
+"""Benchmark: serving a file from a file system repository
+
+  * read and chunk: the SimpleFileSystemRepository reads the whole file, the chunk layer splits it into chunks and
+    metadata objects (SimpleContentChunkifyer), as done for the first interest for a file
+  * mmap: the MmapFileSystemRepository serves each metadata object and chunk of the file from a memory mapping
+
+For both the time until the first metadata object is available, the time until all chunks and metadata objects of the
+file were created, and the peak of the memory allocated meanwhile are measured.
+
+Run: python3 -m PiCN.Benchmarks.RepositoryBenchmark
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from PiCN.Layers.ChunkLayer.Chunkifyer import SimpleContentChunkifyer
+from PiCN.Layers.RepositoryLayer.Repository import MmapFileSystemRepository, SimpleFileSystemRepository
+from PiCN.Packets import Name
+
+
+def read_and_chunk(repository: SimpleFileSystemRepository, chunkifyer: SimpleContentChunkifyer, name: Name) -> int:
+    """read a file and chunk it
+    :return: number of chunks and metadata objects
+    """
+    metadata, chunks = chunkifyer.chunk_data(repository.get_content(name))
+    return len(metadata) + len(chunks)
+
+
+def serve_mapped(repository: MmapFileSystemRepository, chunkifyer: SimpleContentChunkifyer, name: Name,
+                 size: int) -> int:
+    """get each metadata object and each chunk of a file from the repository
+    :param size: file size, 0 to get the first metadata object only
+    :return: number of chunks and metadata objects
+    """
+    num_of_chunks = chunkifyer.num_of_chunks(size)
+    if size == 0:
+        return repository.get_content(name) is not None
+    count = 0
+    for i in range(chunkifyer.num_of_meta_data_objects(num_of_chunks)):
+        count += repository.get_content(name + ("m" + str(i)) if i > 0 else name) is not None
+    for i in range(num_of_chunks):
+        count += repository.get_content(name + ("c" + str(i))) is not None
+    return count
+
+
+def measure(serve) -> (float, float):
+    """
+    :return: time in milliseconds and peak memory allocated in MiB
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    serve()
+    duration = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return duration * 1e3, peak / (1 << 20)
+
+
+def main(args):
+    path = tempfile.mkdtemp()
+    manager = multiprocessing.Manager()
+    prefix = Name("/bench/repo")
+    chunkifyer = SimpleContentChunkifyer(args.chunk_size)
+    simple_repository = SimpleFileSystemRepository(path, prefix, manager)
+    mmap_repository = MmapFileSystemRepository(path, prefix, manager, chunk_size=args.chunk_size)
+    print("{:<16}{:>14}{:>14}{:>14}{:>14}{:>14}{:>14}".format("", "read+chunk", "", "", "mmap", "", ""))
+    print("{:<16}{:>14}{:>14}{:>14}{:>14}{:>14}{:>14}".format("file size [MiB]", "first [ms]", "all [ms]", "peak [MiB]",
+                                                              "first [ms]", "all [ms]", "peak [MiB]"))
+    try:
+        for size_mib in args.sizes:
+            size = int(size_mib * (1 << 20))
+            filename = "file" + str(size)
+            with open(os.path.join(path, filename), "wb") as f:
+                f.write(b"x" * size)
+            name = prefix + filename
+            simple = measure(lambda: read_and_chunk(simple_repository, chunkifyer, name))
+            mapped_first = measure(lambda: serve_mapped(mmap_repository, chunkifyer, name, 0))
+            mapped = measure(lambda: serve_mapped(mmap_repository, chunkifyer, name, size))
+            print("{:<16}{:>14.1f}{:>14.1f}{:>14.1f}{:>14.1f}{:>14.1f}{:>14.1f}".format(
+                size_mib, simple[0], *simple, mapped_first[0], *mapped))
+    finally:
+        mmap_repository.close()
+        shutil.rmtree(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='PiCN Repository Benchmark')
+    parser.add_argument('-c', '--chunk_size', type=int, default=4096, help="chunk size (default: 4096)")
+    parser.add_argument('-s', '--sizes', type=float, nargs='+', default=[1, 16, 64],
+                        help="file sizes in MiB (default: 1 16 64)")
+    args = parser.parse_args()
+    main(args)
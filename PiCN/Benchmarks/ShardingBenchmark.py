@@ -0,0 +1,78 @@
+"""Benchmark: throughput of an ICN forwarder and a sharded ICN forwarder relaying interests and content objects
+
+A consumer sends windows of interests for distinct names through the forwarder to a producer socket, which answers each
+interest with a content object. Throughput is measured in interest/content exchanges per second. Sharding only helps
+if the machine has a core per shard.
+
+Run: python3 -m PiCN.Benchmarks.ShardingBenchmark
+"""
+
+import argparse
+import os
+import socket
+import time
+
+from PiCN.Layers.LinkLayer.Interfaces import AddressInfo
+from PiCN.Layers.PacketEncodingLayer.Encoder import NdnTlvEncoder
+from PiCN.Packets import Content, Interest, Name
+from PiCN.ProgramLibs.ICNForwarder import ICNForwarder, ShardedICNForwarder
+
+
+def relay_throughput(shards: int, packets: int, window: int) -> float:
+    """send windows of interests through a relay forwarder to a producer
+    :param shards: number of shards, an ICNForwarder is used if 1
+    :param packets: number of interests
+    :param window: number of interests sent before waiting for the content objects
+    :return: exchanges per second
+    """
+    encoder = NdnTlvEncoder()
+    producer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    producer.bind(("127.0.0.1", 0))
+    producer.settimeout(5)
+    consumer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    consumer.bind(("127.0.0.1", 0))
+    consumer.settimeout(5)
+    if shards > 1:
+        forwarder = ShardedICNForwarder(0, encoder=NdnTlvEncoder(), shards=shards, in_process_data_structs=True)
+        fib = forwarder.fib
+    else:
+        forwarder = ICNForwarder(0, encoder=NdnTlvEncoder(), in_process_data_structs=True)
+        fib = forwarder.icnlayer.fib
+    port = forwarder.linklayer.interfaces[0].get_port()
+    face_id = forwarder.linklayer.faceidtable.get_or_create_faceid(AddressInfo(producer.getsockname(), 0))
+    fib.add_fib_entry(Name("/bench"), face_id, static=True)
+    forwarder.start_forwarder()
+    interests = [encoder.encode(Interest(Name("/bench/data/" + str(i)))) for i in range(packets)]
+    try:
+        start = time.perf_counter()
+        for i in range(0, packets // window * window, window):
+            for interest in interests[i:i + window]:
+                consumer.sendto(interest, ("127.0.0.1", port))
+            for j in range(window):
+                wire_packet, addr = producer.recvfrom(8192)
+                producer.sendto(encoder.encode(Content(encoder.decode(wire_packet).name, b"x" * 100)), addr)
+            for j in range(window):
+                consumer.recvfrom(8192)
+        duration = time.perf_counter() - start
+    finally:
+        consumer.close()
+        producer.close()
+        forwarder.stop_forwarder()
+    return packets // window * window / duration
+
+
+def main(args):
+    print("cores: {}".format(os.cpu_count()))
+    print("{:<16}{:>24}".format("shards", "exchanges/s"))
+    for shards in args.shards:
+        print("{:<16}{:>24.0f}".format(shards, relay_throughput(shards, args.packets, args.window)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='PiCN Sharding Benchmark')
+    parser.add_argument('-n', '--packets', type=int, default=2000, help="number of interests (default: 2000)")
+    parser.add_argument('-w', '--window', type=int, default=20, help="interests per window (default: 20)")
+    parser.add_argument('-s', '--shards', type=int, nargs='+', default=[1, 2, 4],
+                        help="numbers of shards (default: 1 2 4)")
+    args = parser.parse_args()
+    main(args)
@@ -0,0 +1,101 @@
+"""Benchmark: loopback throughput of the UDP4Interface and the BatchUDP4Interface
+
+  * interface: a socket sends bursts of datagrams to an interface, which receives them one by one (receive) or drains
+    the socket (receive_batch)
+  * link layer: a socket sends bursts of datagrams to a link layer process, which hands them to the queue to the higher
+    layer. The burst size is limited so the socket buffer does not overflow.
+
+Run: python3 -m PiCN.Benchmarks.UDPBenchmark
+"""
+
+import argparse
+import multiprocessing
+import socket
+import time
+
+from PiCN.Layers.LinkLayer import BasicLinkLayer
+from PiCN.Layers.LinkLayer.FaceIDTable import FaceIDDict
+from PiCN.Layers.LinkLayer.Interfaces import BaseInterface, BatchUDP4Interface, UDP4Interface
+from PiCN.Processes.QueueBatch import QueueBatch
+
+
+def interface_throughput(interface: BaseInterface, batched: bool, packets: int, burst: int, size: int) -> float:
+    """send bursts of datagrams to an interface and receive them
+    :param interface: interface receiving the datagrams
+    :param batched: receive with receive_batch instead of receive
+    :param packets: number of datagrams
+    :param burst: number of datagrams sent before receiving
+    :param size: size of the datagrams
+    :return: datagrams per second
+    """
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    addr = ("127.0.0.1", interface.get_port())
+    data = b"x" * size
+    start = time.perf_counter()
+    for i in range(packets // burst):
+        for j in range(burst):
+            sender.sendto(data, addr)
+        received = 0
+        while received < burst:
+            if batched:
+                received += len(interface.receive_batch())
+            else:
+                interface.receive()
+                received += 1
+    duration = time.perf_counter() - start
+    sender.close()
+    interface.close()
+    return packets // burst * burst / duration
+
+
+def linklayer_throughput(interface: BaseInterface, batch_size: int, packets: int, burst: int, size: int) -> float:
+    """send bursts of datagrams to a link layer process
+    :param interface: interface of the link layer
+    :param batch_size: batch size of the link layer (see LayerProcess.batch_size)
+    :param packets: number of datagrams
+    :param burst: number of datagrams sent before waiting for them in the queue to the higher layer
+    :param size: size of the datagrams
+    :return: datagrams per second
+    """
+    linklayer = BasicLinkLayer([interface], FaceIDDict(), log_level=255)
+    linklayer.queue_to_higher = multiprocessing.Queue()
+    linklayer.queue_from_higher = multiprocessing.Queue()
+    linklayer.batch_size = batch_size
+    linklayer.batch_to_higher = batch_size > 1
+    linklayer.start_process()
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    addr = ("127.0.0.1", interface.get_port())
+    data = b"x" * size
+    try:
+        start = time.perf_counter()
+        for i in range(packets // burst):
+            for j in range(burst):
+                sender.sendto(data, addr)
+            received = 0
+            while received < burst:
+                item = linklayer.queue_to_higher.get(timeout=5)
+                received += len(item) if type(item) is QueueBatch else 1
+        duration = time.perf_counter() - start
+    finally:
+        sender.close()
+        linklayer.stop_process()
+    return packets // burst * burst / duration
+
+
+def main(args):
+    print("{:<28}{:>16}{:>16}".format("datagrams/s", "UDP4Interface", "batched"))
+    print("{:<28}{:>16.0f}{:>16.0f}".format(
+        "interface", interface_throughput(UDP4Interface(0), False, args.packets, args.burst, args.size),
+        interface_throughput(BatchUDP4Interface(0), True, args.packets, args.burst, args.size)))
+    print("{:<28}{:>16.0f}{:>16.0f}".format(
+        "link layer", linklayer_throughput(UDP4Interface(0), 1, args.packets, args.burst, args.size),
+        linklayer_throughput(BatchUDP4Interface(0), args.burst, args.packets, args.burst, args.size)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='PiCN UDP Benchmark')
+    parser.add_argument('-n', '--packets', type=int, default=50000, help="number of datagrams (default: 50000)")
+    parser.add_argument('-b', '--burst', type=int, default=64, help="datagrams per burst (default: 64)")
+    parser.add_argument('-s', '--size', type=int, default=1024, help="size of the datagrams (default: 1024)")
+    args = parser.parse_args()
+    main(args)
@@ -0,0 +1 @@
+"""Package that contains runnable benchmarks of PiCN components"""
@@ -12,7 +12,6 @@ from PiCN.Layers.PacketEncodingLayer.Encoder import SimpleStringEncoder
 
 def main(args):
     name = Name(args.name)
-    name.format = args.format
 
     encoder = NdnTlvEncoder() if args.format == 'ndntlv' else SimpleStringEncoder
     fetchTool = Fetch(args.ip, args.port, encoder=encoder, autoconfig=args.autoconfig)
@@ -33,7 +33,17 @@ def main(args):
     encoder = NdnTlvEncoder(log_level) if args.format == 'ndntlv' else SimpleStringEncoder
 
     # Start
-    forwarder = PiCN.ProgramLibs.ICNForwarder.ICNForwarder(args.port, log_level, encoder, autoconfig=args.autoconfig)
+    if args.shards > 1:
+        forwarder = PiCN.ProgramLibs.ICNForwarder.ShardedICNForwarder(args.port, log_level, encoder,
+                                                                       shards=args.shards,
+                                                                       in_process_data_structs=
+                                                                       args.in_process_data_structs)
+    else:
+        forwarder = PiCN.ProgramLibs.ICNForwarder.ICNForwarder(args.port, log_level, encoder,
+                                                                 autoconfig=args.autoconfig,
+                                                                 in_process_data_structs=args.in_process_data_structs,
+                                                                 single_process=args.single_process,
+                                                                 queue_batch_size=args.queue_batch_size)
     forwarder.start_forwarder()
     forwarder.linklayer.process.join()
 
@@ -43,6 +53,10 @@ if __name__ == "__main__":
     parser.add_argument('-p', '--port', type=int, default=9000, help="UDP port (default: 9000)")
     parser.add_argument('-f', '--format', choices=['ndntlv','simple'], type=str, default='ndntlv', help='Packet Format (default: ndntlv)')
     parser.add_argument('-a', '--autoconfig', action='store_true', help='Enable autoconfig server')
+    parser.add_argument('--in-process-data-structs', action='store_true', help='Keep CS, FIB and PIT in the ICN layer process instead of a manager process')
+    parser.add_argument('--single-process', action='store_true', help='Run all layers in a single process')
+    parser.add_argument('--queue-batch-size', type=int, default=1, help='Maximum number of packets a layer handles and the link layer receives per wakeup (default: 1)')
+    parser.add_argument('--shards', type=int, default=1, help='Number of ICN layers running in parallel, each with its own CS, PIT and FIB (default: 1)')
     parser.add_argument('-l', '--logging', choices=['debug','info', 'warning', 'error', 'none'], type=str, default='info', help='Logging Level (default: info)')
     args = parser.parse_args()
     main(args)
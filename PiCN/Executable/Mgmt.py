@@ -34,6 +34,12 @@ def main(args, help_string):
         except ConnectionRefusedError:
             print("Connection Refused. Repo not running?")
 
+    elif args.command == "getcsstatistics":
+        try:
+            data = mgmt_client.get_cs_statistics()
+        except ConnectionRefusedError:
+            print("Connection Refused. Forwarder not running?")
+
     elif args.command == "newface":
         try:
             resolved_hostname = socket.gethostbyname(args.parameters.split(":")[0])
@@ -70,7 +76,7 @@ if __name__ == "__main__":
     parser.add_argument('-i', '--ip', type=str, default='127.0.0.1',
                             help="IP address or hostname of forwarder (default: 127.0.0.1)")
     parser.add_argument('-p', '--port', type=int, default=9000, help="UDP port of forwarder(default: 9000)")
-    parser.add_argument('command', type=str, choices = ['shutdown', 'getrepoprefix', 'getrepopath', 'newface', 'newforwardingrule', 'newcontent'], help="Management Command")
+    parser.add_argument('command', type=str, choices = ['shutdown', 'getrepoprefix', 'getrepopath', 'getcsstatistics', 'newface', 'newforwardingrule', 'newcontent'], help="Management Command")
     parser.add_argument('parameters', type=str, nargs='?', help="Command Parameter")
     args = parser.parse_args()
     help_string = parser.format_help()
@@ -80,6 +86,7 @@ if __name__ == "__main__":
 # print("\t\tshutdown")
 # print("\t\tgetrepopath")
 # print("\t\tgetrepoprefix")
+# print("\t\tgetcsstatistics")
 # print("\t\tnewface ip:port")
 # print("\t\tnewforwardingrule prefix:face")
 # print("\t\tnewcontent name:content")
\ No newline at end of file
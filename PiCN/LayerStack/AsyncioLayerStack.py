@@ -0,0 +1,55 @@
+"""Layer stack running all LayerProcesses in a single process on an asyncio event loop"""
+
+import asyncio
+import multiprocessing
+from typing import List
+
+from PiCN.LayerStack.LayerStack import LayerStack
+from PiCN.Processes import LayerProcess, InMemoryQueue
+
+
+class AsyncioLayerStack(LayerStack):
+    """
+    Layer stack running all layers in a single process on an asyncio event loop, instead of one process per layer.
+    Layers are connected by InMemoryQueues, so packets are handed to data_from_lower/data_from_higher of the next layer
+    without pickling. The queues on top and at the bottom of the stack are multiprocessing queues as in a LayerStack.
+    Requires an event loop supporting add_reader (not available on Windows).
+    """
+
+    def __init__(self, layers: List[LayerProcess]):
+        """
+        Create a layer stack from a list of layers, where the topmost layer is the first element in the list.
+        :param layers: List of layers to stack onto each other.
+        """
+        self.process: multiprocessing.Process = None
+        super().__init__(layers)
+
+    def start_all(self):
+        """
+        Start a single process running all layers managed by the LayerStack.
+        """
+        self._started = True
+        for layer in self.layers:
+            for data_struct in layer._data_structs:
+                data_struct.start_owner()
+        self.process = multiprocessing.Process(target=self._run)
+        self.process.daemon = True
+        self.process.start()
+        for layer in self.layers:
+            layer.process = self.process
+        for layer in self.layers:
+            layer.on_start()
+
+    def _run(self):
+        """
+        Register all layers with a new event loop and run it
+        """
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        for layer in self.layers:
+            layer._run_asyncio(loop, layer.queue_from_lower, layer.queue_from_higher, layer.queue_to_lower,
+                               layer.queue_to_higher)
+        loop.run_forever()
+
+    def _create_queue(self):
+        return InMemoryQueue()
@@ -11,18 +11,22 @@ class LayerStack(object):
     Data structure for managing LayerProcesses and their queues
     """
 
-    def __init__(self, layers: List[LayerProcess]):
+    def __init__(self, layers: List[LayerProcess], batch_size: int=1):
         """
         Create a layer stack from a list of layers, where the topmost layer is the first element in the list.
         :param layers: List of layers to stack onto each other.
+        :param batch_size: Maximum number of items a layer drains from a queue in one wakeup. If larger than one, data
+                           a layer sends to its neighbours within the stack while handling a wakeup is put into the
+                           queue as a single QueueBatch.
         """
+        self.batch_size: int = batch_size
         self.layers: List[LayerProcess] = []
         self.queues: List[multiprocessing.Queue] = []
         self._queue_to_higher = multiprocessing.Queue()
         self._queue_from_higher = multiprocessing.Queue()
         self._queue_to_lower = multiprocessing.Queue()
         self._queue_from_lower = multiprocessing.Queue()
-        self.__started = False
+        self._started = False
         if len(layers) == 0:
             raise ValueError('Can\'t have an empty LayerStack')
         # Setup queues for each pair of layers
@@ -30,8 +34,8 @@ class LayerStack(object):
             upper = layers[i]
             lower = layers[i + 1]
             # Create two queues for communication
-            q_to_upper = multiprocessing.Queue()
-            q_to_lower = multiprocessing.Queue()
+            q_to_upper = self._create_queue()
+            q_to_lower = self._create_queue()
             upper.queue_to_lower = q_to_lower
             upper.queue_from_lower = q_to_upper
             lower.queue_to_higher = q_to_upper
@@ -60,7 +64,7 @@ class LayerStack(object):
         :raises TypeError if the layer to insert is None, or on_top_of and below_of are used together.
         :raises ValueError if on_top_of/below_of is not a layer in this LayerStack.
         """
-        if self.__started:
+        if self._started:
             raise multiprocessing.ProcessError('LayerStack should not be changed after its processes were started.')
         if layer is None:
             raise TypeError('Layer is None.')
@@ -96,7 +100,8 @@ class LayerStack(object):
         """
         Utility function to start all LayerProcesses managed by the LayerStack.
         """
-        self.__started = True
+        self._started = True
+        self._configure_batching()
         [l.start_process() for l in self.layers]
 
     def stop_all(self):
@@ -111,7 +116,7 @@ class LayerStack(object):
 
     @queue_to_higher.setter
     def queue_to_higher(self, queue: multiprocessing.Queue):
-        if self.__started:
+        if self._started:
             raise multiprocessing.ProcessError('LayerStack should not be changed after its processes were started.')
         self.queue_to_higher = queue
         self.layers[0].queue_to_higher = queue
@@ -122,7 +127,7 @@ class LayerStack(object):
 
     @queue_from_higher.setter
     def queue_from_higher(self, queue: multiprocessing.Queue):
-        if self.__started:
+        if self._started:
             raise multiprocessing.ProcessError('LayerStack should not be changed after its processes were started.')
         self.queue_from_higher = queue
         self.layers[0].queue_from_higher = queue
@@ -133,7 +138,7 @@ class LayerStack(object):
 
     @queue_to_lower.setter
     def queue_to_lower(self, queue: multiprocessing.Queue):
-        if self.__started:
+        if self._started:
             raise multiprocessing.ProcessError('LayerStack should not be changed after its processes were started.')
         self.queue_to_lower = queue
         self.layers[len(self.layers)-1].queue_to_lower = queue
@@ -144,11 +149,27 @@ class LayerStack(object):
 
     @queue_from_lower.setter
     def queue_from_lower(self, queue: multiprocessing.Queue):
-        if self.__started:
+        if self._started:
             raise multiprocessing.ProcessError('LayerStack should not be changed after its processes were started.')
         self.queue_from_lower = queue
         self.layers[len(self.layers)-1].queue_from_lower = queue
 
+    def _configure_batching(self):
+        """
+        Pass the batch size to all layers. Only the queues within the stack carry QueueBatches, data put into the queues
+        on top and at the bottom of the stack is never batched.
+        """
+        for i, layer in enumerate(self.layers):
+            layer.batch_size = self.batch_size
+            layer.batch_to_lower = self.batch_size > 1 and i < len(self.layers) - 1
+            layer.batch_to_higher = self.batch_size > 1 and i > 0
+
+    def _create_queue(self):
+        """
+        Create a queue between two layers of the stack.
+        """
+        return multiprocessing.Queue()
+
     def __insert(self, layer: LayerProcess, at: int):
         # Get the layers between which to insert the new layer
         layer_above = self.layers[at - 1] if at > 0 else None
@@ -160,7 +181,7 @@ class LayerStack(object):
             queues.append(layer_above.queue_from_lower)
         # Create two new queues needed for connecting the new layer to the stack.
         for x in range(2):
-            q = multiprocessing.Queue()
+            q = self._create_queue()
             self.queues.append(q)
             queues.append(q)
         # Set up queues to the layer above
@@ -1,2 +1,2 @@
-
 from .LayerStack import LayerStack
+from .AsyncioLayerStack import AsyncioLayerStack
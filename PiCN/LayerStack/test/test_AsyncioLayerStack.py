@@ -0,0 +1,68 @@
+import os
+import unittest
+
+from multiprocessing import Queue
+
+from PiCN.LayerStack import AsyncioLayerStack
+from PiCN.Processes import LayerProcess, InMemoryQueue
+
+
+class PidLayerMock(LayerProcess):
+    """ Mock implementation of a LayerProcess, which appends the pid of its process to all data """
+
+    def data_from_lower(self, to_lower: Queue, to_higher: Queue, data):
+        to_higher.put(data + [os.getpid()])
+
+    def data_from_higher(self, to_lower: Queue, to_higher: Queue, data):
+        to_lower.put(data + [os.getpid()])
+
+
+class test_AsyncioLayerStack(unittest.TestCase):
+
+    def setUp(self):
+        self.toplayer = PidLayerMock()
+        self.middlelayer = PidLayerMock()
+        self.bottomlayer = PidLayerMock()
+        self.lstack = AsyncioLayerStack([
+            self.toplayer,
+            self.middlelayer,
+            self.bottomlayer
+        ])
+
+    def tearDown(self):
+        self.lstack.stop_all()
+        self.lstack.close_all()
+
+    def test_create(self):
+        self.assertEqual(3, len(self.lstack.layers))
+        self.assertEqual(4, len(self.lstack.queues))
+        self.assertIsInstance(self.toplayer.queue_to_lower, InMemoryQueue)
+        self.assertEqual(self.toplayer.queue_to_lower, self.middlelayer.queue_from_higher)
+        self.assertNotIsInstance(self.lstack.queue_to_higher, InMemoryQueue)
+        self.assertNotIsInstance(self.lstack.queue_from_lower, InMemoryQueue)
+
+    def test_insert(self):
+        newlayer = PidLayerMock()
+        self.lstack.insert(newlayer, below_of=self.toplayer)
+        self.assertEqual(6, len(self.lstack.queues))
+        self.assertIsInstance(newlayer.queue_to_lower, InMemoryQueue)
+        self.assertEqual(newlayer.queue_to_lower, self.middlelayer.queue_from_higher)
+
+    def test_single_process(self):
+        """Test that data passes all layers in a single process"""
+        self.lstack.start_all()
+        self.assertEqual(self.toplayer.process, self.bottomlayer.process)
+        self.lstack.queue_from_higher.put(["down"])
+        data = self.lstack.queue_to_lower.get(timeout=5)
+        self.assertEqual(data[0], "down")
+        self.assertEqual(data[1:], [self.lstack.process.pid] * 3)
+        self.lstack.queue_from_lower.put(["up"])
+        data = self.lstack.queue_to_higher.get(timeout=5)
+        self.assertEqual(data, ["up"] + [self.lstack.process.pid] * 3)
+
+    def test_put_from_other_process(self):
+        """Test that data put into a queue between two layers by another process is handled"""
+        self.lstack.start_all()
+        self.toplayer.queue_to_lower.put(["timer"])
+        data = self.lstack.queue_to_lower.get(timeout=5)
+        self.assertEqual(data, ["timer"] + [self.lstack.process.pid] * 2)
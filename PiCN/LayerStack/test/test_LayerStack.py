@@ -82,6 +82,24 @@ class test_LayerStack(unittest.TestCase):
         self.assertNotEqual(toplayer.queue_to_lower, bottomlayer.queue_from_higher)
         self.assertNotEqual(toplayer.queue_from_lower, bottomlayer.queue_to_higher)
 
+    def test_configure_batching(self):
+        toplayer: LayerProcess = BasicPacketEncodingLayer()
+        middlelayer: LayerProcess = BasicPacketEncodingLayer()
+        bottomlayer: LayerProcess = BasicPacketEncodingLayer()
+        lstack: LayerStack = LayerStack([toplayer, middlelayer, bottomlayer], batch_size=16)
+        lstack._configure_batching()
+        self.assertEqual([16, 16, 16], [l.batch_size for l in lstack.layers])
+        self.assertEqual([True, True, False], [l.batch_to_lower for l in lstack.layers])
+        self.assertEqual([False, True, True], [l.batch_to_higher for l in lstack.layers])
+
+    def test_configure_no_batching(self):
+        toplayer: LayerProcess = BasicPacketEncodingLayer()
+        bottomlayer: LayerProcess = BasicPacketEncodingLayer()
+        lstack: LayerStack = LayerStack([toplayer, bottomlayer])
+        lstack._configure_batching()
+        self.assertEqual([1, 1], [l.batch_size for l in lstack.layers])
+        self.assertFalse(any(l.batch_to_lower or l.batch_to_higher for l in lstack.layers))
+
 
 if __name__ == '__main__':
     unittest.main()
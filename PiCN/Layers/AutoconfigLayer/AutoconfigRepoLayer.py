@@ -40,8 +40,7 @@ class AutoconfigRepoLayer(LayerProcess):
                 if interface.get_broadcast_address() is not None and interface.enable_broadcast():
                     self._bc_interfaces.append(i)
 
-    def start_process(self):
-        super().start_process()
+    def on_start(self):
         self.logger.info('Soliciting forwarders')
         forwarders_interest = Interest(_AUTOCONFIG_FORWARDERS_PREFIX)
         for i in self._bc_interfaces:
@@ -52,8 +51,7 @@ class AutoconfigRepoLayer(LayerProcess):
                 autoconf_fid = self._linklayer.faceidtable.get_or_create_faceid(addr_info,)
                 self.queue_to_lower.put([autoconf_fid, forwarders_interest])
 
-    def stop_process(self):
-        super().stop_process()
+    def on_stop(self):
         for timer in self._prefix_timers.values():
             timer.cancel()
         self._prefix_timers.clear()
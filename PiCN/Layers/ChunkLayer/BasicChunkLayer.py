@@ -2,34 +2,31 @@
 
 import multiprocessing
 import time
+from collections import OrderedDict
 from typing import Dict, List
 
 from PiCN.Layers.ChunkLayer.Chunkifyer import BaseChunkifyer, SimpleContentChunkifyer
-from PiCN.Packets import Content, Interest, Name, Nack
-from PiCN.Processes import LayerProcess
+from PiCN.Layers.ChunkLayer.FetchWindow import FetchWindow
+from PiCN.Layers.ChunkLayer.RequestTable import RequestTable, RequestTableEntry
+from PiCN.Packets import Content, Interest, Name, Nack, NackReason
+from PiCN.Processes import LayerProcess, PiCNLocalDataStruct
 
 
-class RequestTableEntry(object):
-    """Request table for Pending chunks"""
-
-    def __init__(self, name: Name):
-        self.name: Name = name
-        self.requested_chunks = []
-        self.chunks =[]
-        self.requested_md = []
-        self.chunked = False
-        self.lastchunk:Name
-
-    def __eq__(self, other):
-        return self.name == other.name
-
 class BasicChunkLayer(LayerProcess):
-    """"Basic Chunking Layer for PICN"""
+    """"Basic Chunking Layer for PICN
+    :param stream: pass chunked content objects to the higher layer while they are reassembled, as
+                   [faceid, Content, complete] for each part reassembled in order. complete is True for the last part.
+    """
 
     def __init__(self, chunkifyer: BaseChunkifyer=None, chunk_size: int=4096, manager: multiprocessing.Manager=None,
-                 log_level=255):
+                 log_level=255, initial_window: int=8, max_retransmissions: int=5, timer_interval: float=0.1,
+                 stream: bool=False):
         super().__init__("ChunkLayer", log_level=log_level)
         self.chunk_size = chunk_size
+        self.stream = stream
+        self.initial_window = initial_window
+        self.max_retransmissions = max_retransmissions
+        self.timer_interval = timer_interval
         if chunkifyer == None:
             self.chunkifyer = SimpleContentChunkifyer(chunk_size)
         else:
@@ -37,7 +34,8 @@ class BasicChunkLayer(LayerProcess):
         if manager is None:
             manager = multiprocessing.Manager()
         self._chunk_table: Dict[Name, (Content, float)] = manager.dict()
-        self._request_table: List[RequestTableEntry] = manager.list()
+        self._request_table: RequestTable = PiCNLocalDataStruct(RequestTable())
+        self.serve_data_struct(self._request_table)
 
     def data_from_higher(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue, data):
         self.logger.info("Got Data from higher")
@@ -47,13 +45,14 @@ class BasicChunkLayer(LayerProcess):
             self.logger.info("Packet is Interest " + str(packet.name))
             requestentry = self.get_request_table_entry(packet.name)
             if requestentry is None:
-                self._request_table.append(RequestTableEntry(packet.name))
+                window = FetchWindow(self.initial_window, max_retransmissions=self.max_retransmissions)
+                self._request_table.append(RequestTableEntry(packet.name, window))
             to_lower.put([faceid, packet])
             return
         if isinstance(packet, Content):
             self.logger.info("Packet is Content (name=%s, %d bytes)" % \
-                                      (str(packet.name), len(packet.content)))
-            if len(packet.content) < self.chunk_size:
+                                      (str(packet.name), len(packet.get_view())))
+            if len(packet.get_view()) < self.chunk_size:
                 to_lower.put([faceid, packet])
             else:
                 self.logger.info("Chunking Packet")
@@ -89,20 +88,27 @@ class BasicChunkLayer(LayerProcess):
             request_table_entry = self.get_request_table_entry(packet.name)
             if request_table_entry is None:
                 return
-            self._request_table.remove(request_table_entry)
             if request_table_entry.chunked is False: #not chunked content
                 if not packet.get_bytes().startswith(b'mdo:'):
-                    to_higher.put([faceid, packet])
+                    self._request_table.remove(request_table_entry)
+                    to_higher.put([faceid, packet, True] if self.stream else [faceid, packet])
                     return
                 else: # Received metadata data --> chunked content
                     request_table_entry.chunked = True
             if packet.get_bytes().startswith(b'mdo:'): # request all frames from metadata
                 request_table_entry = self.handle_received_meta_data(faceid, packet, request_table_entry, to_lower)
             else:
+                completed_entry = request_table_entry
                 request_table_entry = self.handle_received_chunk_data(faceid, packet, request_table_entry, to_higher)
                 if request_table_entry is None:
+                    self._request_table.remove(completed_entry)
                     return #deletes entry if data was completed
-            self._request_table.append(request_table_entry)
+                names = request_table_entry.window.next_to_send(time.time()) # the window opened by the chunk
+                self.update_request_table_entry(request_table_entry)
+                for name in names:
+                    to_lower.put([faceid, Interest(name)])
+                return
+            self.update_request_table_entry(request_table_entry)
         if isinstance(packet, Nack):
             requestentry = self.get_request_table_entry(packet.name)
             if requestentry is not None:
@@ -117,13 +123,25 @@ class BasicChunkLayer(LayerProcess):
             return request_table_entry
         request_table_entry = self.remove_metadata_name_from_request_table(request_table_entry, packet.name)
         md, chunks = self.chunkifyer.parse_meta_data(packet.content)
-        if md is not None:  # there is another md file
-            request_table_entry.requested_md.append(md)
-            to_lower.put([faceid, Interest(md)])
+        now = time.time()
+        window = request_table_entry.window
+        window.on_data(packet.name, now)
+        if md is not None:  # there is another md file, prefetched before the chunks
+            request_table_entry.requested_md[md] = None
+            self._request_table.add_metadata_names(request_table_entry.name, [md])
+            window.send_now(md, now)
         else:
             request_table_entry.lastchunk = chunks[-1]
-        for chunk in chunks:  # request all chunks from the metadata file
-            request_table_entry.requested_chunks.append(chunk)
+        request_table_entry.buffer.announce(self.chunkifyer.get_chunk_index(chunks[-1]) + 1, final=md is None)
+        request_table_entry.requested_chunks.update(OrderedDict.fromkeys(chunks))
+        self._request_table.add_chunk_names(request_table_entry.name, chunks)
+        request_table_entry.faceid = faceid
+        window.enqueue(chunks)
+        names = window.next_to_send(now)
+        self.update_request_table_entry(request_table_entry) # store the entry before the chunks can arrive
+        if md is not None:
+            to_lower.put([faceid, Interest(md)])
+        for chunk in names:  # request the chunks from the metadata file fitting into the window
             to_lower.put([faceid, Interest(chunk)])
         self._chunk_table[packet.name] = (packet, time.time())
         return request_table_entry
@@ -134,18 +152,46 @@ class BasicChunkLayer(LayerProcess):
         chunk_entry = self.chunk_name_in_request_table(packet.name)
         if chunk_entry is None:
             return request_table_entry
-        request_table_entry.chunks.append(packet)
+        request_table_entry.window.on_data(packet.name, time.time())
+        request_table_entry.buffer.add_chunk(self.chunkifyer.get_chunk_index(packet.name), packet.get_view())
         request_table_entry = self.remove_chunk_name_from_request_table_entry(request_table_entry, packet.name)
         self._chunk_table[packet.name] = (packet, time.time())
         if request_table_entry.chunked and len(request_table_entry.requested_chunks) == 0 \
                 and len(request_table_entry.requested_md) == 0:  # all chunks are available
-            data = request_table_entry.chunks
-            data = sorted(data, key=lambda content: content.name.to_string())
-            cont = self.chunkifyer.reassamble_data(request_table_entry.name, data)
-            to_higher.put([faceid, cont])
+            data = request_table_entry.buffer.get_data()
+            if self.stream:  # the part not passed on yet
+                to_higher.put([faceid, Content(request_table_entry.name, request_table_entry.buffer.read()), True])
+            else:
+                to_higher.put([faceid, Content(request_table_entry.name, data)])
             return None
-        else:
-            return request_table_entry
+        if self.stream:
+            data = request_table_entry.buffer.read()
+            if data:
+                to_higher.put([faceid, Content(request_table_entry.name, data), False])
+        return request_table_entry
+
+    def on_timer(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue):
+        """Retransmit chunk and metadata Interests which timed out, give up requests which timed out too often"""
+        try:
+            now = time.time()
+            for request_table_entry in self._request_table.entries():
+                if request_table_entry.window.is_idle():
+                    continue
+                names, failed = request_table_entry.window.timeouts(now)
+                if failed:
+                    self.logger.info("Giving up " + str(request_table_entry.name))
+                    self._request_table.remove(request_table_entry)
+                    nack = Nack(request_table_entry.name, NackReason.NO_CONTENT, Interest(request_table_entry.name))
+                    to_higher.put([request_table_entry.faceid, nack])
+                    continue
+                if not names:
+                    continue
+                self.update_request_table_entry(request_table_entry)
+                for name in names:
+                    self.logger.info("Retransmitting " + str(name))
+                    to_lower.put([request_table_entry.faceid, Interest(name)])
+        except Exception as e:
+            self.logger.warning("Exception during retransmission: " + str(e))
 
     def get_chunk_list_from_chunk_table(self, data_names: Name) -> List[Content]:
         """get a list of content objects from a list of names"""
@@ -157,39 +203,34 @@ class BasicChunkLayer(LayerProcess):
 
     def get_request_table_entry(self, name: Name) -> RequestTableEntry:
         """check if a name is in the chunktable"""
-        for entry in self._request_table:
-            if entry.name == name or name in entry.requested_chunks or name in entry.requested_md:
-                return entry
+        return self._request_table.get(name)
 
-        return None
+    def update_request_table_entry(self, request_table_entry: RequestTableEntry):
+        """replace the entry with the same name in the requesttable"""
+        self._request_table.update(request_table_entry)
 
     def chunk_name_in_request_table(self, name):
         """check if a received chunk is expected by the requesttable"""
-        for entry in self._request_table:
-            if name in entry.requested_chunks:
-                return True
-        return False
+        return self._request_table.is_chunk_requested(name)
 
     def remove_chunk_name_from_request_table_entry(self, request_table_entry: RequestTableEntry, name: Name)\
             -> RequestTableEntry:
         """remove chunk from chunktable"""
         if name not in request_table_entry.requested_chunks:
             return request_table_entry
-        request_table_entry.requested_chunks.remove(name)
+        del request_table_entry.requested_chunks[name]
+        self._request_table.remove_chunk_name(name)
         return request_table_entry
 
     def metadata_name_in_request_table(self, name):
         """check if a received metadata is expected by the chunktable"""
-
-        for entry in self._request_table:
-            if name in entry.requested_md:
-                return True
-        return False
+        return self._request_table.is_metadata_requested(name)
 
     def remove_metadata_name_from_request_table(self, request_table_entry: RequestTableEntry, name: Name) \
             -> RequestTableEntry:
         """remove metadata from chunktable"""
         if name not in request_table_entry.requested_md:
             return request_table_entry
-        request_table_entry.requested_md.remove(name)
+        del request_table_entry.requested_md[name]
+        self._request_table.remove_metadata_name(name)
         return request_table_entry
@@ -15,17 +15,11 @@ class SimpleContentChunkifyer(BaseChunkifyer):
     def chunk_data(self, packet: Content) -> (List[Content], List[Content]):
         """Split content to chunks and generate metadata"""
         name = packet.name
-        data = packet.content
+        data = packet.get_view()
         chunks = [data[i:i + self._chunksize] for i in range(0, len(data), self._chunksize)]
         num_of_chunks = len(chunks)
-        meta_data = []
-        for i in range(0, num_of_chunks, self._num_of_names_in_metadata):
-            endindex = min(i+self._num_of_names_in_metadata, num_of_chunks)
-            md_num = int(i/self._num_of_names_in_metadata)
-            next = 0
-            if i + self._num_of_names_in_metadata < num_of_chunks:
-                next = int(i/4)+1
-            meta_data.append(self.generate_meta_data(i, endindex, md_num, next, packet.name))
+        meta_data = [self.generate_meta_data_object(name, num_of_chunks, md_num)
+                     for md_num in range(self.num_of_meta_data_objects(num_of_chunks))]
 
         content = []
         for i in range(0, num_of_chunks):
@@ -36,11 +30,37 @@ class SimpleContentChunkifyer(BaseChunkifyer):
 
 
     def reassamble_data(self, name: Name, chunks: List[Content]) -> Content:
-        data = ""
-        for d in chunks:
-            data = data + d.content
-        return Content(name, data)
+        return Content(name, b"".join(d.get_view() for d in chunks))
 
+    def get_chunk_index(self, name: Name) -> int:
+        """number of a chunk
+        :param name: name of the chunk
+        """
+        return int(name._components[-1][1:])
+
+
+    def num_of_chunks(self, size: int) -> int:
+        """number of chunks of a content object
+        :param size: payload size of the content object
+        """
+        return (size + self._chunksize - 1) // self._chunksize
+
+    def num_of_meta_data_objects(self, num_of_chunks: int) -> int:
+        """number of metadata objects listing the chunks of a content object
+        :param num_of_chunks: number of chunks of the content object
+        """
+        return (num_of_chunks + self._num_of_names_in_metadata - 1) // self._num_of_names_in_metadata
+
+    def generate_meta_data_object(self, name: Name, num_of_chunks: int, md_num: int) -> Content:
+        """Generate a single metadata object of a content object, without the payload of the content object
+        :param name: name of the content object
+        :param num_of_chunks: number of chunks of the content object
+        :param md_num: number of the metadata object
+        """
+        startindex = md_num * self._num_of_names_in_metadata
+        endindex = min(startindex + self._num_of_names_in_metadata, num_of_chunks)
+        next = md_num + 1 if endindex < num_of_chunks else 0
+        return self.generate_meta_data(startindex, endindex, md_num, next, name)
 
     def generate_meta_data(self, startindex: int, endindex: int, md_num: int, next: int, name: Name) -> Content:
         """Generate the meta data"""
@@ -142,4 +142,13 @@ class test_SimpleContentChunkifyer(unittest.TestCase):
 
         self.assertEqual(None, md)
         names_comp = [Name("/test/data/c0"), Name("/test/data/c1"), Name("/test/data/c2"), Name("/test/data/c3")]
-        self.assertEqual(names, names_comp)
\ No newline at end of file
+        self.assertEqual(names, names_comp)
+
+    def test_chunk_and_reassemble_bytes(self):
+        """Test that content objects are chunked by bytes and reassembled"""
+        name = Name("/test/data")
+        content = Content(name, "\u00e4" * 5000)
+        md, chunks = self.chunkifyer.chunk_data(content)
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual([self.chunkifyer.get_chunk_index(c.name) for c in chunks], [0, 1, 2])
+        self.assertEqual(self.chunkifyer.reassamble_data(name, chunks), content)
@@ -0,0 +1,116 @@
+"""Congestion window over the outstanding Interests of a chunked request"""
+
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+from PiCN.Packets import Name
+
+
+class FetchWindow(object):
+    """Consumer side window over the outstanding chunk Interests of a request. The window grows by one Interest per
+    received chunk up to ssthresh (slow start) and by one Interest per window afterwards, it is halved on timeouts
+    (AIMD). The retransmission timeout is estimated from RTT samples of chunks which were not retransmitted (RFC 6298).
+    Metadata Interests are sent immediately, bypassing the window, so the names of the next chunks are known early.
+    :param initial_window: number of Interests outstanding at the beginning
+    :param max_window: maximum number of outstanding Interests
+    :param initial_rto: retransmission timeout in seconds until the first RTT sample
+    :param min_rto: lower bound of the retransmission timeout in seconds
+    :param max_rto: upper bound of the retransmission timeout in seconds
+    :param max_retransmissions: number of retransmissions of an Interest before the request fails
+    """
+
+    def __init__(self, initial_window: int=8, max_window: int=128, initial_rto: float=1.0, min_rto: float=0.2,
+                 max_rto: float=8.0, max_retransmissions: int=5):
+        self.cwnd: float = float(initial_window)
+        self.ssthresh: float = float(max_window)
+        self.max_window: int = max_window
+        self.srtt: float = None
+        self.rttvar: float = None
+        self.rto: float = initial_rto
+        self.min_rto: float = min_rto
+        self.max_rto: float = max_rto
+        self.max_retransmissions: int = max_retransmissions
+        self._queued: Dict[Name, None] = OrderedDict()
+        self._outstanding: Dict[Name, Tuple[float, int]] = OrderedDict()
+
+    def enqueue(self, names: List[Name]):
+        """add chunk names to be requested when the window allows
+        :param names: names of the chunks
+        """
+        self._queued.update(OrderedDict.fromkeys(names))
+
+    def send_now(self, name: Name, now: float):
+        """mark an Interest as sent bypassing the window, e.g. to prefetch metadata
+        :param name: name of the Interest
+        :param now: current time
+        """
+        self._outstanding[name] = (now, 0)
+
+    def next_to_send(self, now: float) -> List[Name]:
+        """take the queued chunk names which fit into the window and mark them as sent
+        :param now: current time
+        :return: names of the Interests to be sent
+        """
+        names = []
+        while self._queued and len(self._outstanding) < int(self.cwnd):
+            name, _ = self._queued.popitem(last=False)
+            if name in self._outstanding:
+                continue
+            self._outstanding[name] = (now, 0)
+            names.append(name)
+        return names
+
+    def on_data(self, name: Name, now: float) -> bool:
+        """handle a received chunk or metadata object, update RTT estimation and window
+        :param name: name of the received object
+        :param now: current time
+        :return: True if an Interest for the name was outstanding
+        """
+        sent = self._outstanding.pop(name, None)
+        if sent is None:
+            self._queued.pop(name, None) # arrived before it was requested
+            return False
+        sent_time, retransmissions = sent
+        if retransmissions == 0: # Karn's algorithm, ambiguous samples of retransmitted Interests are ignored
+            self._update_rto(now - sent_time)
+        if self.cwnd < self.ssthresh:
+            self.cwnd += 1.0
+        else:
+            self.cwnd += 1.0 / self.cwnd
+        self.cwnd = min(self.cwnd, float(self.max_window))
+        return True
+
+    def timeouts(self, now: float) -> (List[Name], bool):
+        """find Interests outstanding for longer than the retransmission timeout and mark them as resent. On timeouts,
+        the window is halved and the retransmission timeout is backed off once per call.
+        :param now: current time
+        :return: names of the Interests to be retransmitted, True if an Interest exceeded max_retransmissions
+        """
+        expired = [name for name, (sent_time, _) in self._outstanding.items() if now - sent_time >= self.rto]
+        if not expired:
+            return [], False
+        self.ssthresh = max(self.cwnd / 2.0, 2.0)
+        self.cwnd = max(self.cwnd / 2.0, 1.0)
+        self.rto = min(self.rto * 2.0, self.max_rto)
+        for name in expired:
+            retransmissions = self._outstanding[name][1] + 1
+            if retransmissions > self.max_retransmissions:
+                return [], True
+            self._outstanding[name] = (now, retransmissions)
+        return expired, False
+
+    def is_idle(self) -> bool:
+        """True if no Interest is outstanding or queued"""
+        return not self._outstanding and not self._queued
+
+    def _update_rto(self, rtt: float):
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2.0
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+        self.rto = min(max(self.srtt + 4.0 * self.rttvar, self.min_rto), self.max_rto)
+
+    def __len__(self):
+        return len(self._outstanding)
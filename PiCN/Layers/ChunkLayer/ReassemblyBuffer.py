@@ -0,0 +1,123 @@
+"""Buffer reassembling the chunks of a content object"""
+
+from typing import Dict, Union
+
+
+class ReassemblyBuffer(object):
+    """Reassembles the chunks of a content object, placing each chunk at its offset in a bytearray as it arrives.
+    Chunks are numbered from 0, all chunks except the last one have the same size. The chunk size is learned from the
+    first chunk known not to be the last one, chunks arriving before are kept until then.
+    The bytes reassembled in order can be read while chunks are still missing, see read().
+    """
+
+    def __init__(self):
+        self._data = bytearray()
+        self._received = bytearray()
+        self._num_of_chunks = 0
+        self._final = False
+        self._chunk_size: int = None
+        self._pending: Dict[int, bytes] = {}
+        self._count = 0
+        self._in_order = 0
+        self._read = 0
+        self._length: int = None
+
+    def announce(self, num_of_chunks: int, final: bool=False):
+        """announce chunks of the content object, e.g. when they are listed by metadata
+        :param num_of_chunks: number of chunks known so far
+        :param final: True if the content object has no more chunks
+        """
+        if num_of_chunks > self._num_of_chunks:
+            self._received.extend(bytes(num_of_chunks - self._num_of_chunks))
+            self._num_of_chunks = num_of_chunks
+        self._final = self._final or final
+        if self._chunk_size is None:
+            self._learn_chunk_size()
+        else:
+            self._reserve()
+
+    def add_chunk(self, index: int, data: Union[bytes, bytearray, memoryview]) -> bool:
+        """add a chunk
+        :param index: number of the chunk
+        :param data: payload of the chunk
+        :return: True if the chunk was added, False if it was added before or does not fit
+        """
+        if index >= self._num_of_chunks:
+            if self._final:
+                return False
+            self.announce(index + 1)
+        if self._received[index] or index in self._pending:
+            return False
+        if self._chunk_size is None:
+            self._pending[index] = bytes(data)
+            self._learn_chunk_size()
+            return True
+        return self._place(index, data)
+
+    def is_complete(self) -> bool:
+        """True if all chunks of a content object announced as final were added"""
+        return self._final and self._count == self._num_of_chunks
+
+    def read(self) -> bytes:
+        """
+        :return: the bytes reassembled in order since the last read
+        """
+        end = self._in_order_length()
+        data = bytes(self._data[self._read:end])
+        self._read = end
+        return data
+
+    def get_data(self) -> bytearray:
+        """finish the reassembly, all chunks added so far are taken as the complete content object
+        :return: the reassembled content object
+        """
+        self._final = True
+        if self._pending:
+            if self._chunk_size is None:
+                self._chunk_size = len(self._pending[min(self._pending)])
+            self._flush_pending()
+        del self._data[self._in_order_length():]
+        return self._data
+
+    def _place(self, index: int, data) -> bool:
+        last = index == self._num_of_chunks - 1
+        if len(data) > self._chunk_size or (len(data) < self._chunk_size and not last):
+            return False
+        offset = index * self._chunk_size
+        if offset + len(data) > len(self._data):
+            self._data.extend(bytes(offset + len(data) - len(self._data)))
+        self._data[offset:offset + len(data)] = data
+        self._received[index] = 1
+        self._count += 1
+        if last:
+            self._length = offset + len(data)
+        while self._in_order < self._num_of_chunks and self._received[self._in_order]:
+            self._in_order += 1
+        return True
+
+    def _in_order_length(self) -> int:
+        if self._chunk_size is None:
+            return 0
+        if self._in_order == self._num_of_chunks and self._length is not None:
+            return self._length
+        return self._in_order * self._chunk_size
+
+    def _learn_chunk_size(self):
+        """take the chunk size from a pending chunk which is not the last one"""
+        for index, data in self._pending.items():
+            if index < self._num_of_chunks - 1:
+                self._chunk_size = len(data)
+                self._reserve()
+                self._flush_pending()
+                return
+
+    def _flush_pending(self):
+        pending, self._pending = self._pending, {}
+        for index in sorted(pending):
+            self._place(index, pending[index])
+
+    def _reserve(self):
+        """allocate the buffer for all chunks announced"""
+        size = self._num_of_chunks * self._chunk_size
+        if size > len(self._data):
+            self._data.extend(bytes(size - len(self._data)))
@@ -0,0 +1,133 @@
+"""Request Table of the Chunk Layer"""
+
+from collections import OrderedDict
+from typing import Dict, List
+
+from PiCN.Layers.ChunkLayer.FetchWindow import FetchWindow
+from PiCN.Layers.ChunkLayer.ReassemblyBuffer import ReassemblyBuffer
+from PiCN.Packets import Name
+
+
+class RequestTableEntry(object):
+    """Request table for Pending chunks. The names of the outstanding chunks and metadata objects are kept as keys of
+    ordered dicts, so received names are removed in constant time"""
+
+    def __init__(self, name: Name, window: FetchWindow=None):
+        self.name: Name = name
+        self.requested_chunks: Dict[Name, None] = OrderedDict()
+        self.buffer = ReassemblyBuffer()
+        self.window = window if window is not None else FetchWindow()
+        self.faceid: int = None
+        self.requested_md: Dict[Name, None] = OrderedDict()
+        self.chunked = False
+        self.lastchunk:Name
+
+    def __eq__(self, other):
+        return self.name == other.name
+
+
+class RequestTable(object):
+    """Request table of the Chunk Layer, indexed by the name of the requested content object and by the names of its
+    outstanding chunks and metadata objects. The names in requested_chunks and requested_md of an entry are indexed
+    when the entry is appended, names requested later are indexed by add_chunk_names and add_metadata_names.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Name, RequestTableEntry] = {}
+        self._chunks: Dict[Name, Name] = {}
+        self._metadata: Dict[Name, Name] = {}
+
+    def append(self, entry: RequestTableEntry):
+        """add an entry, replaces an entry with the same name
+        :param entry: entry to be added
+        """
+        if entry.name in self._entries:
+            self.remove(entry)
+        self._entries[entry.name] = entry
+        self.add_chunk_names(entry.name, entry.requested_chunks)
+        self.add_metadata_names(entry.name, entry.requested_md)
+
+    def remove(self, entry: RequestTableEntry):
+        """remove the entry with the name of an entry
+        :param entry: entry to be removed
+        """
+        entry = self._entries.pop(entry.name, None)
+        if entry is None:
+            return
+        for name in entry.requested_chunks:
+            self._chunks.pop(name, None)
+        for name in entry.requested_md:
+            self._metadata.pop(name, None)
+
+    def update(self, entry: RequestTableEntry):
+        """replace the entry with the same name, the index is not changed
+        :param entry: entry replacing the stored entry
+        """
+        if entry.name in self._entries:
+            self._entries[entry.name] = entry
+
+    def get(self, name: Name) -> RequestTableEntry:
+        """find an entry by the name of the requested content object or of one of its outstanding chunks or metadata
+        :param name: name to look up
+        :return: the entry or None
+        """
+        entry = self._entries.get(name)
+        if entry is not None:
+            return entry
+        parent = self._chunks.get(name)
+        if parent is None:
+            parent = self._metadata.get(name)
+        if parent is None:
+            return None
+        return self._entries.get(parent)
+
+    def add_chunk_names(self, parent: Name, names: List[Name]):
+        """index names of chunks requested for an entry
+        :param parent: name of the entry
+        :param names: names of the chunks
+        """
+        if parent not in self._entries:
+            return
+        for name in names:
+            self._chunks[name] = parent
+
+    def add_metadata_names(self, parent: Name, names: List[Name]):
+        """index names of metadata objects requested for an entry
+        :param parent: name of the entry
+        :param names: names of the metadata objects
+        """
+        if parent not in self._entries:
+            return
+        for name in names:
+            self._metadata[name] = parent
+
+    def remove_chunk_name(self, name: Name):
+        """remove a received chunk from the index
+        :param name: name of the chunk
+        """
+        self._chunks.pop(name, None)
+
+    def remove_metadata_name(self, name: Name):
+        """remove a received metadata object from the index
+        :param name: name of the metadata object
+        """
+        self._metadata.pop(name, None)
+
+    def is_chunk_requested(self, name: Name) -> bool:
+        """check if a chunk is requested by an entry"""
+        return name in self._chunks
+
+    def is_metadata_requested(self, name: Name) -> bool:
+        """check if a metadata object is requested by an entry"""
+        return name in self._metadata
+
+    def entries(self) -> List[RequestTableEntry]:
+        """all entries of the table"""
+        return list(self._entries.values())
+
+    def __getitem__(self, index: int) -> RequestTableEntry:
+        """entry by position, in the order the entries were appended"""
+        return self.entries()[index]
+
+    def __len__(self):
+        return len(self._entries)
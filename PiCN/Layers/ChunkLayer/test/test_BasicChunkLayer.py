@@ -4,6 +4,7 @@ import multiprocessing
 import time
 import unittest
 
+from collections import OrderedDict
 from queue import Queue
 
 from PiCN.Layers.ChunkLayer import BasicChunkLayer
@@ -60,8 +61,10 @@ class test_BasicChunkLayer(unittest.TestCase):
         rte1 = RequestTableEntry(n1)
         rte2 = RequestTableEntry(n2)
 
-        rte1.requested_chunks = [Name("/test/data/c0"), Name("/test/data/c1"), Name("/test/data/c2")]
-        rte2.requested_chunks = [Name("/data/test/c0"), Name("/data/test/c1"), Name("/data/test/c2")]
+        rte1.requested_chunks = OrderedDict.fromkeys([Name("/test/data/c0"), Name("/test/data/c1"),
+                                                      Name("/test/data/c2")])
+        rte2.requested_chunks = OrderedDict.fromkeys([Name("/data/test/c0"), Name("/data/test/c1"),
+                                                      Name("/data/test/c2")])
 
         self.chunkLayer._request_table.append(rte1)
         self.chunkLayer._request_table.append(rte2)
@@ -104,8 +107,10 @@ class test_BasicChunkLayer(unittest.TestCase):
         rte1 = RequestTableEntry(n1)
         rte2 = RequestTableEntry(n2)
 
-        rte1.requested_chunks = [Name("/test/data/c0"), Name("/test/data/c1"), Name("/test/data/c2")]
-        rte2.requested_chunks = [Name("/data/test/c0"), Name("/data/test/c1"), Name("/data/test/c2")]
+        rte1.requested_chunks = OrderedDict.fromkeys([Name("/test/data/c0"), Name("/test/data/c1"),
+                                                      Name("/test/data/c2")])
+        rte2.requested_chunks = OrderedDict.fromkeys([Name("/data/test/c0"), Name("/data/test/c1"),
+                                                      Name("/data/test/c2")])
 
         self.chunkLayer._request_table.append(rte1)
         self.chunkLayer._request_table.append(rte2)
@@ -136,8 +141,10 @@ class test_BasicChunkLayer(unittest.TestCase):
         rte1 = RequestTableEntry(n1)
         rte2 = RequestTableEntry(n2)
 
-        rte1.requested_md = [Name("/test/data/m0"), Name("/test/data/m1"), Name("/test/data/m2")]
-        rte2.requested_md = [Name("/data/test/m0"), Name("/data/test/m1"), Name("/data/test/m2")]
+        rte1.requested_md = OrderedDict.fromkeys([Name("/test/data/m0"), Name("/test/data/m1"),
+                                                  Name("/test/data/m2")])
+        rte2.requested_md = OrderedDict.fromkeys([Name("/data/test/m0"), Name("/data/test/m1"),
+                                                  Name("/data/test/m2")])
 
         self.chunkLayer._request_table.append(rte1)
         self.chunkLayer._request_table.append(rte2)
@@ -170,10 +177,10 @@ class test_BasicChunkLayer(unittest.TestCase):
 
         request_table_entry = self.chunkLayer.handle_received_meta_data(0, md1, request_table_entry, self.q1_to_lower)
 
-        self.assertEqual(request_table_entry.requested_md[0], Name("/test/data/m1"))
+        self.assertEqual(list(request_table_entry.requested_md)[0], Name("/test/data/m1"))
         chunknames =  [Name("/test/data/c0"), Name("/test/data/c1"), Name("/test/data/c2"), Name("/test/data/c3"),
                        Name("/test/data/c4")]
-        self.assertEqual(request_table_entry.requested_chunks, chunknames[:4])
+        self.assertEqual(list(request_table_entry.requested_chunks), chunknames[:4])
 
         d1 = self.q1_to_lower.get()[1]
         self.assertEqual(d1.name, Name("/test/data/m1"))
@@ -185,7 +192,7 @@ class test_BasicChunkLayer(unittest.TestCase):
         request_table_entry = self.chunkLayer.handle_received_meta_data(0, md2, request_table_entry, self.q1_to_lower)
         self.assertEqual(len(request_table_entry.requested_md), 0)
         self.assertEqual(len(request_table_entry.requested_chunks), 5)
-        self.assertEqual(request_table_entry.requested_chunks, chunknames)
+        self.assertEqual(list(request_table_entry.requested_chunks), chunknames)
         try:
             d3 = self.q1_to_lower.get(timeout=2.0)[1]
         except:
@@ -204,14 +211,14 @@ class test_BasicChunkLayer(unittest.TestCase):
         request_table_entry = RequestTableEntry(n1)
         request_table_entry.chunked = True
 
-        request_table_entry.requested_chunks.append(chunk1_n)
-        request_table_entry.requested_chunks.append(chunk2_n)
+        request_table_entry.requested_chunks[chunk1_n] = None
+        request_table_entry.requested_chunks[chunk2_n] = None
 
         chunk1 = Content(chunk1_n, "chunk1")
         chunk2 = Content(chunk2_n, "chunk2")
 
         request_table_entry = self.chunkLayer.handle_received_chunk_data(0, chunk1, request_table_entry, self.q1_to_higher)
-        self.assertEqual(request_table_entry.requested_chunks, [chunk2_n])
+        self.assertEqual(list(request_table_entry.requested_chunks), [chunk2_n])
 
         request_table_entry = self.chunkLayer.handle_received_chunk_data(0, chunk2, request_table_entry, self.q1_to_higher)
         self.assertEqual(request_table_entry, None)
@@ -343,8 +350,8 @@ class test_BasicChunkLayer(unittest.TestCase):
         self.assertTrue(self.chunkLayer.queue_to_lower.empty())
 
         request: RequestTableEntry = self.chunkLayer.get_request_table_entry(md1_n)
-        self.assertEqual(request.requested_chunks, chunknames[:4])
-        self.assertEqual(request.requested_md[0], md2_n)
+        self.assertEqual(list(request.requested_chunks), chunknames[:4])
+        self.assertEqual(list(request.requested_md)[0], md2_n)
 
         self.chunkLayer.queue_from_lower.put([0, md2])
         try:
@@ -360,7 +367,7 @@ class test_BasicChunkLayer(unittest.TestCase):
 
         self.assertEqual(len(request.requested_md), 0)
         self.assertEqual(len(request.requested_chunks), 5)
-        self.assertEqual(request.requested_chunks, chunknames)
+        self.assertEqual(list(request.requested_chunks), chunknames)
 
     def test_chunk_from_lower_layer(self):
         """test receiving metadata from lower layer"""
@@ -376,8 +383,8 @@ class test_BasicChunkLayer(unittest.TestCase):
         chunk1 = Content(chunk1_n, "chunk1")
         chunk2 = Content(chunk2_n, "chunk2")
 
-        re1.requested_chunks.append(chunk1_n)
-        re1.requested_chunks.append(chunk2_n)
+        re1.requested_chunks[chunk1_n] = None
+        re1.requested_chunks[chunk2_n] = None
 
         self.chunkLayer._request_table.append(re1)
 
@@ -394,6 +401,82 @@ class test_BasicChunkLayer(unittest.TestCase):
 
         self.assertEqual(data[1].content, "chunk1chunk2")
 
+    def test_reassemble_many_chunks_from_lower_layer(self):
+        """test reassembling a content object with more than ten chunks, arriving out of order"""
+        self.chunkLayer.start_process()
+        name = Name("/test/data")
+        data = bytes(range(256)) * 200
+        metadata, chunks = self.chunkifyer.chunk_data(Content(name, data))
+        self.chunkLayer.queue_from_higher.put([0, Interest(name)])
+        self.chunkLayer.queue_to_lower.get(timeout=2.0)
+        for md in metadata:
+            self.chunkLayer.queue_from_lower.put([0, md])
+        for chunk in reversed(chunks):
+            self.chunkLayer.queue_from_lower.put([0, chunk])
+        try:
+            data_from_layer = self.chunkLayer.queue_to_higher.get(timeout=5.0)
+        except:
+            self.fail()
+        self.assertEqual(data_from_layer[1], Content(name, data))
+
+    def test_stream_chunks_to_higher_layer(self):
+        """test passing the parts of a content object reassembled in order to the higher layer"""
+        self.chunkLayer = BasicChunkLayer(self.chunkifyer, log_level=255, stream=True)
+        self.chunkLayer.queue_to_lower = self.q1_to_lower
+        self.chunkLayer.queue_to_higher = self.q1_to_higher
+        self.chunkLayer.queue_from_lower = self.q1_from_lower
+        self.chunkLayer.queue_from_higher = self.q1_from_higher
+        self.chunkLayer.start_process()
+        name = Name("/test/data")
+        md = Content(name, "mdo:/test/data/c0;/test/data/c1;/test/data/c2:")
+        self.chunkLayer.queue_from_higher.put([0, Interest(name)])
+        self.chunkLayer.queue_to_lower.get(timeout=2.0)
+        self.chunkLayer.queue_from_lower.put([0, md])
+        self.chunkLayer.queue_from_lower.put([0, Content("/test/data/c1", "chunk1")])
+        self.chunkLayer.queue_from_lower.put([0, Content("/test/data/c0", "chunk0")])
+        try:
+            data = self.chunkLayer.queue_to_higher.get(timeout=2.0)
+        except:
+            self.fail()
+        self.assertEqual(data, [0, Content(name, "chunk0chunk1"), False])
+        self.chunkLayer.queue_from_lower.put([0, Content("/test/data/c2", "last")])
+        try:
+            data = self.chunkLayer.queue_to_higher.get(timeout=2.0)
+        except:
+            self.fail()
+        self.assertEqual(data, [0, Content(name, "last"), True])
+        self.assertTrue(self.chunkLayer.queue_to_higher.empty())
+
+    def test_chunk_interests_limited_by_window_and_retransmitted(self):
+        """test that chunk interests are sent within the window and retransmitted after a timeout"""
+        self.chunkLayer = BasicChunkLayer(self.chunkifyer, log_level=255, initial_window=2)
+        self.chunkLayer.queue_to_lower = self.q1_to_lower
+        self.chunkLayer.queue_to_higher = self.q1_to_higher
+        self.chunkLayer.queue_from_lower = self.q1_from_lower
+        self.chunkLayer.queue_from_higher = self.q1_from_higher
+        self.chunkLayer.start_process()
+        name = Name("/test/data")
+        md = Content(name, "mdo:/test/data/c0;/test/data/c1;/test/data/c2:")
+        self.chunkLayer.queue_from_higher.put([0, Interest(name)])
+        self.assertEqual(self.chunkLayer.queue_to_lower.get(timeout=2.0)[1], Interest(name))
+        self.chunkLayer.queue_from_lower.put([0, md])
+        self.assertEqual(self.chunkLayer.queue_to_lower.get(timeout=2.0)[1], Interest("/test/data/c0"))
+        self.assertEqual(self.chunkLayer.queue_to_lower.get(timeout=2.0)[1], Interest("/test/data/c1"))
+        self.chunkLayer.queue_from_lower.put([0, Content("/test/data/c0", "chunk0")])
+        self.assertEqual(self.chunkLayer.queue_to_lower.get(timeout=2.0)[1], Interest("/test/data/c2"))
+        self.chunkLayer.queue_from_lower.put([0, Content("/test/data/c2", "chunk2")])
+        try:
+            data = self.chunkLayer.queue_to_lower.get(timeout=3.0)
+        except:
+            self.fail()
+        self.assertEqual(data[1], Interest("/test/data/c1"))
+        self.chunkLayer.queue_from_lower.put([0, Content("/test/data/c1", "chunk1")])
+        try:
+            data = self.chunkLayer.queue_to_higher.get(timeout=2.0)
+        except:
+            self.fail()
+        self.assertEqual(data[1].content, "chunk0chunk1chunk2")
+
     def test_nack_from_higher(self):
         """Test nack from higher"""
         self.chunkLayer.start_process()
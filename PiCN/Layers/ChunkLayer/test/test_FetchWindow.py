@@ -0,0 +1,68 @@
+"""Testing the Fetch Window"""
+
+import unittest
+
+from PiCN.Layers.ChunkLayer.FetchWindow import FetchWindow
+from PiCN.Packets import Name
+
+
+class test_FetchWindow(unittest.TestCase):
+    """Testing the Fetch Window"""
+
+    def setUp(self):
+        self.window = FetchWindow(initial_window=2, max_window=16, initial_rto=1.0, min_rto=0.2,
+                                  max_retransmissions=2)
+        self.names = [Name("/test/data/c" + str(i)) for i in range(0, 10)]
+
+    def test_window_limits_outstanding_interests(self):
+        """Test that only the Interests fitting into the window are sent"""
+        self.window.enqueue(self.names)
+        self.assertEqual(self.window.next_to_send(0.0), self.names[:2])
+        self.assertEqual(self.window.next_to_send(0.0), [])
+        self.assertTrue(self.window.on_data(self.names[0], 0.1))
+        self.assertEqual(self.window.cwnd, 3.0)
+        self.assertEqual(self.window.next_to_send(0.1), self.names[2:4])
+        self.assertEqual(len(self.window), 3)
+
+    def test_metadata_bypasses_window(self):
+        """Test that Interests sent immediately count as outstanding"""
+        md = Name("/test/data/m1")
+        self.window.send_now(md, 0.0)
+        self.window.enqueue(self.names)
+        self.assertEqual(self.window.next_to_send(0.0), self.names[:1])
+        self.assertTrue(self.window.on_data(md, 0.1))
+        self.assertFalse(self.window.is_idle())
+
+    def test_rtt_estimation(self):
+        """Test the retransmission timeout computed from RTT samples"""
+        self.window.enqueue(self.names[:1])
+        self.window.next_to_send(0.0)
+        self.window.on_data(self.names[0], 0.1)
+        self.assertAlmostEqual(self.window.srtt, 0.1)
+        self.assertAlmostEqual(self.window.rttvar, 0.05)
+        self.assertAlmostEqual(self.window.rto, 0.3)
+
+    def test_timeout_and_retransmission(self):
+        """Test that timed out Interests are retransmitted and the window is halved"""
+        self.window.cwnd = 8.0
+        self.window.enqueue(self.names)
+        sent = self.window.next_to_send(0.0)
+        self.assertEqual(self.window.timeouts(0.5), ([], False))
+        names, failed = self.window.timeouts(1.0)
+        self.assertEqual(names, sent)
+        self.assertFalse(failed)
+        self.assertEqual(self.window.cwnd, 4.0)
+        self.assertEqual(self.window.rto, 2.0)
+        self.window.on_data(sent[0], 1.5)
+        self.assertIsNone(self.window.srtt)
+        self.assertEqual(self.window.timeouts(3.0)[1], False)
+        self.assertEqual(self.window.timeouts(7.0)[1], True)
+
+    def test_unrequested_data(self):
+        """Test that data arriving before its Interest was sent is taken from the queue"""
+        self.window.enqueue(self.names[:3])
+        self.assertFalse(self.window.on_data(self.names[2], 0.0))
+        self.assertEqual(self.window.next_to_send(0.0), self.names[:2])
+        self.window.on_data(self.names[0], 0.0)
+        self.window.on_data(self.names[1], 0.0)
+        self.assertTrue(self.window.is_idle())
@@ -0,0 +1,64 @@
+"""Testing the Reassembly Buffer"""
+
+import unittest
+
+from PiCN.Layers.ChunkLayer.ReassemblyBuffer import ReassemblyBuffer
+
+
+class test_ReassemblyBuffer(unittest.TestCase):
+    """Testing the Reassembly Buffer"""
+
+    def setUp(self):
+        self.buffer = ReassemblyBuffer()
+        self.data = bytes(range(256)) * 50
+        self.chunks = [self.data[i:i + 1000] for i in range(0, len(self.data), 1000)]
+
+    def test_reassemble_in_order(self):
+        """Test reassembling chunks arriving in order"""
+        self.buffer.announce(len(self.chunks), final=True)
+        for i, chunk in enumerate(self.chunks):
+            self.assertFalse(self.buffer.is_complete())
+            self.assertTrue(self.buffer.add_chunk(i, chunk))
+        self.assertTrue(self.buffer.is_complete())
+        self.assertEqual(self.buffer.get_data(), self.data)
+
+    def test_reassemble_out_of_order(self):
+        """Test reassembling chunks arriving in reverse order, before they are announced"""
+        for i in reversed(range(len(self.chunks))):
+            self.assertTrue(self.buffer.add_chunk(i, memoryview(self.chunks[i])))
+        self.assertFalse(self.buffer.is_complete())
+        self.buffer.announce(len(self.chunks), final=True)
+        self.assertTrue(self.buffer.is_complete())
+        self.assertEqual(self.buffer.get_data(), self.data)
+
+    def test_duplicate_and_invalid_chunks(self):
+        """Test that duplicate chunks and chunks not fitting are not added"""
+        self.buffer.announce(3, final=True)
+        self.assertTrue(self.buffer.add_chunk(0, b"aaaa"))
+        self.assertTrue(self.buffer.add_chunk(1, b"bbbb"))
+        self.assertFalse(self.buffer.add_chunk(1, b"bbbb"))
+        self.assertFalse(self.buffer.add_chunk(3, b"dddd"))
+        self.assertFalse(self.buffer.add_chunk(2, b"ccccc"))
+        self.assertTrue(self.buffer.add_chunk(2, b"cc"))
+        self.assertEqual(self.buffer.get_data(), b"aaaabbbbcc")
+
+    def test_read_in_order_prefix(self):
+        """Test reading the bytes reassembled in order while chunks are missing"""
+        self.buffer.announce(4)
+        self.buffer.add_chunk(1, self.chunks[1])
+        self.assertEqual(self.buffer.read(), b"")
+        self.buffer.add_chunk(0, self.chunks[0])
+        self.buffer.add_chunk(3, self.chunks[3])
+        self.assertEqual(self.buffer.read(), self.data[:2000])
+        self.buffer.add_chunk(2, self.chunks[2])
+        self.assertEqual(self.buffer.read(), self.data[2000:4000])
+        self.buffer.announce(len(self.chunks), final=True)
+        for i in range(4, len(self.chunks)):
+            self.buffer.add_chunk(i, self.chunks[i])
+        self.assertEqual(self.buffer.read(), self.data[4000:])
+        self.assertEqual(self.buffer.read(), b"")
+
+    def test_single_chunk(self):
+        """Test reassembling a content object with a single chunk"""
+        self.buffer.add_chunk(0, b"chunk")
+        self.assertEqual(self.buffer.get_data(), b"chunk")
@@ -0,0 +1,54 @@
+"""Testing the Request Table of the Chunk Layer"""
+
+import unittest
+
+from collections import OrderedDict
+
+from PiCN.Layers.ChunkLayer.RequestTable import RequestTable, RequestTableEntry
+from PiCN.Packets import Name
+
+
+class test_RequestTable(unittest.TestCase):
+    """Testing the Request Table of the Chunk Layer"""
+
+    def setUp(self):
+        self.table = RequestTable()
+        self.entry = RequestTableEntry(Name("/test/data"))
+        self.chunknames = [Name("/test/data/c" + str(i)) for i in range(0, 4)]
+
+    def test_append_and_get(self):
+        """Test finding an entry by its name and by the names requested when it was appended"""
+        self.entry.requested_chunks.update(OrderedDict.fromkeys(self.chunknames[:2]))
+        self.entry.requested_md[Name("/test/data/m1")] = None
+        self.table.append(self.entry)
+        self.table.append(RequestTableEntry(Name("/data/test")))
+        self.assertEqual(len(self.table), 2)
+        self.assertIs(self.table.get(Name("/test/data")), self.entry)
+        self.assertIs(self.table.get(self.chunknames[1]), self.entry)
+        self.assertIs(self.table.get(Name("/test/data/m1")), self.entry)
+        self.assertEqual(self.table.get(Name("/data/test")).name, Name("/data/test"))
+        self.assertIsNone(self.table.get(self.chunknames[2]))
+        self.assertEqual(self.table[0], self.entry)
+
+    def test_add_and_remove_names(self):
+        """Test indexing names requested after the entry was appended"""
+        self.table.append(self.entry)
+        self.table.add_chunk_names(self.entry.name, self.chunknames)
+        self.table.add_metadata_names(self.entry.name, [Name("/test/data/m1")])
+        self.assertTrue(self.table.is_chunk_requested(self.chunknames[3]))
+        self.assertFalse(self.table.is_metadata_requested(self.chunknames[3]))
+        self.assertTrue(self.table.is_metadata_requested(Name("/test/data/m1")))
+        self.table.remove_chunk_name(self.chunknames[3])
+        self.assertFalse(self.table.is_chunk_requested(self.chunknames[3]))
+        self.assertIsNone(self.table.get(self.chunknames[3]))
+        self.table.add_chunk_names(Name("/data/test"), [Name("/data/test/c0")])
+        self.assertFalse(self.table.is_chunk_requested(Name("/data/test/c0")))
+
+    def test_remove(self):
+        """Test that removing an entry removes the names requested for it"""
+        self.entry.requested_chunks.update(OrderedDict.fromkeys(self.chunknames))
+        self.table.append(self.entry)
+        self.table.remove(RequestTableEntry(Name("/test/data")))
+        self.assertEqual(len(self.table), 0)
+        self.assertIsNone(self.table.get(self.chunknames[0]))
+        self.assertFalse(self.table.is_chunk_requested(self.chunknames[0]))
@@ -3,6 +3,20 @@
 import abc
 from typing import List
 
+from PiCN.Packets import Name
+
+
+def name_key(name: Name):
+    """canonical, hashable key of a name used to index data structs (see Name.key), cached by the name.
+    Anything that is not a Name is its own key, so it never matches an entry (like in Name.__eq__).
+    :param name: name to compute the key for
+    :return: tuple of suite, joined components and digest
+    """
+    if type(name) is not Name:
+        return name
+    return name.key
+
+
 class BaseICNDataStruct(object):
 
     def __init__(self):
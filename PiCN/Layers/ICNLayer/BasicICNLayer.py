@@ -1,7 +1,6 @@
 """Basic ICN Forwarding Layer"""
 
 import multiprocessing
-import threading
 import time
 from typing import List
 
@@ -26,6 +25,7 @@ class BasicICNLayer(LayerProcess):
         self.fib = fib
         self.rib = rib
         self._ageing_interval: int = ageing_interval
+        self.timer_interval = ageing_interval
         self._interest_to_app: bool = False
 
     def data_from_higher(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue, data):
@@ -50,7 +50,7 @@ class BasicICNLayer(LayerProcess):
             return
         face_id = data[0]
         packet = data[1]
-        self.logger.info("Received Packet from lower: " + str(face_id) + "; " + str(packet.name))
+        self.logger.info("Received Packet from lower: %s; %s", face_id, packet.name)
         if isinstance(packet, Interest):
             self.handle_interest_from_lower(face_id, packet, to_lower, to_higher, False)
         elif isinstance(packet, Content):
@@ -60,7 +60,7 @@ class BasicICNLayer(LayerProcess):
 
     def handle_interest_from_higher (self, face_id: int, interest: Interest, to_lower: multiprocessing.Queue,
                                    to_higher: multiprocessing.Queue):
-        self.logger.info("Handling Interest (from higher): " + str(interest.name) + "; Face ID: " + str(face_id))
+        self.logger.info("Handling Interest (from higher): %s; Face ID: %s", interest.name, face_id)
         cs_entry = self.cs.find_content_object(interest.name)
         if cs_entry is not None:
             self.queue_to_higher.put([face_id, cs_entry.content])
@@ -75,7 +75,7 @@ class BasicICNLayer(LayerProcess):
             self.pit.add_used_fib_entry(interest.name, fib_entry)
             to_lower.put([fib_entry.faceid, interest])
         else:
-            self.logger.info("No FIB entry, sending Nack: " + str(interest.name))
+            self.logger.info("No FIB entry, sending Nack: %s", interest.name)
             nack = Nack(interest.name, NackReason.NO_ROUTE, interest=interest)
             if pit_entry is not None:  # if pit entry is available, consider it, otherwise assume interest came from higher
                 for i in range(0, len(pit_entry.faceids)):
@@ -88,7 +88,7 @@ class BasicICNLayer(LayerProcess):
 
     def handle_interest_from_lower(self, face_id: int, interest: Interest, to_lower: multiprocessing.Queue,
                                    to_higher: multiprocessing.Queue, from_local: bool = False):
-        self.logger.info("Handling Interest (from lower): " + str(interest.name) + "; Face ID: " + str(face_id))
+        self.logger.info("Handling Interest (from lower): %s; Face ID: %s", interest.name, face_id)
         cs_entry = self.cs.find_content_object(interest.name)
         if cs_entry is not None:
             self.logger.info("Found in content store")
@@ -122,7 +122,7 @@ class BasicICNLayer(LayerProcess):
 
     def handle_content(self, face_id: int, content: Content, to_lower: multiprocessing.Queue,
                        to_higher: multiprocessing.Queue, from_local: bool = False):
-        self.logger.info("Handling Content " + str(content.name) + " " + str(content.content))
+        self.logger.info("Handling Content %s", content.name)
         pit_entry = self.pit.find_pit_entry(content.name)
         if pit_entry is None:
             self.logger.info("No PIT entry for content object available, dropping")
@@ -139,7 +139,7 @@ class BasicICNLayer(LayerProcess):
 
     def handle_nack(self, face_id: int, nack: Nack, to_lower: multiprocessing.Queue,
                     to_higher: multiprocessing.Queue, from_local: bool = False):
-        self.logger.info("Handling NACK: " + str(nack.name) + " Reason: " + str(nack.reason) + " From Local: " + str(from_local))
+        self.logger.info("Handling NACK: %s Reason: %s From Local: %s", nack.name, nack.reason, from_local)
         pit_entry = self.pit.find_pit_entry(nack.name)
         if pit_entry is None:
             self.logger.info("No PIT entry for NACK available, dropping")
@@ -171,6 +171,10 @@ class BasicICNLayer(LayerProcess):
                 self.pit.add_used_fib_entry(nack.name, fib_entry)
                 to_lower.put([fib_entry.faceid, pit_entry.interest])
 
+    def on_timer(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue):
+        """Age the data structs every ageing_interval seconds in the process loop of the layer"""
+        self.ageing()
+
     def ageing(self):
         """Ageing the data structs"""
         try:
@@ -187,7 +191,3 @@ class BasicICNLayer(LayerProcess):
         except Exception as e:
             self.logger.warn("Exception during ageing: " + str(e))
             pass
-        finally:
-            t = threading.Timer(self._ageing_interval, self.ageing)
-            t.setDaemon(True)
-            t.start()
@@ -2,13 +2,16 @@
 
 import abc
 import time
-from typing import List
+from typing import Dict, List
 
 from PiCN.Packets import Content, Name
 from PiCN.Layers.ICNLayer import BaseICNDataStruct
 
 class ContentStoreEntry(object):
     """Entry of the content store"""
+
+    __slots__ = ('_content', '_static', '_timestamp')
+
     def __init__(self, content: Content, static: bool=False):
         self._content: Content = content
         self._static: bool = static #if true: do not remove this content object from CS by ageing
@@ -96,6 +99,13 @@ class BaseContentStore(BaseICNDataStruct):
         :return: None
         """
 
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Get usage counters of the content store
+        :return: dict of counter names to values, None if the content store does not count
+        """
+        return None
+
     def set_cs_timeout(self, timeout: float):
         """set the timeout intervall for a CS entry
         :param timeout: the timeout intervall to be set
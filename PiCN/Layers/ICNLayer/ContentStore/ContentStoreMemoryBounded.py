@@ -0,0 +1,139 @@
+""" An in-memory content store with exact matching and a bounded capacity"""
+
+import time
+from collections import OrderedDict
+from typing import Dict, List
+
+from PiCN.Packets import Content, Name
+from PiCN.Layers.ICNLayer.BaseICNDataStruct import name_key
+from PiCN.Layers.ICNLayer.ContentStore import BaseContentStore, ContentStoreEntry
+from PiCN.Layers.ICNLayer.ContentStore.ReplacementPolicy import BaseReplacementPolicy, LRUReplacementPolicy
+from PiCN.Layers.ICNLayer.ExpiryScheduler import ExpiryScheduler
+
+
+class ContentStoreMemoryBounded(BaseContentStore):
+    """ A in memory Content Store using exact matching, bounded by number of entries and by payload bytes.
+    Before an entry is added, the replacement policy chooses entries to evict until the new entry fits. Static entries
+    are pinned: they count towards the bounds but are never evicted, so content is not cached if only static entries
+    are left.
+    :param cs_timeout: Time interval in which a CS entry will be cached
+    :param max_entries: maximum number of entries, unbounded if None
+    :param max_bytes: maximum sum of the payload sizes of all entries, unbounded if None
+    :param replacement_policy: policy choosing entries to evict, LRU if None
+    """
+
+    def __init__(self, cs_timeout: int=10, max_entries: int=None, max_bytes: int=None,
+                 replacement_policy: BaseReplacementPolicy=None):
+        BaseContentStore.__init__(self, cs_timeout=cs_timeout)
+        self._container: OrderedDict = OrderedDict()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._policy = replacement_policy if replacement_policy is not None else LRUReplacementPolicy()
+        self._expiry = ExpiryScheduler()
+        self._size_bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def find_content_object(self, name: Name) -> ContentStoreEntry:
+        key = name_key(name)
+        entry = self._container.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._policy.access(key)
+        return entry
+
+    def add_content_object(self, content: Content, static: bool=False):
+        key = name_key(content.name)
+        entry = self._container.get(key)
+        if entry is not None:
+            if entry.content == content:
+                if static and not entry.static:
+                    entry.static = True
+                    self._policy.remove(key)
+                    self._expiry.cancel(key)
+                return
+            if entry.static and not static:
+                return
+            self._remove(key)
+        size = self._payload_size(content)
+        if not static and self._max_bytes is not None and size > self._max_bytes:
+            return
+        if not self._evict(1, size) and not static:
+            return
+        entry = ContentStoreEntry(content, static=static)
+        self._container[key] = entry
+        self._size_bytes += size
+        if not static:
+            self._policy.insert(key)
+            self._expiry.schedule(key, entry.timestamp, content.name)
+
+    def remove_content_object(self, name: Name):
+        self._remove(name_key(name))
+
+    def update_timestamp(self, cs_entry: ContentStoreEntry):
+        key = name_key(cs_entry.name)
+        entry = self._container.get(key)
+        if entry is None:
+            return
+        entry.timestamp = time.time()
+        if not entry.static:
+            self._expiry.schedule(key, entry.timestamp, entry.name)
+
+    def ageing(self):
+        cur_time = time.time()
+        for name in self._expiry.pop_expired(cur_time - self._cs_timeout):
+            self.remove_content_object(name)
+
+    def get_container(self) -> List[ContentStoreEntry]:
+        return list(self._container.values())
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {'hits': self._hits, 'misses': self._misses, 'evictions': self._evictions,
+                'entries': len(self._container), 'bytes': self._size_bytes}
+
+    def set_max_entries(self, max_entries: int):
+        """set the maximum number of entries and evict entries exceeding it
+        :param max_entries: maximum number of entries, unbounded if None
+        """
+        self._max_entries = max_entries
+        self._evict()
+
+    def set_max_bytes(self, max_bytes: int):
+        """set the maximum sum of payload sizes and evict entries exceeding it
+        :param max_bytes: maximum number of bytes, unbounded if None
+        """
+        self._max_bytes = max_bytes
+        self._evict()
+
+    def _remove(self, key):
+        """remove an entry without counting it as eviction"""
+        entry = self._container.pop(key, None)
+        if entry is None:
+            return
+        self._size_bytes -= self._payload_size(entry.content)
+        self._policy.remove(key)
+        self._expiry.cancel(key)
+
+    def _evict(self, new_entries: int=0, new_bytes: int=0):
+        """evict entries chosen by the replacement policy until all bounds are met or only static entries are left
+        :param new_entries: number of entries that are about to be added
+        :param new_bytes: payload size that is about to be added
+        :return: True if the bounds are met
+        """
+        while (self._max_entries is not None and len(self._container) + new_entries > self._max_entries) or \
+                (self._max_bytes is not None and self._size_bytes + new_bytes > self._max_bytes):
+            key = self._policy.evict()
+            if key is None:
+                return False
+            entry = self._container.pop(key)
+            self._size_bytes -= self._payload_size(entry.content)
+            self._expiry.cancel(key)
+            self._evictions += 1
+        return True
+
+    def _payload_size(self, content: Content) -> int:
+        payload = content.get_view()
+        return len(payload) if payload is not None else 0
@@ -3,7 +3,9 @@
 import time
 
 from PiCN.Packets import Content, Name
+from PiCN.Layers.ICNLayer.BaseICNDataStruct import name_key
 from PiCN.Layers.ICNLayer.ContentStore import BaseContentStore, ContentStoreEntry
+from PiCN.Layers.ICNLayer.ExpiryScheduler import ExpiryScheduler
 
 
 class ContentStoreMemoryExact(BaseContentStore):
@@ -11,6 +13,7 @@ class ContentStoreMemoryExact(BaseContentStore):
 
     def __init__(self, cs_timeout: int = 10):
         BaseContentStore.__init__(self, cs_timeout=cs_timeout)
+        self._expiry = ExpiryScheduler()
 
     def find_content_object(self, name: Name) -> ContentStoreEntry:
         for c in self._container:
@@ -19,28 +22,34 @@ class ContentStoreMemoryExact(BaseContentStore):
         return None
 
     def add_content_object(self, content: Content, static: bool=False):
-        for c in self._container:
-            if content == c.content:
-                return
-        self._container.append(ContentStoreEntry(content, static=static))
+        entry = self.find_content_object(content.name)
+        if entry is not None and entry.static and not static: # static entries are not replaced by cached content
+            return
+        if entry is not None and entry.static >= static and entry.content == content:
+            return
+        if entry is not None: # a name has a single entry, which is expired by its name
+            self._container.remove(entry)
+        entry = ContentStoreEntry(content, static=static)
+        self._container.append(entry)
+        if static:
+            self._expiry.cancel(name_key(content.name))
+        else:
+            self._expiry.schedule(name_key(content.name), entry.timestamp, content.name)
 
     def remove_content_object(self, name: Name):
         rem = self.find_content_object(name)
         if rem is not None:
             self._container.remove(rem)
+            self._expiry.cancel(name_key(name))
 
     def update_timestamp(self, cs_entry: ContentStoreEntry):
         self._container.remove(cs_entry)
         cs_entry.timestamp = time.time()
         self._container.append(cs_entry)
+        if not cs_entry.static:
+            self._expiry.schedule(name_key(cs_entry.name), cs_entry.timestamp, cs_entry.name)
 
     def ageing(self):
         cur_time = time.time()
-        remove = []
-        for cs_entry in self._container:
-            if cs_entry.static is True:
-                continue
-            if cs_entry.timestamp + self._cs_timeout < cur_time:
-                remove.append(cs_entry)
-        for cs_entry in remove:
-            self.remove_content_object(cs_entry.content.name)
+        for name in self._expiry.pop_expired(cur_time - self._cs_timeout):
+            self.remove_content_object(name)
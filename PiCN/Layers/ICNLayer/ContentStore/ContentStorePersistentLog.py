@@ -0,0 +1,239 @@
+""" A persistent content store with exact matching, backed by an append-only log"""
+
+import mmap
+import os
+import pickle
+import random
+import string
+import struct
+import tempfile
+import time
+import zlib
+from typing import Dict, List
+
+from PiCN.Packets import Content, Name
+from PiCN.Layers.ICNLayer.BaseICNDataStruct import name_key
+from PiCN.Layers.ICNLayer.ContentStore import BaseContentStore, ContentStoreEntry
+from PiCN.Layers.ICNLayer.ExpiryScheduler import ExpiryScheduler
+
+
+class ContentStorePersistentLog(BaseContentStore):
+    """ A persistent content store with exact matching. Content objects are appended to a log file, an in-memory index
+    maps each name to the position of its payload in the log, which is read through a memory map. Removing a content
+    object appends a tombstone. The log is compacted during ageing once more than compaction_ratio of it is garbage.
+
+    Each record is a header (crc32, type, static flag, timestamp, name length, payload length) followed by the pickled
+    name and the payload. On opening, the log is replayed to rebuild the index. A torn or corrupt record at the end of
+    the log (e.g. after a crash while appending) is cut off. Compaction writes a new log and atomically replaces the old
+    one. Refreshed timestamps are kept in memory only, so after reopening an entry expires relative to its last write.
+    :param cs_timeout: Time interval in which a CS entry will be cached
+    :param db_path: path of the log file, a new file in the temp directory if None
+    :param compaction_ratio: fraction of garbage in the log that triggers a compaction
+    :param sync: flush each record to disk before returning
+    """
+
+    _HEADER = struct.Struct("!IBBdHI")
+    _ADD = 1
+    _REMOVE = 2
+    _MIN_COMPACTION_SIZE = 1 << 16
+    _REMAP_SIZE = 1 << 20
+
+    def __init__(self, cs_timeout: int=10, db_path: str=None, compaction_ratio: float=0.5, sync: bool=False):
+        BaseContentStore.__init__(self, cs_timeout=cs_timeout)
+        if db_path is None:
+            self.db_path = os.path.join(tempfile.gettempdir(),
+                                        ''.join(random.choice(string.ascii_lowercase) for x in range(9)) + ".cslog")
+        else:
+            self.db_path = db_path
+        self._compaction_ratio = compaction_ratio
+        self._sync = sync
+        self._container: Dict = {}  # name key -> [name, payload offset, payload length, static, record size]
+        self._expiry = ExpiryScheduler()
+        self._fd: int = None
+        self._mmap: mmap.mmap = None
+        self._size: int = 0
+        self._garbage: int = 0
+        self._open()
+
+    def close_cs(self):
+        self._unmap()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def get_db_path(self) -> str:
+        return self.db_path
+
+    def delete_all(self):
+        self._unmap()
+        os.ftruncate(self._fd, 0)
+        self._size = 0
+        self._garbage = 0
+        self._container = {}
+        self._expiry.clear()
+
+    def find_content_object(self, name: Name) -> ContentStoreEntry:
+        entry = self._container.get(name_key(name))
+        if entry is None:
+            return None
+        return self._cs_entry(entry)
+
+    def add_content_object(self, content: Content, static: bool=False):
+        key = name_key(content.name)
+        entry = self._container.get(key)
+        if entry is not None and entry[3] and not static: # static entries are not replaced by cached content
+            return
+        if entry is not None and entry[3] >= static and self._read(entry[1], entry[2]) == content.get_bytes():
+            return
+        timestamp = time.time()
+        name = pickle.dumps(content.name)
+        payload = content.get_bytes() or b''
+        offset = self._append(self._ADD, static, timestamp, name, payload)
+        if entry is not None:
+            self._garbage += entry[4]
+        self._container[key] = [content.name, offset - len(payload), len(payload), static,
+                                self._HEADER.size + len(name) + len(payload)]
+        if static:
+            self._expiry.cancel(key)
+        else:
+            self._expiry.schedule(key, timestamp, content.name)
+
+    def remove_content_object(self, name: Name):
+        key = name_key(name)
+        entry = self._container.pop(key, None)
+        if entry is None:
+            return
+        self._expiry.cancel(key)
+        pickled_name = pickle.dumps(entry[0])
+        self._append(self._REMOVE, False, time.time(), pickled_name, b'')
+        self._garbage += entry[4] + self._HEADER.size + len(pickled_name)
+
+    def update_timestamp(self, cs_entry: ContentStoreEntry):
+        key = name_key(cs_entry.name)
+        entry = self._container.get(key)
+        if entry is None or entry[3]:
+            return
+        self._expiry.schedule(key, time.time(), entry[0])
+
+    def ageing(self):
+        cur_time = time.time()
+        for name in self._expiry.pop_expired(cur_time - self._cs_timeout):
+            self.remove_content_object(name)
+        if self._size > self._MIN_COMPACTION_SIZE and self._garbage > self._size * self._compaction_ratio:
+            self.compact()
+
+    def get_container(self) -> List[ContentStoreEntry]:
+        return [self._cs_entry(entry) for entry in self._container.values()]
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {'entries': len(self._container), 'bytes': self._size, 'garbage': self._garbage}
+
+    def compact(self):
+        """Rewrite the log with the records of the current entries only"""
+        compact_path = self.db_path + ".compact"
+        fd = os.open(compact_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+        positions = []
+        try:
+            offset = 0
+            for key, entry in self._container.items():
+                timestamp = self._expiry.get_timestamp(key)
+                record = self._record(self._ADD, entry[3], timestamp if timestamp is not None else time.time(),
+                                      pickle.dumps(entry[0]), self._read(entry[1], entry[2]))
+                os.write(fd, record)
+                offset += len(record)
+                positions.append((entry, offset - entry[2], len(record)))
+            os.fsync(fd)
+        except:
+            os.close(fd)
+            os.remove(compact_path)
+            raise
+        for entry, payload_offset, record_size in positions:
+            entry[1] = payload_offset
+            entry[4] = record_size
+        self.close_cs()
+        os.replace(compact_path, self.db_path)
+        self._fd = fd
+        self._size = offset
+        self._garbage = 0
+
+    def _cs_entry(self, entry) -> ContentStoreEntry:
+        cs_entry = ContentStoreEntry(Content(entry[0], self._read(entry[1], entry[2])), static=entry[3])
+        timestamp = self._expiry.get_timestamp(name_key(entry[0]))
+        if timestamp is not None:
+            cs_entry.timestamp = timestamp
+        return cs_entry
+
+    def _read(self, offset: int, length: int) -> bytes:
+        """read from the log through the memory map. Records appended after mapping the log are read with pread, until
+        enough was appended to remap the log"""
+        if length == 0:
+            return b''
+        if self._mmap is None or offset + length > len(self._mmap):
+            if self._mmap is not None and self._size - len(self._mmap) < self._REMAP_SIZE and hasattr(os, 'pread'):
+                return os.pread(self._fd, length, offset)
+            self._unmap()
+            self._mmap = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)
+        return self._mmap[offset:offset + length]
+
+    def _unmap(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _record(self, type: int, static: bool, timestamp: float, name: bytes, payload: bytes) -> bytes:
+        header = self._HEADER.pack(0, type, static, timestamp, len(name), len(payload))
+        crc = zlib.crc32(payload, zlib.crc32(name, zlib.crc32(header[4:])))
+        return struct.pack("!I", crc) + header[4:] + name + payload
+
+    def _append(self, type: int, static: bool, timestamp: float, name: bytes, payload: bytes) -> int:
+        """append a record to the log
+        :return: end offset of the record
+        """
+        record = self._record(type, static, timestamp, name, payload)
+        os.write(self._fd, record)
+        if self._sync:
+            os.fsync(self._fd)
+        self._size += len(record)
+        return self._size
+
+    def _open(self):
+        """open the log and rebuild the index from it, cutting off a torn or corrupt tail"""
+        self._fd = os.open(self.db_path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        size = os.fstat(self._fd).st_size
+        if size == 0:
+            return
+        log = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)
+        try:
+            offset = self._replay(log, size)
+        finally:
+            log.close()
+        if offset < size:
+            os.ftruncate(self._fd, offset)
+        self._size = offset
+
+    def _replay(self, log: mmap.mmap, size: int) -> int:
+        """rebuild the index from the records of the log
+        :return: end offset of the last valid record
+        """
+        offset = 0
+        header_size = self._HEADER.size
+        while offset + header_size <= size:
+            crc, type, static, timestamp, name_length, payload_length = self._HEADER.unpack_from(log, offset)
+            end = offset + header_size + name_length + payload_length
+            if end > size or type not in (self._ADD, self._REMOVE) or \
+                    zlib.crc32(log[offset + 4:end]) != crc:
+                break
+            name: Name = pickle.loads(log[offset + header_size:offset + header_size + name_length])
+            key = name_key(name)
+            old_entry = self._container.pop(key, None)
+            if old_entry is not None:
+                self._garbage += old_entry[4]
+                self._expiry.cancel(key)
+            if type == self._ADD:
+                self._container[key] = [name, end - payload_length, payload_length, bool(static), end - offset]
+                if not static:
+                    self._expiry.schedule(key, timestamp, name)
+            else:
+                self._garbage += end - offset
+            offset = end
+        return offset
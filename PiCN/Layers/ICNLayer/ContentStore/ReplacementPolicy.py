@@ -0,0 +1,198 @@
+"""Replacement Policies deciding which entry a bounded Content Store evicts"""
+
+import abc
+from collections import OrderedDict
+from typing import Dict
+
+
+class BaseReplacementPolicy(object):
+    """Abstract Replacement Policy. Tracks the keys of all evictable entries of a content store"""
+
+    @abc.abstractmethod
+    def insert(self, key):
+        """
+        A new entry was added
+        :param key: key of the entry
+        :return: None
+        """
+
+    @abc.abstractmethod
+    def access(self, key):
+        """
+        An entry was requested
+        :param key: key of the entry
+        :return: None
+        """
+
+    @abc.abstractmethod
+    def remove(self, key):
+        """
+        An entry was removed without being evicted (e.g. by ageing or because it was pinned)
+        :param key: key of the entry
+        :return: None
+        """
+
+    @abc.abstractmethod
+    def evict(self):
+        """
+        Choose an entry to be evicted and stop tracking it
+        :return: key of the entry or None if no entry is tracked
+        """
+
+    @abc.abstractmethod
+    def __len__(self):
+        """number of tracked keys"""
+
+    def __contains__(self, key):
+        return False
+
+
+class LRUReplacementPolicy(BaseReplacementPolicy):
+    """Evict the least recently used entry"""
+
+    def __init__(self):
+        self._keys: OrderedDict = OrderedDict()
+
+    def insert(self, key):
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+
+    def access(self, key):
+        if key in self._keys:
+            self._keys.move_to_end(key)
+
+    def remove(self, key):
+        self._keys.pop(key, None)
+
+    def evict(self):
+        if not self._keys:
+            return None
+        key, _ = self._keys.popitem(last=False)
+        return key
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+
+class LFUReplacementPolicy(BaseReplacementPolicy):
+    """Evict the least frequently used entry, the least recently used one if several entries have the same frequency.
+    Keys are kept in one bucket per frequency, so all operations are O(1).
+    """
+
+    def __init__(self):
+        self._frequencies: Dict = {}
+        self._buckets: Dict[int, OrderedDict] = {}
+        self._min_frequency: int = 0
+
+    def insert(self, key):
+        self.remove(key)
+        self._frequencies[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_frequency = 1
+
+    def access(self, key):
+        frequency = self._frequencies.get(key)
+        if frequency is None:
+            return
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+            if self._min_frequency == frequency:
+                self._min_frequency = frequency + 1
+        self._frequencies[key] = frequency + 1
+        self._buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+
+    def remove(self, key):
+        frequency = self._frequencies.pop(key, None)
+        if frequency is None:
+            return
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+            if self._min_frequency == frequency and self._buckets:
+                self._min_frequency = min(self._buckets.keys())
+
+    def evict(self):
+        if not self._frequencies:
+            return None
+        bucket = self._buckets[self._min_frequency]
+        key, _ = bucket.popitem(last=False)
+        del self._frequencies[key]
+        if not bucket:
+            del self._buckets[self._min_frequency]
+            if self._buckets:
+                self._min_frequency = min(self._buckets.keys())
+        return key
+
+    def __len__(self):
+        return len(self._frequencies)
+
+    def __contains__(self, key):
+        return key in self._frequencies
+
+
+class ARCReplacementPolicy(BaseReplacementPolicy):
+    """Adaptive Replacement Cache. Balances between entries requested once (recency) and entries requested more
+    often (frequency), using ghost lists of recently evicted keys to adapt the target size of the recency list.
+    Since the content store is bounded by entries and bytes, the number of tracked entries is used as cache size.
+    """
+
+    def __init__(self):
+        self._t1: OrderedDict = OrderedDict()
+        self._t2: OrderedDict = OrderedDict()
+        self._b1: OrderedDict = OrderedDict()
+        self._b2: OrderedDict = OrderedDict()
+        self._p: float = 0
+
+    def insert(self, key):
+        self.remove(key)
+        size = max(1, len(self))
+        if key in self._b1:
+            self._p = min(self._p + max(1, len(self._b2) / len(self._b1)), size)
+            del self._b1[key]
+            self._t2[key] = None
+        elif key in self._b2:
+            self._p = max(self._p - max(1, len(self._b1) / len(self._b2)), 0)
+            del self._b2[key]
+            self._t2[key] = None
+        else:
+            self._t1[key] = None
+
+    def access(self, key):
+        if key in self._t1:
+            del self._t1[key]
+            self._t2[key] = None
+        elif key in self._t2:
+            self._t2.move_to_end(key)
+
+    def remove(self, key):
+        self._t1.pop(key, None)
+        self._t2.pop(key, None)
+
+    def evict(self):
+        if not self._t1 and not self._t2:
+            return None
+        if self._t1 and (len(self._t1) > self._p or not self._t2):
+            key, _ = self._t1.popitem(last=False)
+            self._b1[key] = None
+        else:
+            key, _ = self._t2.popitem(last=False)
+            self._b2[key] = None
+        size = max(1, len(self))
+        while len(self._b1) + len(self._b2) > size:
+            if len(self._b1) > len(self._b2):
+                self._b1.popitem(last=False)
+            else:
+                self._b2.popitem(last=False)
+        return key
+
+    def __len__(self):
+        return len(self._t1) + len(self._t2)
+
+    def __contains__(self, key):
+        return key in self._t1 or key in self._t2
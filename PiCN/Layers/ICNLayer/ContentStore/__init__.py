@@ -1,4 +1,7 @@
 from .BaseContentStore import BaseContentStore
 from .BaseContentStore import ContentStoreEntry
 from .ContentStoreMemoryExact import ContentStoreMemoryExact
-from .ContentStorePersistentExact import ContentStorePersistentExact
\ No newline at end of file
+from .ContentStorePersistentExact import ContentStorePersistentExact
+from .ContentStorePersistentLog import ContentStorePersistentLog
+from .ContentStoreMemoryBounded import ContentStoreMemoryBounded
+from .ReplacementPolicy import BaseReplacementPolicy, LRUReplacementPolicy, LFUReplacementPolicy, ARCReplacementPolicy
@@ -0,0 +1,171 @@
+"""Tests for the bounded in Memory Content Store"""
+
+import time
+import unittest
+
+from PiCN.Layers.ICNLayer.ContentStore import ContentStoreMemoryBounded, LFUReplacementPolicy
+from PiCN.Packets import Content, Name
+
+
+class test_ContentStoreMemoryBounded(unittest.TestCase):
+
+    def setUp(self):
+        self.cs = ContentStoreMemoryBounded()
+
+    def tearDown(self):
+        pass
+
+    def test_add_content_to_cs(self):
+        """Test adding data to CS"""
+        c = Content("/test/data", "Hello World")
+        self.cs.add_content_object(c)
+        entry = self.cs.get_container()[0]
+        self.assertEqual(entry.content, c)
+        self.assertEqual(self.cs.find_content_object(c.name).content, c)
+        self.assertEqual(self.cs.get_container_size(), 1)
+
+    def test_add_same_content_twice(self):
+        """Test adding the same content object twice"""
+        c = Content("/test/data", "Hello World")
+        self.cs.add_content_object(c)
+        self.cs.add_content_object(Content("/test/data", "Hello World"))
+        self.assertEqual(self.cs.get_container_size(), 1)
+        self.assertEqual(self.cs.get_statistics()['bytes'], 11)
+
+    def test_replace_content(self):
+        """Test adding a different content object with the same name"""
+        self.cs.add_content_object(Content("/test/data", "Hello World"))
+        self.cs.add_content_object(Content("/test/data", "Goodbye"))
+        self.assertEqual(self.cs.get_container_size(), 1)
+        self.assertEqual(self.cs.find_content_object(Name("/test/data")).content.content, "Goodbye")
+        self.assertEqual(self.cs.get_statistics()['bytes'], 7)
+
+    def test_find_content_no_match(self):
+        """Test searching data not in the CS"""
+        self.cs.add_content_object(Content("/test/data", "Hello World"))
+        self.assertIsNone(self.cs.find_content_object(Name("/data/test")))
+
+    def test_remove_content_from_cs(self):
+        """Test adding and removing data from CS"""
+        c = Content("/test/data", "Hello World")
+        self.cs.add_content_object(c)
+        self.cs.remove_content_object(c.name)
+        self.cs.remove_content_object(c.name)
+        self.assertEqual(self.cs.get_container_size(), 0)
+        self.assertEqual(self.cs.get_statistics()['bytes'], 0)
+
+    def test_max_entries_lru(self):
+        """Test that the least recently used entry is evicted if the number of entries is exceeded"""
+        self.cs = ContentStoreMemoryBounded(max_entries=2)
+        self.cs.add_content_object(Content("/test/1", "a"))
+        self.cs.add_content_object(Content("/test/2", "b"))
+        self.cs.find_content_object(Name("/test/1"))
+        self.cs.add_content_object(Content("/test/3", "c"))
+        self.assertEqual(self.cs.get_container_size(), 2)
+        self.assertIsNotNone(self.cs.find_content_object(Name("/test/1")))
+        self.assertIsNone(self.cs.find_content_object(Name("/test/2")))
+        self.assertIsNotNone(self.cs.find_content_object(Name("/test/3")))
+        self.assertEqual(self.cs.get_statistics()['evictions'], 1)
+
+    def test_max_bytes(self):
+        """Test that entries are evicted if the payload size is exceeded"""
+        self.cs = ContentStoreMemoryBounded(max_bytes=10)
+        self.cs.add_content_object(Content("/test/1", "aaaa"))
+        self.cs.add_content_object(Content("/test/2", "bbbb"))
+        self.cs.add_content_object(Content("/test/3", "cccc"))
+        self.assertEqual(self.cs.get_container_size(), 2)
+        self.assertIsNone(self.cs.find_content_object(Name("/test/1")))
+        self.assertEqual(self.cs.get_statistics()['bytes'], 8)
+
+    def test_content_larger_than_max_bytes(self):
+        """Test that content larger than the CS is not cached"""
+        self.cs = ContentStoreMemoryBounded(max_bytes=3)
+        self.cs.add_content_object(Content("/test/1", "abc"))
+        self.cs.add_content_object(Content("/test/2", "abcd"))
+        self.assertIsNotNone(self.cs.find_content_object(Name("/test/1")))
+        self.assertIsNone(self.cs.find_content_object(Name("/test/2")))
+        self.assertEqual(self.cs.get_statistics()['evictions'], 0)
+
+    def test_static_entries_pinned(self):
+        """Test that static entries are never evicted"""
+        self.cs = ContentStoreMemoryBounded(max_entries=2)
+        self.cs.add_content_object(Content("/test/static", "s"), static=True)
+        self.cs.add_content_object(Content("/test/1", "a"))
+        self.cs.add_content_object(Content("/test/2", "b"))
+        self.assertIsNotNone(self.cs.find_content_object(Name("/test/static")))
+        self.assertIsNone(self.cs.find_content_object(Name("/test/1")))
+        self.assertIsNotNone(self.cs.find_content_object(Name("/test/2")))
+        self.cs.add_content_object(Content("/test/static2", "s"), static=True)
+        self.cs.add_content_object(Content("/test/static3", "s"), static=True)
+        self.assertEqual(self.cs.get_container_size(), 3)
+        self.assertIsNone(self.cs.find_content_object(Name("/test/2")))
+
+    def test_pin_existing_entry(self):
+        """Test that adding an existing entry as static pins it"""
+        self.cs = ContentStoreMemoryBounded(max_entries=1)
+        self.cs.add_content_object(Content("/test/1", "a"))
+        self.cs.add_content_object(Content("/test/1", "a"), static=True)
+        self.cs.add_content_object(Content("/test/2", "b"))
+        self.assertIsNotNone(self.cs.find_content_object(Name("/test/1")))
+        self.assertIsNone(self.cs.find_content_object(Name("/test/2")))
+
+    def test_static_entry_not_replaced(self):
+        """Test that a static entry is not replaced by cached content with the same name"""
+        self.cs = ContentStoreMemoryBounded(max_entries=1)
+        self.cs.add_content_object(Content("/test/1", "a"), static=True)
+        self.cs.add_content_object(Content("/test/1", "b"))
+        entry = self.cs.find_content_object(Name("/test/1"))
+        self.assertEqual(entry.content.content, "a")
+        self.assertTrue(entry.static)
+        self.cs.add_content_object(Content("/test/1", "c"), static=True)
+        self.assertEqual(self.cs.find_content_object(Name("/test/1")).content.content, "c")
+        self.assertEqual(self.cs.get_container_size(), 1)
+
+    def test_set_max_entries(self):
+        """Test that lowering the bound evicts entries"""
+        for i in range(5):
+            self.cs.add_content_object(Content("/test/" + str(i), "a"))
+        self.cs.set_max_entries(2)
+        self.assertEqual(self.cs.get_container_size(), 2)
+        self.assertIsNotNone(self.cs.find_content_object(Name("/test/4")))
+
+    def test_lfu_policy(self):
+        """Test the CS with a least frequently used policy"""
+        self.cs = ContentStoreMemoryBounded(max_entries=2, replacement_policy=LFUReplacementPolicy())
+        self.cs.add_content_object(Content("/test/1", "a"))
+        self.cs.add_content_object(Content("/test/2", "b"))
+        self.cs.find_content_object(Name("/test/1"))
+        self.cs.find_content_object(Name("/test/1"))
+        self.cs.find_content_object(Name("/test/2"))
+        self.cs.add_content_object(Content("/test/3", "c"))
+        self.assertIsNotNone(self.cs.find_content_object(Name("/test/1")))
+        self.assertIsNone(self.cs.find_content_object(Name("/test/2")))
+
+    def test_statistics(self):
+        """Test hit and miss counters"""
+        self.cs.add_content_object(Content("/test/data", "Hello World"))
+        self.cs.find_content_object(Name("/test/data"))
+        self.cs.find_content_object(Name("/test/data"))
+        self.cs.find_content_object(Name("/data/test"))
+        statistics = self.cs.get_statistics()
+        self.assertEqual(statistics['hits'], 2)
+        self.assertEqual(statistics['misses'], 1)
+        self.assertEqual(statistics['entries'], 1)
+
+    def test_ageing(self):
+        """Test that ageing removes expired entries only and keeps static entries"""
+        self.cs.set_cs_timeout(0.2)
+        self.cs.add_content_object(Content("/test/1", "a"))
+        self.cs.add_content_object(Content("/test/static", "s"), static=True)
+        time.sleep(0.3)
+        self.cs.add_content_object(Content("/test/2", "b"))
+        self.cs.ageing()
+        self.assertIsNone(self.cs.find_content_object(Name("/test/1")))
+        self.assertIsNotNone(self.cs.find_content_object(Name("/test/2")))
+        self.assertIsNotNone(self.cs.find_content_object(Name("/test/static")))
+        self.assertEqual(self.cs.get_statistics()['evictions'], 0)
+
+    def test_find_content_not_a_name(self):
+        """Test searching with a string instead of a name, which never matches like with exact matching"""
+        self.cs.add_content_object(Content("/test/data", "Hello World"))
+        self.assertIsNone(self.cs.find_content_object("/test/data"))
@@ -1,5 +1,6 @@
 """Tests for the in Memory Content Store with exact matching"""
 
+import time
 import unittest
 
 from PiCN.Layers.ICNLayer.ContentStore.ContentStoreMemoryExact import ContentStoreMemoryExact
@@ -81,4 +82,54 @@ class test_ContentStoreMemoryExact(unittest.TestCase):
         self.assertEqual(entry, c)
         self.assertEqual(len(self.cs.get_container()), 1)
         self.cs.remove_content_object(c.name)
-        self.assertEqual(len(self.cs.get_container()), 0)
\ No newline at end of file
+        self.assertEqual(len(self.cs.get_container()), 0)
+
+    def test_ageing(self):
+        """Test that ageing removes expired entries only and keeps static entries"""
+        self.cs.set_cs_timeout(0.2)
+        c1 = Content("/test/data", "Hello World")
+        c2 = Content("/data/test", "Goodbye")
+        c3 = Content("/data/static", "Static")
+        self.cs.add_content_object(c1)
+        self.cs.add_content_object(c3, static=True)
+        time.sleep(0.3)
+        self.cs.add_content_object(c2)
+        self.cs.ageing()
+        self.assertIsNone(self.cs.find_content_object(c1.name))
+        self.assertIsNotNone(self.cs.find_content_object(c2.name))
+        self.assertIsNotNone(self.cs.find_content_object(c3.name))
+
+    def test_ageing_after_update_timestamp(self):
+        """Test that updating the timestamp postpones the removal of an entry"""
+        self.cs.set_cs_timeout(0.2)
+        c = Content("/test/data", "Hello World")
+        self.cs.add_content_object(c)
+        time.sleep(0.3)
+        self.cs.update_timestamp(self.cs.find_content_object(c.name))
+        self.cs.ageing()
+        self.assertIsNotNone(self.cs.find_content_object(c.name))
+        time.sleep(0.3)
+        self.cs.ageing()
+        self.assertIsNone(self.cs.find_content_object(c.name))
+
+    def test_add_content_with_same_name(self):
+        """Test that content with the name of an entry replaces the entry, which is expired by the new entry"""
+        self.cs.set_cs_timeout(0.2)
+        c1 = Content("/test/data", "Hello World")
+        c2 = Content("/test/data", "Goodbye")
+        self.cs.add_content_object(c1)
+        self.cs.add_content_object(c2)
+        self.assertEqual(len(self.cs.get_container()), 1)
+        self.assertEqual(self.cs.find_content_object(c1.name).content, c2)
+        time.sleep(0.3)
+        self.cs.ageing()
+        self.assertEqual(len(self.cs.get_container()), 0)
+
+    def test_static_entry_not_replaced(self):
+        """Test that cached content does not replace a static entry with the same name"""
+        c1 = Content("/test/data", "Static")
+        c2 = Content("/test/data", "Cached")
+        self.cs.add_content_object(c1, static=True)
+        self.cs.add_content_object(c2)
+        self.assertEqual(len(self.cs.get_container()), 1)
+        self.assertEqual(self.cs.find_content_object(c1.name).content, c1)
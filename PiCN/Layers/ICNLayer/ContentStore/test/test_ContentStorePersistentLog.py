@@ -0,0 +1,150 @@
+"""Tests for the persistent Content Store backed by an append-only log"""
+
+import os
+import time
+import unittest
+
+from PiCN.Layers.ICNLayer.ContentStore import ContentStorePersistentLog
+from PiCN.Packets import Content, Name
+
+
+class test_ContentStorePersistentLog(unittest.TestCase):
+
+    def setUp(self):
+        self.cs = ContentStorePersistentLog()
+        self.db_path = self.cs.get_db_path()
+
+    def tearDown(self):
+        self.cs.close_cs()
+        os.remove(self.db_path)
+
+    def reopen(self) -> ContentStorePersistentLog:
+        self.cs.close_cs()
+        self.cs = ContentStorePersistentLog(db_path=self.db_path)
+        return self.cs
+
+    def test_find_content_to_cs(self):
+        """Test adding and searching data to CS"""
+        c = Content("/test/data", "Hello World")
+        self.cs.add_content_object(c)
+        fc = self.cs.find_content_object(c.name)
+        self.assertEqual(fc.content, c)
+        self.assertIsNone(self.cs.find_content_object(Name("/data/test")))
+        self.assertEqual(self.cs.get_container_size(), 1)
+
+    def test_remove_content_from_cs(self):
+        """Test adding and removing data from CS"""
+        c = Content("/test/data", "Hello World")
+        self.cs.add_content_object(c)
+        self.cs.remove_content_object(c.name)
+        self.assertIsNone(self.cs.find_content_object(c.name))
+        self.cs.remove_content_object(c.name)
+
+    def test_replace_content(self):
+        """Test replacing a content object by a new one with the same name"""
+        self.cs.add_content_object(Content("/test/data", "Hello World"))
+        self.cs.add_content_object(Content("/test/data", "Other"))
+        self.assertEqual(self.cs.find_content_object(Name("/test/data")).content, Content("/test/data", "Other"))
+        self.assertEqual(self.cs.get_container_size(), 1)
+        self.assertGreater(self.cs.get_statistics()['garbage'], 0)
+
+    def test_static_entry_not_replaced(self):
+        """Test that a static entry is not replaced by cached content with the same name"""
+        self.cs.add_content_object(Content("/test/data", "Hello World"), static=True)
+        self.cs.add_content_object(Content("/test/data", "Other"))
+        entry = self.cs.find_content_object(Name("/test/data"))
+        self.assertEqual(entry.content.content, "Hello World")
+        self.assertTrue(entry.static)
+        self.cs.add_content_object(Content("/test/data", "Other"), static=True)
+        self.assertEqual(self.cs.find_content_object(Name("/test/data")).content.content, "Other")
+
+    def test_restored(self):
+        """Test that adds and removes are restored after reopening the CS"""
+        names = [Name("/test/data/" + str(i)).setDigest(b"1" * 32) for i in range(10)]
+        for name in names:
+            self.cs.add_content_object(Content(name, "Hello World" + name.to_string()), static=True)
+        self.cs.remove_content_object(names[3])
+        self.cs.add_content_object(Content(names[4], "Ignored"))
+        self.cs.remove_content_object(names[4])
+        self.cs.add_content_object(Content(names[4], "Other"))
+        cs = self.reopen()
+        self.assertEqual(cs.get_container_size(), 9)
+        self.assertIsNone(cs.find_content_object(names[3]))
+        self.assertEqual(cs.find_content_object(names[4]).content, Content(names[4], "Other"))
+        self.assertFalse(cs.find_content_object(names[4]).static)
+        self.assertEqual(cs.find_content_object(names[5]).content, Content(names[5], "Hello World" + names[5].to_string()))
+        self.assertTrue(cs.find_content_object(names[5]).static)
+        self.assertEqual(cs.find_content_object(names[5]).name.digest, b"1" * 32)
+
+    def test_torn_tail(self):
+        """Test that a partially written record at the end of the log is cut off when reopening"""
+        self.cs.add_content_object(Content("/test/data1", "Hello World"))
+        self.cs.add_content_object(Content("/test/data2", "Hello World"))
+        size = os.path.getsize(self.db_path)
+        self.cs.close_cs()
+        with open(self.db_path, "r+b") as f:
+            f.truncate(size - 3)
+        cs = ContentStorePersistentLog(db_path=self.db_path)
+        self.cs = cs
+        self.assertIsNotNone(cs.find_content_object(Name("/test/data1")))
+        self.assertIsNone(cs.find_content_object(Name("/test/data2")))
+        cs.add_content_object(Content("/test/data3", "Hello World"))
+        cs = self.reopen()
+        self.assertIsNotNone(cs.find_content_object(Name("/test/data3")))
+        self.assertEqual(cs.get_container_size(), 2)
+
+    def test_corrupt_record(self):
+        """Test that a record with a wrong checksum ends the log"""
+        self.cs.add_content_object(Content("/test/data1", "Hello World"))
+        self.cs.add_content_object(Content("/test/data2", "Hello World"))
+        size = os.path.getsize(self.db_path)
+        self.cs.close_cs()
+        with open(self.db_path, "r+b") as f:
+            f.seek(size - 1)
+            f.write(b"x")
+        cs = ContentStorePersistentLog(db_path=self.db_path)
+        self.cs = cs
+        self.assertEqual(cs.get_container_size(), 1)
+        self.assertLess(os.path.getsize(self.db_path), size)
+
+    def test_ageing(self):
+        """Test that only non-static entries expire"""
+        self.cs.set_cs_timeout(0.1)
+        self.cs.add_content_object(Content("/test/data1", "Hello World"))
+        self.cs.add_content_object(Content("/test/data2", "Hello World"), static=True)
+        self.cs.add_content_object(Content("/test/data3", "Hello World"))
+        time.sleep(0.2)
+        self.cs.update_timestamp(self.cs.find_content_object(Name("/test/data3")))
+        self.cs.ageing()
+        self.assertIsNone(self.cs.find_content_object(Name("/test/data1")))
+        self.assertIsNotNone(self.cs.find_content_object(Name("/test/data2")))
+        self.assertIsNotNone(self.cs.find_content_object(Name("/test/data3")))
+
+    def test_compaction(self):
+        """Test that ageing compacts the log once it is mostly garbage and that the compacted log is restored"""
+        payload = b"x" * 1000
+        for i in range(100):
+            self.cs.add_content_object(Content("/test/data/" + str(i), payload), static=i < 10)
+        for i in range(10, 100):
+            self.cs.remove_content_object(Name("/test/data/" + str(i)))
+        size = os.path.getsize(self.db_path)
+        self.cs.ageing()
+        self.assertLess(os.path.getsize(self.db_path), size / 5)
+        self.assertEqual(self.cs.get_statistics()['garbage'], 0)
+        self.assertEqual(self.cs.find_content_object(Name("/test/data/5")).content, Content("/test/data/5", payload))
+        self.cs.add_content_object(Content("/test/data/200", payload))
+        cs = self.reopen()
+        self.assertEqual(cs.get_container_size(), 11)
+        self.assertEqual(cs.find_content_object(Name("/test/data/200")).content, Content("/test/data/200", payload))
+        self.assertTrue(cs.find_content_object(Name("/test/data/5")).static)
+        self.assertFalse(os.path.exists(self.db_path + ".compact"))
+
+    def test_delete_all(self):
+        """Test deleting all entries"""
+        self.cs.add_content_object(Content("/test/data", "Hello World"))
+        self.cs.delete_all()
+        self.assertEqual(self.cs.get_container_size(), 0)
+        self.cs.add_content_object(Content("/test/data2", "Hello World"))
+        cs = self.reopen()
+        self.assertEqual(cs.get_container_size(), 1)
+        self.assertIsNotNone(cs.find_content_object(Name("/test/data2")))
@@ -0,0 +1,95 @@
+"""Tests for the Replacement Policies of the bounded Content Store"""
+
+import unittest
+
+from PiCN.Layers.ICNLayer.ContentStore import LRUReplacementPolicy, LFUReplacementPolicy, ARCReplacementPolicy
+
+
+class test_LRUReplacementPolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = LRUReplacementPolicy()
+
+    def test_evict_least_recently_used(self):
+        """Test that the least recently accessed key is evicted first"""
+        for key in ["a", "b", "c"]:
+            self.policy.insert(key)
+        self.policy.access("a")
+        self.assertEqual(self.policy.evict(), "b")
+        self.assertEqual(self.policy.evict(), "c")
+        self.assertEqual(self.policy.evict(), "a")
+        self.assertIsNone(self.policy.evict())
+
+    def test_remove(self):
+        """Test that removed keys are not evicted"""
+        self.policy.insert("a")
+        self.policy.insert("b")
+        self.policy.remove("a")
+        self.assertEqual(len(self.policy), 1)
+        self.assertEqual(self.policy.evict(), "b")
+
+
+class test_LFUReplacementPolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = LFUReplacementPolicy()
+
+    def test_evict_least_frequently_used(self):
+        """Test that the least frequently accessed key is evicted first, ties are broken by recency"""
+        for key in ["a", "b", "c"]:
+            self.policy.insert(key)
+        self.policy.access("a")
+        self.policy.access("a")
+        self.policy.access("b")
+        self.assertEqual(self.policy.evict(), "c")
+        self.assertEqual(self.policy.evict(), "b")
+        self.assertEqual(self.policy.evict(), "a")
+        self.assertIsNone(self.policy.evict())
+
+    def test_insert_resets_frequency(self):
+        """Test that a newly inserted key has the lowest frequency"""
+        self.policy.insert("a")
+        self.policy.access("a")
+        self.policy.insert("b")
+        self.assertEqual(self.policy.evict(), "b")
+
+    def test_remove(self):
+        """Test that removing the only key of the lowest frequency keeps eviction working"""
+        self.policy.insert("a")
+        self.policy.access("a")
+        self.policy.insert("b")
+        self.policy.remove("b")
+        self.assertNotIn("b", self.policy)
+        self.assertEqual(self.policy.evict(), "a")
+
+
+class test_ARCReplacementPolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = ARCReplacementPolicy()
+
+    def test_frequent_keys_survive_scan(self):
+        """Test that keys accessed more than once are kept while a scan of new keys passes through"""
+        self.policy.insert("hot")
+        self.policy.access("hot")
+        for i in range(10):
+            self.policy.insert("scan" + str(i))
+            self.assertEqual(self.policy.evict(), "scan" + str(i))
+        self.assertIn("hot", self.policy)
+
+    def test_ghost_hit_adapts(self):
+        """Test that a key evicted recently is reinserted as frequent key"""
+        self.policy.insert("a")
+        self.policy.insert("b")
+        self.assertEqual(self.policy.evict(), "a")
+        self.policy.insert("a")
+        self.assertIn("a", self.policy._t2)
+        self.assertGreater(self.policy._p, 0)
+
+    def test_evict_empty(self):
+        """Test evicting from an empty policy"""
+        self.assertIsNone(self.policy.evict())
+        self.policy.insert("a")
+        self.policy.remove("a")
+        self.assertIsNone(self.policy.evict())
+        self.assertEqual(len(self.policy), 0)
@@ -0,0 +1,80 @@
+"""Expiry Scheduler for ICN Data Structs"""
+
+import heapq
+import itertools
+from typing import Dict, List
+
+
+class ExpiryScheduler(object):
+    """Min-heap of keys ordered by a timestamp, used by data structs to find expired entries without iterating over
+    all entries. Tables with a uniform timeout schedule an entry at its last refresh time and ask for everything that
+    was scheduled before cur_time - timeout, so a changed timeout applies to all entries.
+    Rescheduling or cancelling a key only invalidates its heap item, the item is discarded when it reaches the top.
+    """
+
+    def __init__(self):
+        self._heap: List[list] = []
+        self._items: Dict = {}
+        self._counter = itertools.count()
+
+    def schedule(self, key, timestamp: float, item=None):
+        """schedule a key, replaces an already scheduled timestamp of the key
+        :param key: hashable key identifying the entry, must not be None
+        :param timestamp: time the key is ordered by
+        :param item: object returned when the key expires, the key itself if None
+        """
+        self.cancel(key)
+        heap_item = [timestamp, next(self._counter), key, key if item is None else item]
+        self._items[key] = heap_item
+        heapq.heappush(self._heap, heap_item)
+        if len(self._heap) > 2 * len(self._items) + 64:
+            self._compact()
+
+    def cancel(self, key):
+        """cancel a scheduled key, nothing happens if the key is not scheduled
+        :param key: key to be cancelled
+        """
+        heap_item = self._items.pop(key, None)
+        if heap_item is not None:
+            heap_item[2] = None
+            heap_item[3] = None
+
+    def get_timestamp(self, key) -> float:
+        """get the timestamp a key is scheduled at
+        :param key: key to look up
+        :return: the timestamp or None if the key is not scheduled
+        """
+        heap_item = self._items.get(key)
+        if heap_item is None:
+            return None
+        return heap_item[0]
+
+    def pop_expired(self, timestamp: float) -> List:
+        """remove and return all keys scheduled before a timestamp
+        :param timestamp: keys scheduled strictly before this time are expired
+        :return: items of the expired keys, ordered by their timestamp
+        """
+        expired = []
+        while self._heap and self._heap[0][0] < timestamp:
+            _, _, key, item = heapq.heappop(self._heap)
+            if key is None:
+                continue
+            del self._items[key]
+            expired.append(item)
+        return expired
+
+    def clear(self):
+        """remove all scheduled keys"""
+        self._heap = []
+        self._items = {}
+
+    def _compact(self):
+        """drop invalidated heap items"""
+        self._heap = [heap_item for heap_item in self._heap if heap_item[2] is not None]
+        heapq.heapify(self._heap)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
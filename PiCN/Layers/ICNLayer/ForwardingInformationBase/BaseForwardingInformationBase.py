@@ -11,6 +11,8 @@ from PiCN.Layers.ICNLayer import BaseICNDataStruct
 class ForwardingInformationBaseEntry(object):
     """An entry in the Forwarding Information Base"""
 
+    __slots__ = ('_name', '_faceid', '_static')
+
     def __init__(self, name: Name, faceid: int, static: bool=False):
         self._name: Name = name
         self._faceid: int = faceid
@@ -76,4 +78,12 @@ class BaseForwardingInformationBase(BaseICNDataStruct):
     def clear(self):
         """Remove all non-static entries from the FIB"""
 
+    def rebuild(self, entries: List[ForwardingInformationBaseEntry]):
+        """Replace all non-static entries of the FIB, e.g. with routes computed from a RIB
+        :param entries: entries to be added after removing all non-static entries
+        """
+        self.clear()
+        for fib_entry in entries:
+            self.add_fib_entry(fib_entry.name, fib_entry.faceid, fib_entry.static)
+
 
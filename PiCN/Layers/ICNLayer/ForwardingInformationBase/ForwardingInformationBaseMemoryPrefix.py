@@ -38,6 +38,4 @@ class ForwardingInformationBaseMemoryPrefix(BaseForwardingInformationBase):
                 self._container.remove(fib_entry)
 
     def clear(self):
-        for fib_entry in self._container:
-            if not fib_entry.static:
-                self._container.remove(fib_entry)
+        self._container = [fib_entry for fib_entry in self._container if fib_entry.static]
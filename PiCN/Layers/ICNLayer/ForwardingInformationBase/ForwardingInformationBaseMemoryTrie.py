@@ -0,0 +1,118 @@
+""" A in memory Forwarding Information Base using longest matching on a name component trie"""
+
+from typing import Dict, List
+
+from PiCN.Layers.ICNLayer.ForwardingInformationBase.BaseForwardingInformationBase import BaseForwardingInformationBase, \
+    ForwardingInformationBaseEntry
+from PiCN.Packets import Name
+
+
+class ForwardingInformationBaseTrieNode(object):
+    """A node in the FIB trie, representing the prefix of all components on the path from the root"""
+
+    def __init__(self):
+        self.children: Dict[bytes, 'ForwardingInformationBaseTrieNode'] = {}
+        self.entries: List[ForwardingInformationBaseEntry] = []
+
+
+class ForwardingInformationBaseMemoryTrie(BaseForwardingInformationBase):
+    """A in memory Forwarding Information Base using longest matching. Each name component is a node in a trie,
+    next hops are stored at the node of their prefix. A lookup walks down the trie once and then tries the matching
+    prefixes from the longest to the shortest, so it does not depend on the number of entries.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._root = ForwardingInformationBaseTrieNode()
+        self._size: int = 0
+
+    def find_fib_entry(self, name: Name, already_used: List[ForwardingInformationBaseEntry] = None,
+                       incoming_faceids: List[int]=None) -> ForwardingInformationBaseEntry:
+        matches: List[ForwardingInformationBaseTrieNode] = []
+        node = self._root
+        for component in name.components:
+            node = node.children.get(component)
+            if node is None:
+                break
+            if node.entries:
+                matches.append(node)
+        for node in reversed(matches):
+            for fib_entry in node.entries:
+                if already_used and fib_entry in already_used:
+                    continue
+                if incoming_faceids is not None and fib_entry.faceid in incoming_faceids:
+                    continue
+                return fib_entry
+        return None
+
+    def add_fib_entry(self, name: Name, faceid: int, static: bool=False):
+        fib_entry = ForwardingInformationBaseEntry(name, faceid, static)
+        node = self._root
+        for component in name.components:
+            child = node.children.get(component)
+            if child is None:
+                child = ForwardingInformationBaseTrieNode()
+                node.children[component] = child
+            node = child
+        if fib_entry not in node.entries:
+            node.entries.insert(0, fib_entry)
+            self._size += 1
+
+    def remove_fib_entry(self, name: Name):
+        path = [self._root]
+        for component in name.components:
+            node = path[-1].children.get(component)
+            if node is None:
+                return
+            path.append(node)
+        self._size -= len(path[-1].entries)
+        path[-1].entries = []
+        self._prune(name.components, path)
+
+    def clear(self):
+        self._clear_node(self._root)
+
+    def get_container_size(self) -> int:
+        return self._size
+
+    @property
+    def container(self) -> List[ForwardingInformationBaseEntry]:
+        """all entries, longer prefixes first"""
+        entries: List[ForwardingInformationBaseEntry] = []
+        self._collect(self._root, entries)
+        return entries
+
+    @container.setter
+    def container(self, container: List[ForwardingInformationBaseEntry]):
+        self._root = ForwardingInformationBaseTrieNode()
+        self._size = 0
+        if container is None:
+            return
+        for fib_entry in reversed(container):
+            self.add_fib_entry(fib_entry.name, fib_entry.faceid, fib_entry.static)
+
+    def _collect(self, node: ForwardingInformationBaseTrieNode, entries: List[ForwardingInformationBaseEntry]):
+        """append the entries of all descendants of a node and of the node itself"""
+        for child in node.children.values():
+            self._collect(child, entries)
+        entries.extend(node.entries)
+
+    def _clear_node(self, node: ForwardingInformationBaseTrieNode) -> bool:
+        """remove all non-static entries below a node and drop children that became empty
+        :return: True if the node has no entries and no children anymore
+        """
+        for component in list(node.children.keys()):
+            if self._clear_node(node.children[component]):
+                del node.children[component]
+        static_entries = [fib_entry for fib_entry in node.entries if fib_entry.static]
+        self._size -= len(node.entries) - len(static_entries)
+        node.entries = static_entries
+        return not node.entries and not node.children
+
+    def _prune(self, components: List[bytes], path: List[ForwardingInformationBaseTrieNode]):
+        """remove nodes on the path of a name which neither hold entries nor have children"""
+        for i in range(len(components), 0, -1):
+            node = path[i]
+            if node.entries or node.children:
+                return
+            del path[i - 1].children[components[i - 1]]
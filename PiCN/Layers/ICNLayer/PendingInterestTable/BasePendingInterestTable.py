@@ -13,6 +13,9 @@ from PiCN.Layers.ICNLayer import BaseICNDataStruct
 class PendingInterestTableEntry(object):
     """An entry in the Forwarding Information Base"""
 
+    __slots__ = ('name', '_faceids', '_timestamp', '_retransmits', '_local_app', '_interest',
+                 '_fib_entries_already_used')
+
     def __init__(self, name: Name, faceid: int, interest:Interest = None, local_app: bool=False):
         self.name = name
         self._faceids: List[int] = []
@@ -57,7 +60,7 @@ class PendingInterestTableEntry(object):
 
     @timestamp.setter
     def timestamp(self, timestamp):
-        self._timestamp
+        self._timestamp = timestamp
 
     @property
     def retransmits(self):
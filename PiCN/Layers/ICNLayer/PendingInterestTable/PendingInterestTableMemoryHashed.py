@@ -0,0 +1,92 @@
+"""in-memory Pending Interest Table using a hash index for exact matching"""
+
+import time
+
+from collections import OrderedDict
+from typing import List
+
+from PiCN.Layers.ICNLayer.PendingInterestTable.BasePendingInterestTable import BasePendingInterestTable, \
+    PendingInterestTableEntry
+from PiCN.Layers.ICNLayer.ForwardingInformationBase import ForwardingInformationBaseEntry
+from PiCN.Layers.ICNLayer.BaseICNDataStruct import name_key
+from PiCN.Layers.ICNLayer.ExpiryScheduler import ExpiryScheduler
+from PiCN.Packets import Interest, Name
+
+
+class PendingInterestTableMemoryHashed(BasePendingInterestTable):
+    """in-memory Pending Interest Table using exact matching. Entries are indexed by a canonical name key,
+    so that lookup, insert and remove do not depend on the number of pending interests. Ageing only touches entries
+    whose timeout elapsed since they were added, refreshed or last retransmitted.
+    """
+
+    def __init__(self, pit_timeout: int=4, pit_retransmits: int=3) -> None:
+        super().__init__(pit_timeout=pit_timeout, pit_retransmits=pit_retransmits)
+        self.container: OrderedDict = OrderedDict()
+        self._expiry = ExpiryScheduler()
+
+    def add_pit_entry(self, name, faceid: int, interest: Interest = None, local_app = False):
+        key = name_key(name)
+        pit_entry = self.container.get(key)
+        if pit_entry is None:
+            pit_entry = PendingInterestTableEntry(name, faceid, interest, local_app)
+            self.container[key] = pit_entry
+            self._expiry.schedule(key, pit_entry.timestamp)
+            return
+        if faceid in pit_entry.faceids and local_app in pit_entry.local_app:
+            return
+        pit_entry.faceids.append(faceid)
+        pit_entry.local_app.append(local_app)
+
+    def remove_pit_entry(self, name: Name):
+        key = name_key(name)
+        self.container.pop(key, None)
+        self._expiry.cancel(key)
+
+    def find_pit_entry(self, name: Name) -> PendingInterestTableEntry:
+        return self.container.get(name_key(name))
+
+    def update_timestamp(self, pit_entry: PendingInterestTableEntry):
+        key = name_key(pit_entry.name)
+        entry = self.container.get(key)
+        if entry is None:
+            return
+        entry.timestamp = time.time()
+        entry.retransmits = 0
+        self._expiry.schedule(key, entry.timestamp)
+
+    def add_used_fib_entry(self, name: Name, used_fib_entry: ForwardingInformationBaseEntry):
+        pit_entry = self.container.get(name_key(name))
+        if pit_entry is None:
+            return
+        pit_entry.fib_entries_already_used.append(used_fib_entry)
+
+    def get_already_used_pit_entries(self, name: Name):
+        pit_entry = self.container.get(name_key(name))
+        if pit_entry is None:
+            return []
+        return pit_entry.fib_entries_already_used
+
+    def append(self, entry):
+        key = name_key(entry.name)
+        self.container.pop(key, None)
+        self.container[key] = entry
+        self._expiry.schedule(key, entry.timestamp)
+
+    def get_container(self) -> List[PendingInterestTableEntry]:
+        return list(self.container.values())
+
+    def ageing(self) -> List[PendingInterestTableEntry]:
+        """Remove expired entries which were retransmitted too often, reschedule all other expired entries
+        :return List of PIT entries to be retransmitted, ordered by the time they expired
+        """
+        cur_time = time.time()
+        updated = []
+        for key in self._expiry.pop_expired(cur_time - self._pit_timeout):
+            pit_entry = self.container[key]
+            if pit_entry.retransmits > self._pit_retransmits:
+                del self.container[key]
+                continue
+            pit_entry.retransmits = pit_entry.retransmits + 1
+            self._expiry.schedule(key, cur_time)
+            updated.append(pit_entry)
+        return updated
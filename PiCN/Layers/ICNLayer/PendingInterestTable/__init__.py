@@ -3,4 +3,5 @@
 
 from .BasePendingInterestTable import BasePendingInterestTable
 from .BasePendingInterestTable import PendingInterestTableEntry
-from .PendingInterestTableMemoryExact import PendingInterstTableMemoryExact
\ No newline at end of file
+from .PendingInterestTableMemoryExact import PendingInterstTableMemoryExact
+from .PendingInterestTableMemoryHashed import PendingInterestTableMemoryHashed
@@ -0,0 +1,176 @@
+"""Tests for the in Memory Pending Interest Table using a hash index"""
+
+import time
+import unittest
+
+from PiCN.Layers.ICNLayer.PendingInterestTable.PendingInterestTableMemoryHashed import PendingInterestTableMemoryHashed
+from PiCN.Layers.ICNLayer.PendingInterestTable import PendingInterestTableEntry
+from PiCN.Layers.ICNLayer.ForwardingInformationBase import ForwardingInformationBaseEntry
+from PiCN.Packets import Name
+
+
+class test_PendingInterestTableMemoryHashed(unittest.TestCase):
+
+    def setUp(self):
+        self.pit: PendingInterestTableMemoryHashed = PendingInterestTableMemoryHashed()
+
+    def tearDown(self):
+        pass
+
+    def test_add_data_to_pit(self):
+        """Test adding data to PIT"""
+        fid = 1
+        name = Name("/test/data")
+        self.pit.add_pit_entry(name, fid)
+        data = self.pit.get_container()[0]
+        self.assertEqual(data.name, name)
+
+    def test_find_data_in_pit(self):
+        """Test finding data in PIT exact"""
+        fid = 1
+        name = Name("/test/data")
+        self.pit.add_pit_entry(name, fid)
+        data = self.pit.get_container()[0]
+        self.assertEqual(data.name, name)
+        res = self.pit.find_pit_entry(name)
+        self.assertEqual(res.name, name)
+        self.assertEqual(res.face_id, [fid])
+
+    def test_find_data_in_pit_no_match(self):
+        """Test finding data in PIT exact, with no match"""
+        fid = 1
+        name1 = Name("/test/data")
+        name2 = Name("/data/test")
+        self.pit.add_pit_entry(name1, fid)
+        data = self.pit.get_container()[0]
+        self.assertEqual(data.name, name1)
+        res = self.pit.find_pit_entry(name2)
+        self.assertEqual(res, None)
+
+    def test_find_data_to_pit_deduplication(self):
+        """Test finding data in PIT with multiple fids"""
+        fid1 = 1
+        fid2 = 2
+
+        name = Name("/test/data")
+        self.pit.add_pit_entry(name, fid1)
+        self.pit.add_pit_entry(name, fid2)
+        data = self.pit.get_container()[0]
+        self.assertEqual(data.name, name)
+        res = self.pit.find_pit_entry(name)
+        self.assertEqual(res.name, name)
+        self.assertEqual(res.face_id, [fid1, fid2])
+
+    def test_find_data_to_pit_deduplication_samefid(self):
+        """Test finding data in PIT with two time same fids"""
+        fid = 1
+        name = Name("/test/data")
+        self.pit.add_pit_entry(name, fid)
+        self.pit.add_pit_entry(name, fid)
+        data = self.pit.get_container()[0]
+        self.assertEqual(data.name, name)
+        res = self.pit.find_pit_entry(name)
+        self.assertEqual(res.name, name)
+        self.assertEqual(res.face_id, [fid])
+
+    def test_remove_data_from_pit(self):
+        """Test removing data from PIT"""
+        fid = 1
+        name = Name("/test/data")
+        self.pit.add_pit_entry(name, fid)
+
+        data = self.pit.get_container()[0]
+        self.assertEqual(data.name, name)
+        self.assertEqual(self.pit.get_container_size(), 1)
+        self.pit.remove_pit_entry(name)
+        self.assertEqual(self.pit.get_container_size(), 0)
+
+    def test_add_already_used_fib_entry(self):
+        """Test adding an already used FIB Entry"""
+        n1 = Name("/test/data")
+        fib_entry = ForwardingInformationBaseEntry(n1, 2, False)
+        self.pit.add_pit_entry(n1, 1, None, False)
+        self.pit.add_used_fib_entry(n1, fib_entry)
+        self.assertEqual(self.pit.get_already_used_pit_entries(n1)[0], fib_entry)
+
+    def test_remove_missing_entry_from_pit(self):
+        """Test removing a name that is not in the PIT"""
+        self.pit.add_pit_entry(Name("/test/data"), 1)
+        self.pit.remove_pit_entry(Name("/data/test"))
+        self.assertEqual(self.pit.get_container_size(), 1)
+
+    def test_update_timestamp_in_place(self):
+        """Test that updating the timestamp keeps the entry and its used FIB entries"""
+        name = Name("/test/data")
+        fib_entry = ForwardingInformationBaseEntry(name, 2, False)
+        self.pit.add_pit_entry(name, 1)
+        self.pit.add_used_fib_entry(name, fib_entry)
+        entry = self.pit.find_pit_entry(name)
+        entry.retransmits = 2
+        old_timestamp = entry.timestamp
+        time.sleep(0.01)
+        self.pit.update_timestamp(entry)
+        res = self.pit.find_pit_entry(name)
+        self.assertIs(res, entry)
+        self.assertGreater(res.timestamp, old_timestamp)
+        self.assertEqual(res.retransmits, 0)
+        self.assertEqual(res.fib_entries_already_used, [fib_entry])
+
+    def test_append_replaces_entry(self):
+        """Test appending an entry with a name already in the PIT"""
+        name = Name("/test/data")
+        self.pit.add_pit_entry(name, 1)
+        self.pit.append(PendingInterestTableEntry(name, 3))
+        self.assertEqual(self.pit.get_container_size(), 1)
+        self.assertEqual(self.pit.find_pit_entry(name).faceids, [3])
+
+    def test_ageing(self):
+        """Test ageing removes timed out entries and returns the others for retransmission"""
+        self.pit.set_pit_timeout(0)
+        self.pit.set_pit_retransmits(0)
+        n1 = Name("/test/data1")
+        n2 = Name("/test/data2")
+        self.pit.add_pit_entry(n1, 1)
+        self.pit.add_pit_entry(n2, 1)
+        self.pit.find_pit_entry(n1).retransmits = 1
+        time.sleep(0.01)
+        retransmits = self.pit.ageing()
+        self.assertEqual([e.name for e in retransmits], [n2])
+        self.assertIsNone(self.pit.find_pit_entry(n1))
+        self.assertEqual(self.pit.find_pit_entry(n2).retransmits, 1)
+
+    def test_ageing_only_expired_entries(self):
+        """Test ageing retransmits only entries whose timeout elapsed, in the order they expired"""
+        self.pit.set_pit_timeout(0.2)
+        n1 = Name("/test/data1")
+        n2 = Name("/test/data2")
+        n3 = Name("/test/data3")
+        self.pit.add_pit_entry(n2, 1)
+        time.sleep(0.01)
+        self.pit.add_pit_entry(n1, 1)
+        time.sleep(0.3)
+        self.pit.add_pit_entry(n3, 1)
+        retransmits = self.pit.ageing()
+        self.assertEqual([e.name for e in retransmits], [n2, n1])
+        self.assertEqual(self.pit.ageing(), [])
+        self.assertEqual(self.pit.find_pit_entry(n3).retransmits, 0)
+
+    def test_ageing_after_update_timestamp(self):
+        """Test that refreshing an entry postpones its retransmission"""
+        self.pit.set_pit_timeout(0.2)
+        name = Name("/test/data")
+        self.pit.add_pit_entry(name, 1)
+        time.sleep(0.3)
+        self.pit.update_timestamp(self.pit.find_pit_entry(name))
+        self.assertEqual(self.pit.ageing(), [])
+        time.sleep(0.3)
+        self.assertEqual([e.name for e in self.pit.ageing()], [name])
+
+    def test_find_data_in_pit_component_with_slash(self):
+        """Test that names which are equal as strings map to the same PIT entry"""
+        name1 = Name("/lib/func/f1")
+        name1 += "_(/test/data)"
+        name2 = Name("/lib/func/f1/_(/test/data)")
+        self.pit.add_pit_entry(name1, 1)
+        res = self.pit.find_pit_entry(name2)
+        self.assertEqual(res.name, name1)
@@ -7,5 +7,6 @@
     that can be used to dispatch packets on the higher layer
 """
 
-from .BaseICNDataStruct import BaseICNDataStruct
+from .BaseICNDataStruct import BaseICNDataStruct, name_key
+from .ExpiryScheduler import ExpiryScheduler
 from .BasicICNLayer import BasicICNLayer
\ No newline at end of file
@@ -264,6 +264,7 @@ class test_BasicICNLayer(unittest.TestCase):
     def test_ICNLayer_ageing_pit(self):
         """Test PIT ageing"""
 
+        self.icn_layer.timer_interval = None # aged by the test
         self.icn_layer.start_process()
         from_face_id_1 = 1
         to_face_id = 2
@@ -323,6 +324,7 @@ class test_BasicICNLayer(unittest.TestCase):
     def test_ICNLayer_ageing_cs(self):
         """Test CS ageing and static entries"""
 
+        self.icn_layer.timer_interval = None # aged by the test
         self.icn_layer.start_process()
         name1 = Name("/test/data")
         content1 = Content(name1, "HelloWorld")
@@ -349,6 +351,22 @@ class test_BasicICNLayer(unittest.TestCase):
         self.assertEqual(self.icn_layer.cs.get_container_size(), 1)
         self.assertEqual(self.icn_layer.cs.find_content_object(name2).content, content2)
 
+    def test_ICNLayer_ageing_on_timer(self):
+        """Test that the PIT is aged in the process loop of the layer"""
+        self.icn_layer.timer_interval = 0.2
+        self.icn_layer.start_process()
+        name = Name("/test/data")
+        interest = Interest(name)
+
+        self.icn_layer.fib.add_fib_entry(name, 2)
+        self.icn_layer.pit.add_pit_entry(name, 1, interest, False)
+        try:
+            rface_id, rinterest = self.icn_layer.queue_to_lower.get(timeout=2.0)
+        except:
+            self.fail()
+        self.assertEqual(rface_id, 2)
+        self.assertEqual(rinterest, interest)
+
     def test_ICNLayer_content_from_app_layer_no_pit(self):
         """get content from app layer when there is no pit entry available"""
         queue_to_higher = multiprocessing.Queue()
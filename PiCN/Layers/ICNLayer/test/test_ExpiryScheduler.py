@@ -0,0 +1,55 @@
+"""Tests for the Expiry Scheduler"""
+
+import unittest
+
+from PiCN.Layers.ICNLayer.ExpiryScheduler import ExpiryScheduler
+
+
+class test_ExpiryScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = ExpiryScheduler()
+
+    def test_pop_expired_in_order(self):
+        """Test that expired keys are returned ordered by their timestamp"""
+        self.scheduler.schedule("b", 2.0)
+        self.scheduler.schedule("a", 1.0)
+        self.scheduler.schedule("c", 3.0)
+        self.assertEqual(self.scheduler.pop_expired(2.5), ["a", "b"])
+        self.assertEqual(len(self.scheduler), 1)
+        self.assertEqual(self.scheduler.pop_expired(2.5), [])
+
+    def test_pop_expired_is_strict(self):
+        """Test that a key scheduled exactly at the given timestamp is not expired"""
+        self.scheduler.schedule("a", 1.0)
+        self.assertEqual(self.scheduler.pop_expired(1.0), [])
+        self.assertEqual(self.scheduler.pop_expired(1.1), ["a"])
+
+    def test_reschedule(self):
+        """Test that scheduling a key again replaces its timestamp"""
+        self.scheduler.schedule("a", 1.0)
+        self.scheduler.schedule("a", 5.0)
+        self.assertEqual(self.scheduler.get_timestamp("a"), 5.0)
+        self.assertEqual(self.scheduler.pop_expired(2.0), [])
+        self.assertEqual(self.scheduler.pop_expired(6.0), ["a"])
+
+    def test_cancel(self):
+        """Test that cancelled keys do not expire"""
+        self.scheduler.schedule("a", 1.0)
+        self.scheduler.schedule("b", 1.0)
+        self.scheduler.cancel("a")
+        self.scheduler.cancel("x")
+        self.assertNotIn("a", self.scheduler)
+        self.assertEqual(self.scheduler.pop_expired(2.0), ["b"])
+
+    def test_item(self):
+        """Test that the item passed on scheduling is returned instead of the key"""
+        self.scheduler.schedule("a", 1.0, item=["payload"])
+        self.assertEqual(self.scheduler.pop_expired(2.0), [["payload"]])
+
+    def test_compaction(self):
+        """Test that rescheduling many times does not grow the heap unbounded"""
+        for i in range(1000):
+            self.scheduler.schedule("a", float(i))
+        self.assertLess(len(self.scheduler._heap), 100)
+        self.assertEqual(self.scheduler.pop_expired(1000.0), ["a"])
@@ -23,6 +23,7 @@ class BasicLinkLayer(LayerProcess):
         super().__init__(logger_name="LinkLayer", log_level=log_level)
         self.interfaces = interfaces
         self.faceidtable = faceidtable
+        self._interface_ids = {}
 
     def data_from_lower(self, interface: BaseInterface, to_higher: multiprocessing.Queue, data):
         """In the Linklayer, it handles received data, to lower is the network interface
@@ -33,9 +34,9 @@ class BasicLinkLayer(LayerProcess):
         packet = data[0]
         addr = data[1]
 
-        addr_info = AddressInfo(addr, self.interfaces.index(interface))
+        addr_info = AddressInfo(addr, self._interface_id(interface))
         faceid = self.faceidtable.get_or_create_faceid(addr_info)
-        self.logger.info("Got data from Network and from Face ID: " + str(faceid) + ", addr: " + str(addr_info.address))
+        self.logger.info("Got data from Network and from Face ID: %s, addr: %s", faceid, addr_info.address)
         to_higher.put([faceid, packet])
 
     def data_from_higher(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue, data):
@@ -47,56 +48,108 @@ class BasicLinkLayer(LayerProcess):
 
         faceid = data[0]
         packet = data[1]
-        self.logger.info("Got data from Higher Layer with faceid: " + str(faceid))
+        self.logger.info("Got data from Higher Layer with faceid: %s", faceid)
 
         addr_info = self.faceidtable.get_address_info(faceid)
         if not addr_info:
             self.logger.error("No addr_info found for faceid: " + str(faceid))
             return
         self.interfaces[addr_info.interface_id].send(packet, addr_info.address)
-        self.logger.info("Send packet to: " + str(addr_info.address))
+        self.logger.info("Send packet to: %s", addr_info.address)
+
+    def data_from_higher_batch(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue, batch):
+        """Send a batch of data from the higher layer, handing all packets for an interface to it at once
+        :param to_lower: None
+        :param to_higher: queue to the higher layer
+        :param batch: list of data to be send
+        """
+        packets = {}
+        for data in batch:
+            faceid = data[0]
+            self.logger.info("Got data from Higher Layer with faceid: %s", faceid)
+            addr_info = self.faceidtable.get_address_info(faceid)
+            if not addr_info:
+                self.logger.error("No addr_info found for faceid: " + str(faceid))
+                continue
+            packets.setdefault(addr_info.interface_id, []).append((data[1], addr_info.address))
+        for interface_id, interface_packets in packets.items():
+            self.interfaces[interface_id].send_batch(interface_packets)
+            self.logger.info("Send %s packets on interface %s", len(interface_packets), interface_id)
+
+    def _index_interfaces(self) -> dict:
+        """Map the interfaces to their ids, which are their positions in the interface list
+        :return: dict mapping the file descriptor numbers of the interfaces to the interfaces
+        """
+        self._interface_ids = {id(interface): interface_id for interface_id, interface in enumerate(self.interfaces)}
+        return {interface.file_descriptor.fileno(): interface for interface in self.interfaces}
+
+    def _interface_id(self, interface: BaseInterface) -> int:
+        interface_id = self._interface_ids.get(id(interface))
+        if interface_id is None:
+            self._index_interfaces()
+            interface_id = self._interface_ids[id(interface)]
+        return interface_id
 
     def _run_poll(self, from_lower: multiprocessing.Queue, from_higher: multiprocessing.Queue,
                   to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue):
+        poller = select.poll()
+        READ_ONLY = select.POLLIN | select.POLLPRI | select.POLLHUP | select.POLLERR
+        interfaces = self._index_interfaces()
+        for fd in interfaces:
+            poller.register(fd, READ_ONLY)
+        from_higher_fd = from_higher._reader.fileno()
+        poller.register(from_higher_fd, READ_ONLY)
+        data_structs = {}
+        for data_struct in self._data_structs:
+            poller.register(data_struct.request_reader, READ_ONLY)
+            data_structs[data_struct.request_reader.fileno()] = data_struct
         while True:
-            poller = select.poll()
-            READ_ONLY = select.POLLIN | select.POLLPRI | select.POLLHUP | select.POLLERR
-            fds = list(map(lambda x: x.file_descriptor, self.interfaces))
-            for fd in fds:
-                poller.register(fd, READ_ONLY)
-            poller.register(from_higher._reader, READ_ONLY)
             ready_fds = poller.poll()
-            for fd in ready_fds:
-                if fd[0] == from_higher._reader.fileno():
-                    data = from_higher.get()
-                    self.data_from_higher(to_lower, to_higher, data)
+            for fd, _ in ready_fds:
+                if fd in data_structs:
+                    data_structs[fd].handle_requests()
+                elif fd == from_higher_fd:
+                    self._receive(from_higher, self.data_from_higher, self.data_from_higher_batch, to_lower, to_higher)
                 else:
-                    interfaces = list(filter(lambda x: x.file_descriptor.fileno() == fd[0], self.interfaces))
-                    try:
-                        interface = interfaces[0]
-                    except:
+                    interface = interfaces.get(fd)
+                    if interface is None:
                         return
-                    data = interface.receive()
-                    self.data_from_lower(interface, to_higher, data)
+                    self._receive_from_interface(interface, to_higher)
+            self._flush(to_lower, to_higher)
 
     def _run_select(self, from_lower: multiprocessing.Queue, from_higher: multiprocessing.Queue,
                     to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue):
+        interfaces = self._index_interfaces()
+        from_higher_fd = from_higher._reader.fileno()
+        fds = list(interfaces.keys())
+        fds.append(from_higher_fd)
+        data_structs = {}
+        for data_struct in self._data_structs:
+            fds.append(data_struct.request_reader.fileno())
+            data_structs[data_struct.request_reader.fileno()] = data_struct
         while True:
-            fds = list(map(lambda x: x.file_descriptor, self.interfaces))
-            fds.append(from_higher._reader)
             ready_fds, _, _ = select.select(fds, [], [])
             for fd in ready_fds:
-                if fd == from_higher._reader:
-                    data = from_higher.get()
-                    self.data_from_higher(to_lower, to_higher, data)
+                if fd in data_structs:
+                    data_structs[fd].handle_requests()
+                elif fd == from_higher_fd:
+                    self._receive(from_higher, self.data_from_higher, self.data_from_higher_batch, to_lower, to_higher)
                 else:
-                    interfaces = list(filter(lambda x: x.file_descriptor == fd, self.interfaces))
-                    try:
-                        interface = interfaces[0]
-                    except:
+                    interface = interfaces.get(fd)
+                    if interface is None:
                         return
-                    data = interface.receive()
-                    self.data_from_lower(interface, to_higher, data)
+                    self._receive_from_interface(interface, to_higher)
+            self._flush(to_lower, to_higher)
+
+    def _run_asyncio(self, loop, from_lower, from_higher, to_lower, to_higher):
+        super()._run_asyncio(loop, None, from_higher, to_lower, to_higher)
+        self._index_interfaces()
+        for interface in self.interfaces:
+            loop.add_reader(interface.file_descriptor, self._receive_from_interface, interface, to_higher)
+
+    def _receive_from_interface(self, interface: BaseInterface, to_higher):
+        for data in interface.receive_batch():
+            self.data_from_lower(interface, to_higher, data)
 
     def _run_sleep(self, from_lower: multiprocessing.Queue, from_higher: multiprocessing.Queue,
                    to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue):
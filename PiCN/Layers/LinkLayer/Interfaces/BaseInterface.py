@@ -38,6 +38,20 @@ class BaseInterface(object):
         :return Tuple of received data and addr from which the data where received
         """
 
+    def send_batch(self, packets):
+        """send a batch of data. Must be overwritten if an interface implementation can send several packets at once
+        :param packets: list of (data, addr) tuples
+        """
+        for data, addr in packets:
+            self.send(data, addr)
+
+    def receive_batch(self):
+        """receives all data which is available without blocking, at least one packet. Must be overwritten if an
+        interface implementation can receive several packets at once
+        :return List of tuples of received data and addr from which the data where received
+        """
+        return [self.receive()]
+
     @property
     @abc.abstractmethod
     def file_descriptor(self):
@@ -0,0 +1,38 @@
+"""Implementation of an Interface using UDP4 for communication, receiving and sending packets in batches"""
+
+import socket
+
+from PiCN.Layers.LinkLayer.Interfaces.UDP4Interface import UDP4Interface
+
+
+class BatchUDP4Interface(UDP4Interface):
+    """Implementation of an Interface using UDP4 for communication, which drains the socket on each wakeup of the link
+    layer. The first read blocks, further reads are non-blocking until no more datagram is queued or batch_size
+    datagrams are received. Batches are sent in a single loop over the socket without the per packet dispatch of send,
+    since the socket module does not provide sendmmsg each datagram still takes one system call.
+    :param listen_port: port to listen on, 0 for a random port
+    :param buffersize: maximum size of a received datagram
+    :param batch_size: maximum number of datagrams received per wakeup
+    """
+
+    def __init__(self, listen_port: int, buffersize: int=8192, batch_size: int=64):
+        UDP4Interface.__init__(self, listen_port, buffersize)
+        self.batch_size = batch_size
+        self._dontwait = getattr(socket, "MSG_DONTWAIT", 0)
+
+    def receive_batch(self):
+        packets = [self.receive()]
+        if not self._dontwait:
+            return packets
+        recvfrom = self.sock.recvfrom
+        while len(packets) < self.batch_size:
+            try:
+                packets.append(recvfrom(self._buffersize, self._dontwait))
+            except (BlockingIOError, InterruptedError):
+                break
+        return packets
+
+    def send_batch(self, packets):
+        sendto = self.sock.sendto
+        for data, addr in packets:
+            sendto(data, addr)
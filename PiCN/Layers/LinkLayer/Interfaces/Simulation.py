@@ -121,7 +121,7 @@ class SimulationBus(PiCNProcess):
 
             if dst_interface.packet_loss(packet):
                 print("\t... LOST")
-                return
+                continue
 
             if dst_interface.max_bandwidth > 0: #TODO check and improve that
                 t = time.time()
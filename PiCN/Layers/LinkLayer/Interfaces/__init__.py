@@ -3,6 +3,7 @@
 from .BaseInterface import AddressInfo
 from .BaseInterface import BaseInterface
 from .UDP4Interface import UDP4Interface
+from .BatchUDP4Interface import BatchUDP4Interface
 
 from .Simulation import SimulationInterface
 from .Simulation import SimulationBus
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""Test the Batch UDP4 Interface"""
+
+import socket
+import unittest
+
+from PiCN.Layers.LinkLayer.Interfaces import BatchUDP4Interface, UDP4Interface
+
+class test_BatchUDP4Interface(unittest.TestCase):
+    """Test the Batch UDP4 Interface"""
+
+    def setUp(self):
+        self.interface1 = BatchUDP4Interface(0, batch_size=4)
+        self.interface2 = UDP4Interface(0)
+
+    def tearDown(self):
+        self.interface1.close()
+        self.interface2.close()
+
+    def test_receiving_data(self):
+        """test receiving data"""
+        test_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        test_sock.bind(("0.0.0.0", 0))
+        test_sock.sendto(b"HelloWorld", ("127.0.0.1", self.interface1.get_port()))
+        test_sock.sendto(b"Hello", ("127.0.0.1", self.interface1.get_port()))
+
+        data, addr = self.interface1.receive()
+        self.assertEqual(data, b"HelloWorld")
+        self.assertEqual(addr, ("127.0.0.1", test_sock.getsockname()[1]))
+        data, addr = self.interface1.receive()
+        self.assertEqual(data, b"Hello")
+        test_sock.close()
+
+    def test_receive_batch(self):
+        """test draining the socket up to the batch size"""
+        for i in range(6):
+            self.interface2.send(b"HelloWorld" + str(i).encode(), ("127.0.0.1", self.interface1.get_port()))
+
+        packets = self.interface1.receive_batch()
+        self.assertEqual([data for data, _ in packets], [b"HelloWorld" + str(i).encode() for i in range(4)])
+        self.assertEqual(packets[0][1], ("127.0.0.1", self.interface2.get_port()))
+        packets = self.interface1.receive_batch()
+        self.assertEqual([data for data, _ in packets], [b"HelloWorld4", b"HelloWorld5"])
+
+    def test_send_batch(self):
+        """test sending a batch of data"""
+        self.interface1.send_batch([(b"Hello" + str(i).encode(), ("127.0.0.1", self.interface2.get_port()))
+                                    for i in range(3)])
+        for i in range(3):
+            data, addr = self.interface2.receive()
+            self.assertEqual(data, b"Hello" + str(i).encode())
+            self.assertEqual(addr, ("127.0.0.1", self.interface1.get_port()))
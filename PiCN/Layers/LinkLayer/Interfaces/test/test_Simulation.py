@@ -1,6 +1,7 @@
 """Test the PiCN Simulation System"""
 
 import abc
+import itertools
 import queue
 import unittest
 import os
@@ -286,6 +287,34 @@ class cases_Simulation():
         mgmt_client1.shutdown()
         self.fetchtool.stop_fetch()
 
+    def test_single_interest_repo_fetch_with_packet_loss(self):
+        """Test fetching chunked data from a repo over an interface losing packets, lost chunks are retransmitted"""
+        self.path = "/tmp/repo_unit_test"
+        try:
+            os.stat(self.path)
+        except:
+            os.mkdir(self.path)
+        with open(self.path + "/f1", 'w+') as content_file:
+            content_file.write("A" * 50000)
+        self.icn_forwarder2 = ICNDataRepository(self.path, Name("/test/data"), 0, log_level=255,
+                                                encoder=self.encoder_type(),
+                                                interfaces=[self.simulation_bus.add_interface("icnfwd2")])
+
+        counter = itertools.count()
+        packet_loss_func = lambda packet: next(counter) % 5 == 3
+        self.fetchtool = Fetch("icnfwd2", None, 255, encoder=self.encoder_type(),
+                               interfaces=[self.simulation_bus.add_interface("fetchtool",
+                                                                             packet_loss_func=packet_loss_func)])
+
+        self.icn_forwarder2.start_repo()
+        self.simulation_bus.start_process()
+
+        res = self.fetchtool.fetch_data(Name("/test/data/f1"), 10)
+
+        self.assertEqual("A"*50000, res)
+
+        self.fetchtool.stop_fetch()
+
 
 class test_Simulation_Simple_Packet_Encoder(cases_Simulation, unittest.TestCase):
     """Test the PiCN Simulation System with the Simple Packet Encoder"""
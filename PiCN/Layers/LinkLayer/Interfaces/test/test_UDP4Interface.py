@@ -50,4 +50,12 @@ class test_UDP4Interface(unittest.TestCase):
         data, addr = self.interface2.receive()
 
         self.assertEqual(data, b"HelloWorld")
-        self.assertEqual(addr, ("127.0.0.1", self.interface1.get_port()))
\ No newline at end of file
+        self.assertEqual(addr, ("127.0.0.1", self.interface1.get_port()))
+
+    def test_receive_batch(self):
+        """test receiving a single packet as batch"""
+        self.interface1.send(b"HelloWorld", ("127.0.0.1", self.interface2.get_port()))
+
+        packets = self.interface2.receive_batch()
+
+        self.assertEqual(packets, [(b"HelloWorld", ("127.0.0.1", self.interface1.get_port()))])
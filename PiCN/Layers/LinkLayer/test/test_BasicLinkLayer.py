@@ -5,9 +5,10 @@ import socket
 import unittest
 
 from PiCN.Layers.LinkLayer.FaceIDTable import FaceIDDict
-from PiCN.Layers.LinkLayer.Interfaces import UDP4Interface, AddressInfo
+from PiCN.Layers.LinkLayer.Interfaces import UDP4Interface, BatchUDP4Interface, AddressInfo
 from PiCN.Layers.LinkLayer import BasicLinkLayer
 from PiCN.Processes import PiCNSyncDataStructFactory
+from PiCN.Processes.QueueBatch import QueueBatch
 
 
 class test_BasicLinkLayer(unittest.TestCase):
@@ -197,4 +198,27 @@ class test_BasicLinkLayer(unittest.TestCase):
             self.assertEqual(data1_3[1].decode(), str1)
             self.assertEqual(data2_1[1].decode(), str2)
             self.assertEqual(data3_1[1].decode(), str3)
-            self.assertEqual(data3_2[1].decode(), str3)
\ No newline at end of file
+            self.assertEqual(data3_2[1].decode(), str3)
+
+    def test_sending_and_receiving_batches(self):
+        """Test sending/receiving batches of packets with batched interfaces"""
+        interface = BatchUDP4Interface(0, batch_size=8)
+        linklayer = BasicLinkLayer([interface], self.faceidtable1)
+        linklayer.queue_to_higher = multiprocessing.Queue()
+        linklayer.queue_from_higher = multiprocessing.Queue()
+        linklayer.batch_size = 8
+        linklayer.start_process()
+
+        fid = linklayer.faceidtable.get_or_create_faceid(AddressInfo(("127.0.0.1", self.test_port), 0))
+        linklayer.queue_from_higher.put(QueueBatch([fid, ("HelloWorld" + str(i)).encode()] for i in range(20)))
+        for i in range(20):
+            data, addr = self.testSock.recvfrom(8192)
+            self.assertEqual(data.decode(), "HelloWorld" + str(i))
+
+        for i in range(20):
+            self.testSock.sendto(("GoodBye" + str(i)).encode(), ("127.0.0.1", interface.get_port()))
+        for i in range(20):
+            faceid, packet = linklayer.queue_to_higher.get(timeout=2.0)
+            self.assertEqual(faceid, fid)
+            self.assertEqual(packet.decode(), "GoodBye" + str(i))
+        linklayer.stop_process()
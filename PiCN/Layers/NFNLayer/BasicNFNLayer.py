@@ -8,10 +8,11 @@ from PiCN.Packets import Interest, Content, Nack, NackReason, Name
 from PiCN.Processes import LayerProcess
 from PiCN.Layers.NFNLayer.NFNComputationTable import BaseNFNComputationTable
 from PiCN.Layers.NFNLayer.NFNComputationTable import NFNComputationState
-from PiCN.Layers.NFNLayer.NFNExecutor import BaseNFNExecutor
+from PiCN.Layers.NFNLayer.NFNExecutor import BaseNFNExecutor, NFNExecutorPool
 from PiCN.Layers.NFNLayer.Parser import *
 from PiCN.Layers.NFNLayer.NFNOptimizer import BaseNFNOptimizer
 from PiCN.Layers.NFNLayer.NFNOptimizer import ToDataFirstOptimizer
+from PiCN.Layers.NFNLayer.NFNResultCache import NFNResultCache
 from PiCN.Layers.NFNLayer.R2C import BaseR2CHandler
 from PiCN.Layers.ICNLayer.PendingInterestTable import BasePendingInterestTable
 from PiCN.Layers.ICNLayer.ContentStore import BaseContentStore
@@ -24,7 +25,8 @@ class BasicNFNLayer(LayerProcess):
     def __init__(self, cs: BaseContentStore, fib: BaseForwardingInformationBase, pit: BasePendingInterestTable,
                  faceidtable: BaseFaceIDTable,
                  comp_table: BaseNFNComputationTable, executors: Dict[str, type(BaseNFNExecutor)],
-                 parser: DefaultNFNParser, r2c_client: BaseR2CHandler, log_level: int=255):
+                 parser: DefaultNFNParser, r2c_client: BaseR2CHandler, log_level: int=255,
+                 executor_pool: NFNExecutorPool=None, result_cache: NFNResultCache=None):
         super().__init__("NFN-Layer", log_level=log_level)
         self.cs = cs
         self.fib = fib
@@ -35,6 +37,20 @@ class BasicNFNLayer(LayerProcess):
         self.r2cclient = r2c_client
         self.parser: DefaultNFNParser = parser
         self.optimizer: BaseNFNOptimizer = ToDataFirstOptimizer(self.cs, self.fib, self.pit, self.faceidtable)
+        self.executor_pool: NFNExecutorPool = executor_pool
+        self.result_cache: NFNResultCache = result_cache
+        if executor_pool is not None:
+            self.add_reader(executor_pool.result_reader, self.handle_computation_results)
+
+    def start_process(self):
+        if self.executor_pool is not None:
+            self.executor_pool.start()
+        super().start_process()
+
+    def stop_process(self):
+        super().stop_process()
+        if self.executor_pool is not None:
+            self.executor_pool.stop()
 
     def data_from_lower(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue, data):
         """handle incomming data from the lower layer """
@@ -74,8 +90,14 @@ class BasicNFNLayer(LayerProcess):
             self.queue_to_lower.put([packet_id, interest])
             return
         #parse interest and create computation
-        nfn_str, prepended_name = self.parser.network_name_to_nfn_str(interest.name)
-        ast = self.parser.parse(nfn_str)
+        nfn_str, prepended_name, ast = self.parser.network_name_to_ast(interest.name)
+
+        if self.result_cache is not None:
+            res = self.result_cache.get_expression(ast)
+            if res is not None:
+                self.logger.info("Result Cache hit: " + str(interest.name))
+                self.handleContent(packet_id, Content(interest.name, res))
+                return
 
         if self.computation_table.add_computation(interest.name, packet_id, interest, ast) == False:
             return
@@ -185,6 +207,11 @@ class BasicNFNLayer(LayerProcess):
                     #p._prepend = True
                     name = self.parser.nfn_str_to_network_name((str(p)))
                     #p._prepend = False
+                    res = self.result_cache.get_expression(p) if self.result_cache is not None else None
+                    if res is not None:
+                        self.logger.info("Result Cache hit: " + str(name))
+                        entry.available_data[name] = res
+                        continue
                     self.logger.info("Subcomputation: " + str(name))
                     self.handleInterest(entry.id, Interest(name))
                 else:
@@ -245,10 +272,46 @@ class BasicNFNLayer(LayerProcess):
             elif not isinstance(e.type, AST):
                 params.append(e.type(e._element))
 
+        result_key = None
+        if self.result_cache is not None and self.result_cache.annotate(entry.ast._element, function_code):
+            result_key = self.result_cache.result_key(entry.ast, function_code, params)
+            res = self.result_cache.get(result_key)
+            if res is not None:
+                self.logger.info("Result Cache hit: " + str(entry.original_name))
+                self.finish_computation(entry, res, result_key)
+                return
+
+        if self.executor_pool is not None:
+            if not self.executor_pool.submit((entry, result_key), self.get_nf_code_language(function_code),
+                                             function_code, params):
+                self.logger.info("Computation queue full: " + str(entry.original_name))
+                self.queue_to_lower.put([entry.id, Nack(entry.original_name, NackReason.COMP_QUEUE_FULL,
+                                                        interest=entry.interest)])
+            return
         res = executor.execute(function_code=function_code, params=params)
+        self.finish_computation(entry, res, result_key)
+
+    def handle_computation_results(self):
+        """Handle the computations finished by the executor pool"""
+        for (entry, result_key), res, timed_out in self.executor_pool.collect():
+            if timed_out:
+                self.logger.info("Computation timed out: " + str(entry.original_name))
+                self.queue_to_lower.put([entry.id, Nack(entry.original_name, NackReason.COMP_TERMINATED,
+                                                        interest=entry.interest)])
+                continue
+            self.finish_computation(entry, res, result_key)
+
+    def finish_computation(self, entry, res, result_key: str=None):
+        """Handle the result of a computation
+        :param entry: computation table entry of the computation
+        :param res: result of the executor
+        :param result_key: key of the computation in the result cache, None if the result should not be cached
+        """
         if res is None:
             self.queue_to_lower.put([entry.id,
                                      Nack(entry.original_name, NackReason.COMP_EXCEPTION, interest=entry.interest)])
+        elif result_key is not None:
+            self.result_cache.put(result_key, str(res), self.result_cache.expression_key(entry.ast))
         content_res: Content = Content(entry.original_name, str(res)) #TODO typed results
         self.logger.info("Finish Computation: " + str(content_res.name))
         #self.computation_table.push_data(content_res)
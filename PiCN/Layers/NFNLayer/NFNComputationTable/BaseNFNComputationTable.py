@@ -78,7 +78,7 @@ class NFNComputationTableEntry(object):
                 self.comp_state = NFNComputationState.WRITEBACK
                 self.available_data[content.name] = content.content
                 return True
-        if content.name not in list(map(lambda n: n.name, self.awaiting_data)):
+        if not any(a.name == content.name for a in self.awaiting_data):
             return False
         if content.name in self.available_data:
             return False
@@ -0,0 +1,115 @@
+"""Implementation of the NFNComputationTable using a dictionary"""
+
+import time
+
+from typing import Dict, List, Set
+
+from PiCN.Packets import Name, Content, Interest
+from PiCN.Layers.NFNLayer.NFNComputationTable.BaseNFNComputationTable import BaseNFNComputationTable
+from PiCN.Layers.NFNLayer.NFNComputationTable.BaseNFNComputationTable import NFNComputationTableEntry
+from PiCN.Layers.NFNLayer.NFNComputationTable.BaseNFNComputationTable import NFNComputationState
+from PiCN.Layers.NFNLayer.Parser import *
+from PiCN.Layers.NFNLayer.R2C import BaseR2CHandler
+
+
+class NFNComputationDict(BaseNFNComputationTable):
+    """Implementation of the NFNComputationTable using a dictionary from the original name to the computation.
+    A reverse index maps each awaited name (and the current rewrite of a rewritten computation) to the computations
+    waiting for it, so arriving content only touches computations which require it. Computations which are ready to
+    continue are tracked whenever an entry is added, receives data or is aged.
+    Entries must be changed by removing and appending them again (as done by update_status and add_awaiting_data),
+    otherwise the index does not see the change.
+    """
+
+    def __init__(self, r2cclient: BaseR2CHandler, parser: DefaultNFNParser):
+        super().__init__(r2cclient, parser)
+        self.container: Dict[Name, NFNComputationTableEntry] = {}
+        self._awaiting: Dict[Name, Dict[Name, None]] = {} # ordered like the computations were indexed
+        self._indexed: Dict[Name, Set[Name]] = {}
+        self._ready: Dict[Name, None] = {}
+
+    def add_computation(self, name: Name, id: int, interest: Interest, ast: AST=None) -> bool:
+        c = self.container.get(name)
+        if c is not None:
+            c.time_stamp = time.time()
+            return False
+        self._insert(NFNComputationTableEntry(name, id, interest, ast, self.r2cclient, self.parser))
+        return True
+
+    def is_comp_running(self, name: Name) -> bool:
+        return name in self.container
+
+    def get_computation(self, name: Name) -> NFNComputationTableEntry:
+        return self.container.get(name)
+
+    def remove_computation(self, name: Name):
+        if self.container.pop(name, None) is None:
+            return
+        self._unindex(name)
+        self._ready.pop(name, None)
+
+    def append_computation(self, entry: NFNComputationTableEntry):
+        if entry.original_name not in self.container:
+            self._insert(entry)
+
+    def push_data(self, content: Content) -> bool:
+        waiting = self._awaiting.get(content.name)
+        if not waiting:
+            return False
+        ret = False
+        for name in list(waiting):
+            entry = self.container[name]
+            if entry.push_data(content):
+                ret = True
+                self._update(entry)
+        return ret
+
+    def get_ready_computations(self) -> List[NFNComputationTableEntry]:
+        return [self.container[name] for name in self._ready]
+
+    def ageing(self):
+        comp_to_remove = []
+        requests = []
+        for comp in list(self.container.values()):
+            required_requests = comp.ageing()
+            if required_requests is None:
+                comp_to_remove.append(comp) #remove comp if there was a timeout that should not be refreshed
+                continue
+            requests += required_requests
+            self._update(comp) #ageing changes the await list and the rewrite list
+        for c in comp_to_remove:
+            self.remove_computation(c.original_name)
+        return (requests, list(map(lambda n: n.original_name, comp_to_remove)))
+
+    def get_container(self) -> List[NFNComputationTableEntry]:
+        return list(self.container.values())
+
+    def _insert(self, entry: NFNComputationTableEntry):
+        """add an entry to the container and index it"""
+        self.container[entry.original_name] = entry
+        self._update(entry)
+
+    def _update(self, entry: NFNComputationTableEntry):
+        """re-index the awaited names and the readiness of an entry"""
+        self._unindex(entry.original_name)
+        names = set(map(lambda a: a.name, entry.awaiting_data))
+        if entry.comp_state == NFNComputationState.REWRITE and entry.rewrite_list != []:
+            rw_name = entry.rewrite_list[0]
+            names.add(rw_name if type(rw_name) == Name else self.parser.nfn_str_to_network_name(rw_name))
+        for name in names:
+            self._awaiting.setdefault(name, {})[entry.original_name] = None
+        self._indexed[entry.original_name] = names
+        if entry.ready_to_continue():
+            self._ready[entry.original_name] = None
+        else:
+            self._ready.pop(entry.original_name, None)
+
+    def _unindex(self, name: Name):
+        """remove the awaited names of a computation from the reverse index"""
+        for awaited in self._indexed.pop(name, ()):
+            waiting = self._awaiting.get(awaited)
+            if waiting is None:
+                continue
+            waiting.pop(name, None)
+            if not waiting:
+                del self._awaiting[awaited]
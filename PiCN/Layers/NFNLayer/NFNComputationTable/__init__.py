@@ -6,3 +6,4 @@ from .BaseNFNComputationTable import NFNComputationState
 from .BaseNFNComputationTable import NFNAwaitListEntry
 
 from .NFNComputationList import NFNComputationList
+from .NFNComputationDict import NFNComputationDict
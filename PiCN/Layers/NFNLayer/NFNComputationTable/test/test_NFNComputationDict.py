@@ -0,0 +1,163 @@
+"""Test the NFNComputationDict"""
+
+import time
+import unittest
+
+from PiCN.Packets import Name, Content, Interest
+from PiCN.Layers.NFNLayer.NFNComputationTable import NFNComputationDict
+from PiCN.Layers.NFNLayer.NFNComputationTable import NFNComputationState
+from PiCN.Layers.NFNLayer.R2C import TimeoutR2CHandler
+from PiCN.Layers.NFNLayer.Parser import DefaultNFNParser
+
+class test_NFNComputationDict(unittest.TestCase):
+
+    def setUp(self):
+        self.r2cclient = TimeoutR2CHandler()
+        self.computationTable: NFNComputationDict = NFNComputationDict(self.r2cclient, DefaultNFNParser())
+
+    def tearDown(self):
+        pass
+
+    def test_add_computation(self):
+        """Test adding a computation to the table"""
+        name = Name("/test")
+        self.assertTrue(self.computationTable.add_computation(name, 0, Interest(name)))
+        self.assertFalse(self.computationTable.add_computation(Name("/test"), 0, Interest(name)))
+        self.assertTrue(self.computationTable.add_computation(Name("/data"), 0, Interest(Name("/data"))))
+        self.assertEqual(self.computationTable.get_container_size(), 2)
+        self.assertTrue(self.computationTable.is_comp_running(Name("/test")))
+        self.assertFalse(self.computationTable.is_comp_running(Name("/hello")))
+
+    def test_get_computation(self):
+        """Test getting an entry from the computation table"""
+        name = Name("/test")
+        self.computationTable.add_computation(name, 0, Interest(name))
+        self.assertEqual(self.computationTable.get_computation(Name("/test")).original_name, name)
+        self.assertIsNone(self.computationTable.get_computation(Name("/data")))
+
+    def test_remove_and_append_computation(self):
+        """Test removing and appending a computation"""
+        name = Name("/test")
+        name2 = Name("/data")
+        self.computationTable.add_computation(name, 0, Interest(name))
+        self.computationTable.add_computation(name2, 1, Interest(name2))
+        comp = self.computationTable.get_computation(name)
+        self.computationTable.remove_computation(name)
+        self.assertEqual(self.computationTable.get_container_size(), 1)
+        self.computationTable.remove_computation(name)
+        self.computationTable.append_computation(comp)
+        self.computationTable.append_computation(comp)
+        container = self.computationTable.get_container()
+        self.assertEqual(len(container), 2)
+        self.assertEqual(container[0].original_name, name2)
+        self.assertEqual(container[1].original_name, name)
+
+    def test_update_status_and_await_list(self):
+        """Test updating the status and the await list of a computation"""
+        name = Name("/test")
+        name2 = Name("/data")
+        self.computationTable.add_computation(name, 0, Interest(name))
+        self.computationTable.add_computation(name2, 1, Interest(name2))
+        self.computationTable.update_status(name, NFNComputationState.FWD)
+        self.computationTable.add_awaiting_data(name, Name("/request"))
+        self.assertEqual(self.computationTable.get_computation(name).comp_state, NFNComputationState.FWD)
+        self.assertEqual(self.computationTable.get_computation(name).awaiting_data, [Name("/request")])
+        self.assertEqual(self.computationTable.get_computation(name2).comp_state, NFNComputationState.START)
+        self.assertEqual(self.computationTable.get_computation(name2).awaiting_data, [])
+
+    def test_push_data(self):
+        """Test that pushed data are only delivered to computations waiting for them"""
+        name = Name("/test")
+        name2 = Name("/data")
+        request_name = Name("/request")
+        self.computationTable.add_computation(name, 0, Interest(name))
+        self.computationTable.add_computation(name2, 1, Interest(name2))
+        self.assertFalse(self.computationTable.push_data(Content(request_name, "data")))
+        self.computationTable.add_awaiting_data(name, request_name)
+        self.assertTrue(self.computationTable.push_data(Content(request_name, "data")))
+        self.assertEqual(self.computationTable.get_computation(name).awaiting_data, [])
+        self.assertEqual(self.computationTable.get_computation(name).available_data, {request_name: "data"})
+        self.assertEqual(self.computationTable.get_computation(name2).available_data, {})
+        self.assertFalse(self.computationTable.push_data(Content(request_name, "data")))
+
+    def test_ready_computations(self):
+        """Test that ready computations are tracked while data arrive"""
+        names = [Name("/test"), Name("/data"), Name("/hello"), Name("/world")]
+        for i, name in enumerate(names):
+            self.computationTable.add_computation(name, i, Interest(name))
+        self.assertEqual(len(self.computationTable.get_ready_computations()), 4)
+        request_name = Name("/request")
+        request_name2 = Name("/request2")
+        for name in names[:3]:
+            self.computationTable.add_awaiting_data(name, request_name)
+        self.computationTable.add_awaiting_data(names[3], request_name2)
+        self.assertEqual(self.computationTable.get_ready_computations(), [])
+
+        self.computationTable.push_data(Content(request_name))
+        ready_comps = self.computationTable.get_ready_computations()
+        self.assertEqual(list(map(lambda c: c.original_name, ready_comps)), names[:3])
+
+        self.computationTable.remove_computation(names[0])
+        self.computationTable.push_data(Content(request_name2))
+        ready_comps = self.computationTable.get_ready_computations()
+        self.assertEqual(list(map(lambda c: c.original_name, ready_comps)), names[1:])
+
+    def test_ready_computations_excludes_r2c(self):
+        """Test if the list of ready computations excludes R2C"""
+        name = Name("/test/NFN")
+        self.computationTable.add_computation(name, 0, Interest(name))
+        self.computationTable.add_awaiting_data(name, Name("/test/R2C"))
+        self.assertEqual(len(self.computationTable.get_computation(name).awaiting_data), 1)
+        ready_comps = self.computationTable.get_ready_computations()
+        self.assertEqual(list(map(lambda c: c.original_name, ready_comps)), [name])
+
+    def test_computation_table_rewrite(self):
+        """test computation rewriting"""
+        name = Name("/test/NFN")
+        self.computationTable.add_computation(name, 0, Interest(name))
+        self.computationTable.update_status(name, NFNComputationState.REWRITE)
+        rewrite_list = [Name("/test1/NFN"), Name("/test2/NFN")]
+        entry = self.computationTable.get_computation(name)
+        self.computationTable.remove_computation(name)
+        entry.rewrite_list = rewrite_list
+        self.computationTable.append_computation(entry)
+        #do not match wrong data
+        self.assertFalse(self.computationTable.push_data(Content(Name("/test2/NFN"))))
+        self.assertEqual(self.computationTable.get_computation(name).comp_state, NFNComputationState.REWRITE)
+        #match correct data
+        self.assertTrue(self.computationTable.push_data(Content(Name("/test1/NFN"), "HelloWorld")))
+        self.assertEqual(self.computationTable.get_computation(name).comp_state, NFNComputationState.WRITEBACK)
+        ready = self.computationTable.get_ready_computations()
+        self.assertEqual(name, ready[0].original_name)
+        self.assertEqual("HelloWorld", ready[0].available_data.get(rewrite_list[0]))
+
+    def test_computation_table_ageing_mixed_requests_and_ready_computations(self):
+        """test the ageing of the computation table using nfn and non nfn requests, and check ready computations"""
+        name = Name("/test/NFN")
+        name2 = Name("/data/NFN")
+        self.computationTable.add_computation(name, 0, Interest(name))
+        self.computationTable.add_computation(name2, 0, Interest(name2))
+        self.computationTable.get_computation(name).timeout = 1.0
+        self.computationTable.get_computation(name2).timeout = 1.0
+
+        request_name = Name("/request/NFN")
+        request_name1 = Name("/request1")
+        request_name2 = Name("/request2/NFN")
+        self.computationTable.add_awaiting_data(name, request_name)
+        self.computationTable.add_awaiting_data(name, request_name1)
+        self.computationTable.add_awaiting_data(name2, request_name2)
+
+        self.assertEqual(self.computationTable.ageing(), ([], []))
+        time.sleep(2)
+        res = self.computationTable.ageing()
+        r2c_name = self.r2cclient.R2C_create_message(request_name2)
+        self.assertEqual(res, ([request_name2, r2c_name], [name]))
+        self.assertEqual(self.computationTable.get_container_size(), 1)
+
+        #data of the removed computation are not used anymore, R2C replies reach the aged computation
+        self.assertFalse(self.computationTable.push_data(Content(request_name1)))
+        self.assertTrue(self.computationTable.push_data(Content(r2c_name)))
+        self.assertEqual(self.computationTable.get_ready_computations(), [])
+        self.assertTrue(self.computationTable.push_data(Content(request_name2)))
+        ready_comps = self.computationTable.get_ready_computations()
+        self.assertEqual(list(map(lambda c: c.original_name, ready_comps)), [name2])
@@ -0,0 +1,175 @@
+"""Pool of worker processes executing NFN computations"""
+
+import itertools
+import multiprocessing
+import queue
+import signal
+import threading
+import time
+
+from typing import Dict, List
+
+from PiCN.Layers.NFNLayer.NFNExecutor import BaseNFNExecutor
+
+
+class NFNExecutionTimeout(Exception):
+    """Raised in a worker if a computation exceeds its timeout"""
+
+
+class NFNExecutorPool(object):
+    """Executes NFN computations in worker processes, so the NFN layer keeps handling packets while functions run.
+    Workers are started by the process creating the pool (layer processes are daemons and cannot start processes),
+    each worker holds its own copy of the executors. Results are put into a queue, which the NFN layer waits for in its
+    process loop (see LayerProcess.add_reader).
+    A supervisor thread in the process starting the pool terminates workers running a computation for longer than
+    kill_delay after its timeout (functions swallowing the timeout) and restarts workers which died during a computation.
+    The computation of such a worker is reported as timed out.
+    :param executors: executors by language, as used by the NFN layer
+    :param num_of_workers: number of worker processes
+    :param max_pending: maximum number of computations queued or running, further computations are rejected
+    :param timeout: seconds a computation may run before it is terminated by its worker, 0 for no limit
+    :param kill_delay: seconds after the timeout until the worker of a computation is terminated
+    """
+
+    def __init__(self, executors: Dict[str, BaseNFNExecutor], num_of_workers: int=2, max_pending: int=16,
+                 timeout: float=10.0, kill_delay: float=1.0):
+        self.executors = executors
+        self.num_of_workers = num_of_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.kill_delay = kill_delay
+        self._tasks = multiprocessing.Queue()
+        self._results = multiprocessing.Queue()
+        self._workers: List[multiprocessing.Process] = []
+        self._running: List = [] # per worker: id of the running task (-1 if idle) and its start time
+        self._supervisor: threading.Thread = None
+        self._stopped = threading.Event()
+        self._pending: Dict[int, object] = {}
+        self._ids = itertools.count()
+
+    @property
+    def result_reader(self):
+        """Connection of the result queue, readable if computations finished"""
+        return self._results._reader
+
+    def start(self):
+        """start the worker processes, nothing happens if they are running"""
+        if self._workers:
+            return
+        for i in range(0, self.num_of_workers):
+            self._running.append(multiprocessing.Array('d', [-1.0, 0.0]))
+            self._workers.append(self._start_worker(i))
+        self._stopped.clear()
+        self._supervisor = threading.Thread(target=self._supervise, daemon=True)
+        self._supervisor.start()
+
+    def stop(self):
+        """terminate the worker processes"""
+        if self._supervisor is not None:
+            self._stopped.set()
+            self._supervisor.join()
+            self._supervisor = None
+        for worker in self._workers:
+            worker.terminate()
+            worker.join()
+        self._workers = []
+        self._running = []
+
+    def submit(self, key, language: str, function_code: str, params: List) -> bool:
+        """queue a computation
+        :param key: object identifying the computation, returned by collect
+        :param language: language of the function code, selects the executor
+        :param function_code: function code to be executed
+        :param params: parameters of the function
+        :return: False if max_pending computations are queued or running
+        """
+        if len(self._pending) >= self.max_pending:
+            return False
+        task_id = next(self._ids)
+        self._pending[task_id] = key
+        self._tasks.put((task_id, language, function_code, params))
+        return True
+
+    def collect(self) -> List:
+        """get the finished computations without waiting
+        :return: list of (key, result, timed_out), result is the string representation of the result or None
+        """
+        finished = []
+        while True:
+            try:
+                task_id, result, timed_out = self._results.get_nowait()
+            except queue.Empty:
+                return finished
+            key = self._pending.pop(task_id, None)
+            if key is not None:
+                finished.append((key, result, timed_out))
+
+    def __len__(self):
+        return len(self._pending)
+
+    def _start_worker(self, i: int) -> multiprocessing.Process:
+        """start the worker with index i"""
+        worker = multiprocessing.Process(target=_run_worker, args=[self.executors, self._tasks, self._results,
+                                                                   self.timeout, self._running[i]])
+        worker.daemon = True
+        worker.start()
+        return worker
+
+    def _supervise(self):
+        """restart workers which died or exceeded the deadline of their computation, report it as timed out"""
+        interval = min(0.1, self.timeout / 4) if self.timeout > 0 else 0.1
+        while not self._stopped.wait(interval):
+            now = time.time()
+            for i, worker in enumerate(self._workers):
+                with self._running[i].get_lock():
+                    task_id, started = self._running[i][:]
+                    expired = task_id >= 0 and self.timeout > 0 and now - started > self.timeout + self.kill_delay
+                    if worker.is_alive() and not expired:
+                        continue
+                    self._running[i][0] = -1.0
+                worker.terminate()
+                worker.join()
+                if task_id >= 0:
+                    self._results.put((int(task_id), None, True))
+                self._workers[i] = self._start_worker(i)
+
+
+def _run_worker(executors: Dict[str, BaseNFNExecutor], tasks: multiprocessing.Queue, results: multiprocessing.Queue,
+                timeout: float, running):
+    """process loop of a worker, executes computations and puts their results
+    :param running: shared array, set to the id and start time of the running task for the supervisor
+    """
+    expired = []
+
+    def on_alarm(signum, frame):
+        expired.append(True)
+        raise NFNExecutionTimeout()
+
+    use_alarm = timeout > 0 and hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, on_alarm)
+    while True:
+        task_id, language, function_code, params = tasks.get()
+        with running.get_lock():
+            running[0], running[1] = task_id, time.time()
+        expired.clear()
+        result = None
+        executor = executors.get(language)
+        try:
+            try:
+                if use_alarm:
+                    signal.setitimer(signal.ITIMER_REAL, timeout)
+                if executor is not None:
+                    result = executor.execute(function_code=function_code, params=params)
+            finally:
+                if use_alarm:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+        except NFNExecutionTimeout:
+            pass
+        if expired:
+            result = None
+        with running.get_lock():
+            if running[0] != task_id: # reported as timed out by the supervisor, which terminates this worker
+                continue
+            running[0] = -1.0
+        results.put((task_id, None if result is None else str(result), bool(expired)))
@@ -1,43 +1,81 @@
 """NFN executor for Named Functions written in Python"""
 
-from typing import List
+import hashlib
+
+from typing import Dict, List
 from types import FunctionType, CodeType
 
+from PiCN.Layers.ICNLayer.ContentStore.ReplacementPolicy import BaseReplacementPolicy, LRUReplacementPolicy
 from PiCN.Layers.NFNLayer.NFNExecutor import BaseNFNExecutor
 
 class NFNPythonExecutor(BaseNFNExecutor):
+    """Executes Named Functions written in Python. Compiled entry points are cached by the digest of the function code,
+    each function gets its own namespace containing the sandbox and its library functions.
+    :param cache_size: maximum number of cached functions, 0 disables the cache
+    :param replacement_policy: policy choosing the cached function to be evicted, LRU if None
+    """
 
-    def __init__(self):
+    def __init__(self, cache_size: int=128, replacement_policy: BaseReplacementPolicy=None):
         self._language = "PYTHON"
         self._sandbox = self._init_sandbox()
+        self._cache_size = cache_size
+        self._cache: Dict[bytes, FunctionType] = {}
+        self._replacement_policy = replacement_policy if replacement_policy is not None else LRUReplacementPolicy()
 
     def execute(self, function_code: str, params: List):
         try:
-            entry_function_name, program_code = self._get_entry_function_name(function_code)
-            if entry_function_name is None or program_code is None:
-                return None
-            machine_code = compile(program_code, '', 'exec')
-            if machine_code is None:
-                return None
-            entry_point = None
-            lib_functions = []
-            for fcode in machine_code.co_consts:
-                if isinstance(fcode, CodeType):
-                    if fcode.co_name == entry_function_name:
-                        entry_point = FunctionType(fcode, self._sandbox)
-                    else:
-                        lib_functions.append((fcode.co_name, FunctionType(fcode, self._sandbox)))
+            entry_point = self._get_entry_point(function_code)
             if entry_point is None:
                 return None
-            for lf in lib_functions: #enable calling of all functions but not the entry point
-                if lf[1] is None:
-                    continue
-                self._sandbox[lf[0]] = lf[1]
             return entry_point(*params)
         except:
             #raise
             return None
 
+    def _get_entry_point(self, function_code: str) -> FunctionType:
+        """get the compiled entry point of a function code from the cache or compile it"""
+        key = hashlib.sha256(function_code.encode()).digest()
+        entry_point = self._cache.get(key)
+        if entry_point is not None:
+            self._replacement_policy.access(key)
+            return entry_point
+        entry_point = self._compile(function_code)
+        if entry_point is None or self._cache_size <= 0:
+            return entry_point
+        while len(self._cache) >= self._cache_size:
+            evicted = self._replacement_policy.evict()
+            if evicted is None:
+                break
+            self._cache.pop(evicted, None)
+        self._cache[key] = entry_point
+        self._replacement_policy.insert(key)
+        return entry_point
+
+    def _compile(self, function_code: str) -> FunctionType:
+        """compile a function code to its entry point, bound to a new namespace"""
+        entry_function_name, program_code = self._get_entry_function_name(function_code)
+        if entry_function_name is None or program_code is None:
+            return None
+        machine_code = compile(program_code, '', 'exec')
+        if machine_code is None:
+            return None
+        namespace = dict(self._sandbox)
+        entry_point = None
+        lib_functions = []
+        for fcode in machine_code.co_consts:
+            if isinstance(fcode, CodeType):
+                if fcode.co_name == entry_function_name:
+                    entry_point = FunctionType(fcode, namespace)
+                else:
+                    lib_functions.append((fcode.co_name, FunctionType(fcode, namespace)))
+        if entry_point is None:
+            return None
+        for lf in lib_functions: #enable calling of all functions but not the entry point
+            if lf[1] is None:
+                continue
+            namespace[lf[0]] = lf[1]
+        return entry_point
+
     def _get_entry_function_name(self, function: str) -> (str, str):
         code_parts = function.split('\n', 2)
         if len(code_parts) != 3:
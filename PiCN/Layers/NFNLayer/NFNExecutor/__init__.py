@@ -2,4 +2,5 @@
     REQUIRE SANDBOXING """
 
 from .BaseNFNExecutor import BaseNFNExecutor
-from .NFNPythonExecutor import NFNPythonExecutor
\ No newline at end of file
+from .NFNPythonExecutor import NFNPythonExecutor
+from .NFNExecutorPool import NFNExecutorPool
@@ -0,0 +1,82 @@
+"""Tests for the NFNExecutorPool"""
+
+import time
+import unittest
+
+from multiprocessing.connection import wait
+
+from PiCN.Layers.NFNLayer.NFNExecutor import NFNPythonExecutor, NFNExecutorPool
+
+class test_NFNExecutorPool(unittest.TestCase):
+    """Tests for the NFNExecutorPool"""
+
+    def setUp(self):
+        self.pool = NFNExecutorPool({"PYTHON": NFNPythonExecutor()}, num_of_workers=2, max_pending=2, timeout=0.5,
+                                    kill_delay=0.5)
+        self.pool.start()
+
+    def tearDown(self):
+        self.pool.stop()
+
+    def collect(self, num_of_results: int):
+        """wait for a number of finished computations"""
+        results = []
+        while len(results) < num_of_results:
+            if not wait([self.pool.result_reader], timeout=5.0):
+                self.fail()
+            results.extend(self.pool.collect())
+        return results
+
+    def test_execute(self):
+        """Test executing a function in a worker"""
+        NF = "PYTHON\nf\ndef f(a, b):\n    return a*b\n"
+        self.assertTrue(self.pool.submit("c1", "PYTHON", NF, [2, 3]))
+        self.assertEqual(self.collect(1), [("c1", "6", False)])
+        self.assertEqual(len(self.pool), 0)
+
+    def test_unknown_language(self):
+        """Test that a function in a language without executor has no result"""
+        self.assertTrue(self.pool.submit("c1", "JAVA", "JAVA\nf\n", []))
+        self.assertEqual(self.collect(1), [("c1", None, False)])
+
+    def test_queue_full(self):
+        """Test that computations are rejected if max_pending computations are running"""
+        NF = "PYTHON\nf\ndef f():\n    return 1\n"
+        self.assertTrue(self.pool.submit("c1", "PYTHON", NF, []))
+        self.assertTrue(self.pool.submit("c2", "PYTHON", NF, []))
+        self.assertFalse(self.pool.submit("c3", "PYTHON", NF, []))
+        self.assertEqual(sorted(self.collect(2)), [("c1", "1", False), ("c2", "1", False)])
+        self.assertTrue(self.pool.submit("c3", "PYTHON", NF, []))
+
+    def test_timeout(self):
+        """Test that a computation exceeding the timeout is terminated and the worker is reused"""
+        NF = "PYTHON\nf\ndef f():\n    while True:\n        pass\n"
+        self.assertTrue(self.pool.submit("c1", "PYTHON", NF, []))
+        self.assertEqual(self.collect(1), [("c1", None, True)])
+        self.assertTrue(self.pool.submit("c2", "PYTHON", "PYTHON\nf\ndef f():\n    return 2\n", []))
+        self.assertEqual(self.collect(1), [("c2", "2", False)])
+
+    def test_timeout_swallowed(self):
+        """Test that the worker of a computation swallowing the timeout is terminated and restarted"""
+        NF = "PYTHON\nf\ndef f():\n    while True:\n        try:\n            while True:\n                pass\n" \
+             "        except:\n            pass\n"
+        self.assertTrue(self.pool.submit("c1", "PYTHON", NF, []))
+        self.assertTrue(self.pool.submit("c2", "PYTHON", NF, []))
+        self.assertEqual(sorted(self.collect(2)), [("c1", None, True), ("c2", None, True)])
+        self.assertEqual(len(self.pool), 0)
+        self.assertTrue(self.pool.submit("c3", "PYTHON", "PYTHON\nf\ndef f():\n    return 3\n", []))
+        self.assertEqual(self.collect(1), [("c3", "3", False)])
+
+    def test_worker_died(self):
+        """Test that a worker which died during a computation is restarted and the computation is terminated"""
+        NF = "PYTHON\nf\ndef f():\n    while True:\n        pass\n"
+        self.assertTrue(self.pool.submit("c1", "PYTHON", NF, []))
+        until = time.time() + 5.0
+        while all(running[0] < 0 for running in self.pool._running) and time.time() < until:
+            time.sleep(0.01)
+        for worker, running in zip(self.pool._workers, self.pool._running):
+            if running[0] >= 0:
+                worker.terminate()
+        self.assertEqual(self.collect(1), [("c1", None, True)])
+        self.assertTrue(self.pool.submit("c2", "PYTHON", "PYTHON\nf\ndef f():\n    return 2\n", []))
+        self.assertEqual(self.collect(1), [("c2", "2", False)])
@@ -114,4 +114,50 @@ def f(a):
     return res
     """
         res = self.executor.execute(NF, [4])
-        self.assertEqual(res, None)
\ No newline at end of file
+        self.assertEqual(res, None)
+
+    def test_repeated_function_call_uses_cache(self):
+        """Test that a function code is compiled once and executed from the cache afterwards"""
+        NF = \
+"""PYTHON
+f
+def f(a):
+    return a + 1
+"""
+        self.assertEqual(self.executor.execute(NF, [1]), 2)
+        entry_point = self.executor._get_entry_point(NF)
+        self.assertEqual(self.executor.execute(NF, [2]), 3)
+        self.assertIs(self.executor._get_entry_point(NF), entry_point)
+        self.assertEqual(len(self.executor._cache), 1)
+
+    def test_cache_eviction(self):
+        """Test that the least recently used function is evicted if the cache is full"""
+        self.executor = NFNPythonExecutor(cache_size=2)
+        NFs = ["PYTHON\nf\ndef f():\n    return " + str(i) + "\n" for i in range(0, 3)]
+        self.assertEqual(self.executor.execute(NFs[0], []), 0)
+        self.assertEqual(self.executor.execute(NFs[1], []), 1)
+        self.assertEqual(self.executor.execute(NFs[0], []), 0)
+        self.assertEqual(self.executor.execute(NFs[2], []), 2)
+        self.assertEqual(len(self.executor._cache), 2)
+        entry_point = self.executor._get_entry_point(NFs[0])
+        self.assertIs(self.executor._get_entry_point(NFs[0]), entry_point)
+        self.assertEqual(self.executor.execute(NFs[1], []), 1)
+
+    def test_library_functions_not_shared(self):
+        """Test that library functions of a function code are not visible to other function codes"""
+        NF1 = \
+"""PYTHON
+f
+def g(b):
+    return b*b
+def f(a):
+    return g(a)
+"""
+        NF2 = \
+"""PYTHON
+f
+def f(a):
+    return g(a)
+"""
+        self.assertEqual(self.executor.execute(NF1, [3]), 9)
+        self.assertEqual(self.executor.execute(NF2, [3]), None)
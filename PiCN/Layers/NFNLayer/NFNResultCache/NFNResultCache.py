@@ -0,0 +1,164 @@
+"""Cache for the results of deterministic Named Functions"""
+
+import hashlib
+import re
+
+from typing import Dict, List, Set
+
+from PiCN.Layers.ICNLayer.ContentStore.ReplacementPolicy import BaseReplacementPolicy, LRUReplacementPolicy
+from PiCN.Layers.NFNLayer.Parser.AST import *
+
+
+class NFNResultCache(object):
+    """Caches the results of computations of deterministic Named Functions.
+    A function is deterministic if its code contains the annotation line "#nfn: deterministic", functions whose result
+    does not depend on the order of their parameters can additionally be annotated as commutative
+    ("#nfn: deterministic, commutative"). Annotations are learned when a function is executed by this node.
+    Results are stored by a key built from the normalised call, the digest of the function code and the digests of
+    the contents of the parameters, so computations are not executed again if the same data are passed. Additionally,
+    the normalised expression of a computation refers to its result, so repeated computations of deterministic
+    functions can be answered without fetching the function and the parameters.
+    :param max_entries: maximum number of cached results
+    :param replacement_policy: policy choosing the result to be evicted, LRU if None
+    """
+
+    DETERMINISTIC = "deterministic"
+    COMMUTATIVE = "commutative"
+
+    def __init__(self, max_entries: int=256, replacement_policy: BaseReplacementPolicy=None):
+        self.max_entries = max_entries
+        self._replacement_policy = replacement_policy if replacement_policy is not None else LRUReplacementPolicy()
+        self._results: Dict[str, str] = {}
+        self._expressions: Dict[str, str] = {}
+        self._expressions_of_result: Dict[str, Set[str]] = {}
+        self._annotations: Dict[str, Set[str]] = {}
+        self._annotation_pattern = re.compile(r"^\s*#\s*nfn:(.*)$", re.MULTILINE)
+
+    def annotate(self, function_name: str, function_code: str) -> bool:
+        """read the annotations of a function from its code
+        :param function_name: name of the function as used in expressions
+        :param function_code: code of the function
+        :return: True if the function is deterministic
+        """
+        annotations = set()
+        for line in self._annotation_pattern.findall(function_code):
+            annotations.update(map(lambda a: a.strip().lower(), line.split(",")))
+        self._annotations[function_name] = annotations
+        return self.DETERMINISTIC in annotations
+
+    def is_deterministic(self, ast: AST) -> bool:
+        """check if all functions of an expression are known to be deterministic
+        :param ast: expression to be checked
+        """
+        if not isinstance(ast, AST_FuncCall):
+            return True
+        if self.DETERMINISTIC not in self._annotations.get(ast._element, ()):
+            return False
+        return all(map(self.is_deterministic, ast.params))
+
+    def normalize(self, ast: AST) -> str:
+        """normalised representation of an expression. Numbers are written in their canonical form and the parameters
+        of commutative functions are sorted.
+        :param ast: expression to be normalised
+        """
+        if isinstance(ast, AST_FuncCall):
+            return self._call(ast, list(map(self.normalize, ast.params)))
+        if isinstance(ast, AST_String):
+            return '"' + ast._element + '"'
+        if isinstance(ast, AST_Int):
+            return str(int(ast._element))
+        if isinstance(ast, AST_Float):
+            return repr(float(ast._element))
+        return ast._element
+
+    def expression_key(self, ast: AST) -> str:
+        """key of an expression, which refers to its result
+        :param ast: expression of the computation
+        :return: the key or None if not all functions of the expression are deterministic
+        """
+        if not isinstance(ast, AST_FuncCall) or not self.is_deterministic(ast):
+            return None
+        return self.normalize(ast)
+
+    def result_key(self, ast: AST_FuncCall, function_code: str, params: List) -> str:
+        """key of a computation, using the digests of the data passed to the function
+        :param ast: expression of the computation
+        :param function_code: code of the function
+        :param params: parameters passed to the function, in the order of the parameters of the expression
+        """
+        args = []
+        for p, value in zip(ast.params, params):
+            if isinstance(p, AST_Name) or isinstance(p, AST_FuncCall):
+                args.append("#" + self._digest(value))
+            else:
+                args.append(self.normalize(p))
+        return self._call(ast, args) + "#" + self._digest(function_code)
+
+    def get(self, result_key: str) -> str:
+        """find a result by the key of the computation
+        :param result_key: key created by result_key
+        :return: the result or None
+        """
+        result = self._results.get(result_key)
+        if result is not None:
+            self._replacement_policy.access(result_key)
+        return result
+
+    def get_expression(self, ast: AST) -> str:
+        """find a result by the expression of a computation
+        :param ast: expression of the computation
+        :return: the result or None
+        """
+        expression_key = self.expression_key(ast)
+        if expression_key is None:
+            return None
+        result_key = self._expressions.get(expression_key)
+        if result_key is None:
+            return None
+        return self.get(result_key)
+
+    def put(self, result_key: str, result: str, expression_key: str=None):
+        """add a result, the least valuable results are evicted if the cache is full
+        :param result_key: key created by result_key
+        :param result: result of the computation
+        :param expression_key: key created by expression_key, which should refer to the result
+        """
+        if self.max_entries <= 0:
+            return
+        if result_key not in self._results:
+            while len(self._results) >= self.max_entries:
+                evicted = self._replacement_policy.evict()
+                if evicted is None:
+                    break
+                self._remove(evicted)
+            self._replacement_policy.insert(result_key)
+        else:
+            self._replacement_policy.access(result_key)
+        self._results[result_key] = result
+        if expression_key is not None:
+            previous = self._expressions.get(expression_key)
+            if previous is not None:
+                self._expressions_of_result.get(previous, set()).discard(expression_key)
+            self._expressions[expression_key] = result_key
+            self._expressions_of_result.setdefault(result_key, set()).add(expression_key)
+
+    def __len__(self):
+        return len(self._results)
+
+    def _remove(self, result_key: str):
+        """remove a result and all expressions referring to it"""
+        self._results.pop(result_key, None)
+        for expression_key in self._expressions_of_result.pop(result_key, ()):
+            self._expressions.pop(expression_key, None)
+
+    def _call(self, ast: AST_FuncCall, args: List[str]) -> str:
+        """representation of a call, with sorted arguments if the function is commutative"""
+        if self.COMMUTATIVE in self._annotations.get(ast._element, ()):
+            args = sorted(args)
+        return ast._element + "(" + ",".join(args) + ")"
+
+    def _digest(self, value) -> str:
+        """digest of a function code or of the content of a parameter"""
+        if not isinstance(value, bytes):
+            value = str(value).encode()
+        return hashlib.sha256(value).hexdigest()
@@ -0,0 +1,3 @@
+"""Result Cache for deterministic Named Functions"""
+
+from .NFNResultCache import NFNResultCache
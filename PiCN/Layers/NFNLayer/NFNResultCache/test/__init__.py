@@ -0,0 +1 @@
+"""Tests of the NFN Result Cache"""
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""Test the NFNResultCache"""
+
+import unittest
+
+from PiCN.Layers.NFNLayer.NFNResultCache import NFNResultCache
+from PiCN.Layers.NFNLayer.Parser import DefaultNFNParser
+
+
+class test_NFNResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = NFNResultCache(max_entries=2)
+        self.parser = DefaultNFNParser()
+        self.code = "PYTHON\nf\n#nfn: deterministic, commutative\ndef f(a, b):\n    return len(a) + len(b)"
+
+    def tearDown(self):
+        pass
+
+    def test_annotate(self):
+        """Test reading the annotations of functions"""
+        self.assertTrue(self.cache.annotate("/func/f1", self.code))
+        self.assertTrue(self.cache.annotate("/func/f2", "PYTHON\nf\n# nfn: Deterministic\ndef f(a):\n    return a"))
+        self.assertFalse(self.cache.annotate("/func/f3", "PYTHON\nf\ndef f(a):\n    return a"))
+        self.assertTrue(self.cache.is_deterministic(self.parser.parse("/func/f1(/func/f2(/data),1)")))
+        self.assertFalse(self.cache.is_deterministic(self.parser.parse("/func/f1(/func/f3(/data),1)")))
+        self.assertFalse(self.cache.is_deterministic(self.parser.parse("/func/f4(1)")))
+
+    def test_normalize(self):
+        """Test that equivalent expressions are normalised to the same key"""
+        self.cache.annotate("/func/f1", self.code)
+        self.cache.annotate("/func/f2", "PYTHON\nf\n#nfn: deterministic\ndef f(a, b):\n    return a - b")
+        self.assertEqual(self.cache.expression_key(self.parser.parse("/func/f1(/data/a,+1)")),
+                         self.cache.expression_key(self.parser.parse("/func/f1(1,/data/a)")))
+        self.assertNotEqual(self.cache.expression_key(self.parser.parse("/func/f2(/data/a,1)")),
+                            self.cache.expression_key(self.parser.parse("/func/f2(1,/data/a)")))
+        self.assertNotEqual(self.cache.expression_key(self.parser.parse("/func/f1(\"1\",/data/a)")),
+                            self.cache.expression_key(self.parser.parse("/func/f1(1,/data/a)")))
+
+    def test_result_key(self):
+        """Test that the key of a computation depends on the data passed, not on the names"""
+        self.cache.annotate("/func/f1", self.code)
+        key1 = self.cache.result_key(self.parser.parse("/func/f1(/data/a,/data/b)"), self.code, ["abc", "de"])
+        key2 = self.cache.result_key(self.parser.parse("/func/f1(/mirror/b,/mirror/a)"), self.code, ["de", "abc"])
+        key3 = self.cache.result_key(self.parser.parse("/func/f1(/data/a,/data/b)"), self.code, ["abc", "xy"])
+        key4 = self.cache.result_key(self.parser.parse("/func/f1(/data/a,/data/b)"), self.code + "\n",
+                                     ["abc", "de"])
+        self.assertEqual(key1, key2)
+        self.assertNotEqual(key1, key3)
+        self.assertNotEqual(key1, key4)
+
+    def test_put_get(self):
+        """Test finding results by the key of the computation and by the expression"""
+        self.cache.annotate("/func/f1", self.code)
+        ast = self.parser.parse("/func/f1(/data/a,/data/b)")
+        key = self.cache.result_key(ast, self.code, ["abc", "de"])
+        self.assertIsNone(self.cache.get(key))
+        self.assertIsNone(self.cache.get_expression(ast))
+        self.cache.put(key, "5", self.cache.expression_key(ast))
+        self.assertEqual(self.cache.get(key), "5")
+        self.assertEqual(self.cache.get_expression(self.parser.parse("/func/f1(/data/b,/data/a)")), "5")
+        self.assertIsNone(self.cache.get_expression(self.parser.parse("/func/f1(/data/b,/data/c)")))
+
+    def test_expression_not_deterministic(self):
+        """Test that results are not found by expressions which contain non deterministic functions"""
+        self.cache.annotate("/func/f1", self.code)
+        ast = self.parser.parse("/func/f1(/data/a,/data/b)")
+        self.cache.put(self.cache.result_key(ast, self.code, ["abc", "de"]), "5", self.cache.expression_key(ast))
+        self.cache.annotate("/func/f1", "PYTHON\nf\ndef f(a, b):\n    return len(a) + len(b)")
+        self.assertIsNone(self.cache.get_expression(ast))
+
+    def test_eviction(self):
+        """Test that the least recently used result and its expressions are evicted"""
+        self.cache.annotate("/func/f1", self.code)
+        asts = [self.parser.parse("/func/f1(" + str(i) + ",/data/a)") for i in range(0, 3)]
+        keys = [self.cache.result_key(ast, self.code, [i, "abc"]) for i, ast in enumerate(asts)]
+        self.cache.put(keys[0], "a", self.cache.expression_key(asts[0]))
+        self.cache.put(keys[1], "b", self.cache.expression_key(asts[1]))
+        self.assertEqual(self.cache.get(keys[0]), "a")
+        self.cache.put(keys[2], "c", self.cache.expression_key(asts[2]))
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertIsNone(self.cache.get_expression(asts[1]))
+        self.assertEqual(self.cache.get_expression(asts[0]), "a")
+        self.assertEqual(self.cache.get_expression(asts[2]), "c")
+
+    def test_disabled(self):
+        """Test that nothing is cached if the cache has no entries"""
+        cache = NFNResultCache(max_entries=0)
+        cache.put("key", "result")
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(len(cache), 0)
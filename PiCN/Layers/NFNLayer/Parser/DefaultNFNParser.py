@@ -1,5 +1,6 @@
 """Default Parser for NFN"""
 
+from collections import OrderedDict
 from typing import Dict
 
 from PiCN.Packets import Name
@@ -11,10 +12,15 @@ from PiCN.Layers.NFNLayer.Parser.AST import *
 
 
 class DefaultNFNParser(object):
-    """Default Parser for NFN"""
+    """Default Parser for NFN
+    :param cache_size: number of network names for which the nfn string and the AST are cached (LRU), 0 disables the
+    cache. Cached ASTs are shared, they must not be modified.
+    """
 
-    def __init__(self):
+    def __init__(self, cache_size: int=256):
         """Default Parser for NFN"""
+        self._cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
         self.stringToken = Token(TokenType.STRING, r'"', r'[A-Za-z0-9]', r'"')
         self.intToken = Token(TokenType.INT, r'[0-9\+\-]', r'[0-9]', r'[0-9]')
         self.floatToken = Token(TokenType.FLOAT, r'[0-9\+\-]', r'[0-9.Ee]', r'[0-9]')
@@ -78,7 +84,32 @@ class DefaultNFNParser(object):
             return None #Syntax error
         return root
 
+    def network_name_to_ast(self, name: Name) -> (str, Name, AST):
+        """Convert a network name to the nfn string and parse it, results are cached
+        :param name: network name of the computation
+        :return: nfn string, prepended name and AST (None if the nfn string could not be parsed)
+        """
+        key = name.key
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+        nfn_str, prepended_name = self._network_name_to_nfn_str(name)
+        ast = self.parse(nfn_str) if nfn_str is not None else None
+        if self._cache_size > 0:
+            self._cache[key] = (nfn_str, prepended_name, ast)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return nfn_str, prepended_name, ast
+
     def network_name_to_nfn_str(self, name: Name) -> str:
+        cached = self._cache.get(name.key)
+        if cached is not None:
+            self._cache.move_to_end(name.key)
+            return cached[0], cached[1]
+        return self._network_name_to_nfn_str(name)
+
+    def _network_name_to_nfn_str(self, name: Name) -> str:
         if len(name.components) == 2:
             return name.string_components[0], None
         if name.string_components [-1] != "NFN":
@@ -2,6 +2,7 @@
     * Define startpattern, valied pattern and stop patten to parse a token
     * always uses the longest possible pattern
     * to single char pattern has no token and stop pattern, both must be ""
+    * start and stop patterns match a single char
 """
 
 import re
@@ -34,15 +35,14 @@ class Token(object):
             self._tokens = None
         if stopChars == "":
             self._stopChars = None
+        self.pattern: str = self._to_pattern(startChars, tokens, stopChars)
 
     def getToken(self, input: str) -> (TokenType, str):
         res: str = ""
         if len(input) < 1 or not self._startChars.match(input[0]):
             return (TokenType.NONE, "")
         res = res + input[0]
-        if len(input) > 1:
-            input = input[1:]
-        for i in input:
+        for i in input[1:]:
             if self._tokens and self._tokens.match(i):
                 res = res + i
             elif self._stopChars and self._stopChars.match(i):
@@ -52,6 +52,18 @@ class Token(object):
                 return self.verifyStartEnd(res)
         return self.verifyStartEnd(res)
 
+    def _to_pattern(self, startChars: str, tokens: str, stopChars: str) -> str:
+        """regular expression matching the same string as getToken: token chars are matched as long as possible (no
+        backtracking), a following stop char is included, otherwise the last char must be a stop char
+        """
+        if tokens == "" and stopChars == "":
+            return startChars
+        if stopChars == "":
+            return startChars + "(?:" + tokens + ")*"
+        if tokens == "":
+            return startChars + "(?:" + stopChars + "|(?<=" + stopChars + "))"
+        return startChars + "(?:" + tokens + ")*(?!" + tokens + ")(?:" + stopChars + "|(?<=" + stopChars + "))"
+
     def verifyStartEnd(self, string: str):
         if self._startChars.match(string[0]) and not self._stopChars and len(string) == 1:
             return (self._type, string)
@@ -66,24 +78,31 @@ class DefaultNFNTokenizer(object):
     def __init__(self):
         self._tokens: List[Token] = []
         self.empty_tokens = re.compile(r"[\(\"]")
+        self._master_pattern = None
 
     def add_token(self, token: Token):
         """Add a Token to the Token-List"""
         self._tokens.append(token)
+        self._master_pattern = None
 
     def tokenize(self, input: str) -> List[Tuple[TokenType, str]]:
-        """Tokenize a given String"""
+        """Tokenize a given String. At each position, a single master regular expression matches all tokens, the
+        longest match is used (the first added token if several matches have the same length).
+        """
+        if self._master_pattern is None:
+            self._master_pattern = re.compile("".join(map(lambda t: "(?:(?=(" + t.pattern + ")))?", self._tokens)))
         res = []
-        cur_string = input
-        max_iterations = len(input)
-        while cur_string is not "" and max_iterations > 0:
-            ts = []
-            for token in self._tokens:
-                ts.append(token.getToken(cur_string))
-            res_tok = max(ts, key=lambda t: len(t[1]))
-            if res_tok[0] == TokenType.NONE or res_tok[1] == "":
+        pos = 0
+        while pos < len(input):
+            matches = self._master_pattern.match(input, pos).groups()
+            length = 0
+            index = None
+            for i, m in enumerate(matches):
+                if m is not None and len(m) > length:
+                    length = len(m)
+                    index = i
+            if index is None:
                 return None
-            res.append(res_tok)
-            cur_string = cur_string[len(res_tok[1]):]
-            --max_iterations
+            res.append((self._tokens[index]._type, matches[index]))
+            pos += length
         return res
@@ -163,4 +163,37 @@ class test_DefaultNFNParser(unittest.TestCase):
         compname += function_str
         compname += "NFN"
         res = self.parser.nfn_str_to_network_name(nfn_str)
-        self.assertEqual(res, compname)
\ No newline at end of file
+        self.assertEqual(res, compname)
+
+    def test_network_name_to_ast_cache(self):
+        """Test that network names are converted and parsed once, least recently used names are evicted"""
+        parser = DefaultNFNParser(cache_size=2)
+        names = []
+        for i in range(0, 3):
+            n = Name("/test/data")
+            n += '/call/func(' + str(i) + ',_)'
+            n += "NFN"
+            names.append(n)
+        nfn_str, prepended, ast = parser.network_name_to_ast(names[0])
+        self.assertEqual(nfn_str, '/call/func(0,/test/data)')
+        self.assertEqual(prepended, Name("/test/data"))
+        self.assertEqual(str(ast), nfn_str)
+        self.assertIs(parser.network_name_to_ast(Name(names[0].components))[2], ast)
+        self.assertEqual(parser.network_name_to_nfn_str(names[0]), (nfn_str, prepended))
+        ast1 = parser.network_name_to_ast(names[1])[2]
+        parser.network_name_to_ast(names[0])
+        parser.network_name_to_ast(names[2])
+        self.assertIs(parser.network_name_to_ast(names[0])[2], ast)
+        self.assertIsNot(parser.network_name_to_ast(names[1])[2], ast1)
+
+    def test_network_name_to_ast_no_cache(self):
+        """Test converting and parsing network names with disabled cache"""
+        parser = DefaultNFNParser(cache_size=0)
+        n = Name()
+        n += "/call/func(/test/data)"
+        n += "NFN"
+        nfn_str, prepended, ast = parser.network_name_to_ast(n)
+        self.assertEqual(nfn_str, "/call/func(/test/data)")
+        self.assertIsNone(prepended)
+        self.assertIsNot(parser.network_name_to_ast(n)[2], ast)
+        self.assertEqual(str(parser.network_name_to_ast(n)[2]), nfn_str)
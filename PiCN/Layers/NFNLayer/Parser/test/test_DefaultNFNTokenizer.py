@@ -100,3 +100,16 @@ class test_DefaultNFNTokenizer(unittest.TestCase):
 
         tokens = self.tokenizer.tokenize(test_string)
         self.assertEqual(expected_res, tokens)
+
+    def test_Tokenizer_single_char_at_end(self):
+        """Test that a single char at the end of the string is a complete token"""
+        self.assertEqual([(TokenType.INT, "7")], self.tokenizer.tokenize("7"))
+        self.assertEqual([(TokenType.VAR, "x")], self.tokenizer.tokenize("x"))
+        self.assertEqual([(TokenType.ENDFUNCCALL, ')'), (TokenType.INT, "1")], self.tokenizer.tokenize(")1"))
+
+    def test_Tokenizer_no_backtracking(self):
+        """Test that token chars are matched as long as possible, a name must not end with /"""
+        self.assertEqual(None, self.tokenizer.tokenize("/test/data/"))
+        self.assertEqual(None, self.tokenizer.tokenize("/call/func(/test/,1)"))
+        self.assertEqual([(TokenType.FLOAT, "1.5"), (TokenType.PARAMSEPARATOR, ","), (TokenType.INT, "-2")],
+                         self.tokenizer.tokenize("1.5,-2"))
@@ -4,8 +4,11 @@ import time
 import unittest
 import multiprocessing
 
+from multiprocessing.connection import wait
+
 from PiCN.Layers.NFNLayer import BasicNFNLayer
-from PiCN.Layers.NFNLayer.NFNExecutor import NFNPythonExecutor
+from PiCN.Layers.NFNLayer.NFNExecutor import NFNPythonExecutor, NFNExecutorPool
+from PiCN.Layers.NFNLayer.NFNResultCache import NFNResultCache
 from PiCN.Layers.NFNLayer.Parser import DefaultNFNParser
 from PiCN.Layers.NFNLayer.NFNComputationTable import *
 from PiCN.Layers.NFNLayer.R2C import TimeoutR2CHandler
@@ -69,6 +72,62 @@ class test_BasicNFNLayer(unittest.TestCase):
         res = self.nfn_layer.queue_to_lower.get(timeout=2.0)
         self.assertEqual(Content(computation_name, "25"), res[1])
 
+    def test_compute_executor_pool(self):
+        """Test computing in an executor pool, rejecting computations if the pool is full"""
+        pool = NFNExecutorPool(self.executor, num_of_workers=1, max_pending=1)
+        self.nfn_layer.executor_pool = pool
+        pool.start()
+        computation_names = []
+        for i in range(0, 2):
+            computation_name = Name("/func/f1")
+            computation_name += "_(" + str(i) + ")"
+            computation_name += "NFN"
+            computation_entry = NFNComputationTableEntry(computation_name)
+            computation_entry.available_data[Name("/func/f1")] = "PYTHON\nf\ndef f(a):\n    return a + 25"
+            computation_str, prepended = self.nfn_layer.parser.network_name_to_nfn_str(computation_name)
+            computation_entry.ast = self.nfn_layer.parser.parse(computation_str)
+            self.nfn_layer.computation_table.append_computation(computation_entry)
+            self.nfn_layer.compute(Interest(computation_name))
+            computation_names.append(computation_name)
+        try:
+            res = self.nfn_layer.queue_to_lower.get(timeout=2.0)
+            self.assertEqual(res[1], Nack(computation_names[1], NackReason.COMP_QUEUE_FULL,
+                                          interest=Interest(computation_names[1])))
+            self.assertTrue(wait([pool.result_reader], timeout=5.0))
+            self.nfn_layer.handle_computation_results()
+            res = self.nfn_layer.queue_to_lower.get(timeout=2.0)
+            self.assertEqual(Content(computation_names[0], "25"), res[1])
+        finally:
+            pool.stop()
+
+    def test_compute_result_cache(self):
+        """Test answering a repeated computation of a deterministic function from the result cache"""
+        self.nfn_layer.result_cache = NFNResultCache()
+        computation_name = Name("/func/f1")
+        computation_name += "_(/data/a,/data/b)"
+        computation_name += "NFN"
+
+        computation_entry = NFNComputationTableEntry(computation_name)
+        computation_entry.available_data[Name("/data/a")] = "abc"
+        computation_entry.available_data[Name("/data/b")] = "de"
+        computation_entry.available_data[Name("/func/f1")] = "PYTHON\nf\n#nfn: deterministic, commutative\n" \
+                                                             "def f(a,b):\n    return len(a) + len(b)"
+        computation_str, prepended = self.nfn_layer.parser.network_name_to_nfn_str(computation_name)
+        computation_entry.ast = self.nfn_layer.parser.parse(computation_str)
+        self.nfn_layer.computation_table.append_computation(computation_entry)
+        self.nfn_layer.compute(Interest(computation_name))
+        res = self.nfn_layer.queue_to_lower.get(timeout=2.0)
+        self.assertEqual(Content(computation_name, "5"), res[1])
+
+        #parameters in a different order are neither fetched nor computed
+        repeated_name = Name("/func/f1")
+        repeated_name += "_(/data/b,/data/a)"
+        repeated_name += "NFN"
+        self.nfn_layer.handleInterest(3, Interest(repeated_name))
+        res = self.nfn_layer.queue_to_lower.get(timeout=2.0)
+        self.assertEqual([3, Content(repeated_name, "5")], res)
+        self.assertFalse(self.nfn_layer.computation_table.is_comp_running(repeated_name))
+
     def test_compute_single_param_int(self):
         """Test computing with a single function call and a single parameter, int"""
         computation_name = Name("/func/f1")
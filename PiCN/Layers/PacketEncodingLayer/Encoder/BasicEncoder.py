@@ -1,7 +1,7 @@
 """Abstract Encoder for the BasicPacketEncoding Layer"""
 
 import abc
-from PiCN.Packets import Packet
+from PiCN.Packets import Name, Packet
 from PiCN.Logger import Logger
 
 class BasicEncoder(object):
@@ -24,6 +24,11 @@ class BasicEncoder(object):
     def decode(self, wire_data) -> Packet:
         """decode a packet to Packet data structure"""
 
+    def decode_packet_name(self, wire_data) -> Name:
+        """read the name of a packet without decoding the packet, e.g. to dispatch it by name
+        :return: the name, None if the packet is malformed"""
+        return self.decode(wire_data).name
+
     def __getstate__(self):
         d = dict(self.__dict__)
         if 'logger' in d:
@@ -1,7 +1,7 @@
 """NDN TLV Encoder"""
 
 from PiCN.Layers.PacketEncodingLayer.Encoder import BasicEncoder
-from PiCN.Packets import Packet, Content, Interest, Nack, NackReason, Name, UnknownPacket
+from PiCN.Packets import Packet, Content, Interest, LazyContent, Nack, NackReason, Name, UnknownPacket
 
 from PiCNExternal.pyndn.encoding.tlv.tlv.tlv_encoder import TlvEncoder
 from PiCNExternal.pyndn.encoding.tlv.tlv.tlv_decoder import TlvDecoder
@@ -70,7 +70,7 @@ class NdnTlvEncoder(BasicEncoder):
             if isinstance(packet.wire_format, bytes):
                 return packet.wire_format
             else:
-                return self.encode_data(packet.name, packet.get_bytes())
+                return self.encode_data(packet.name, packet.get_view())
         if isinstance(packet, Nack):
             self.logger.info("Encode NACK")
             if isinstance(packet.wire_format, bytes):
@@ -91,8 +91,9 @@ class NdnTlvEncoder(BasicEncoder):
         if(self.is_content(wire_data)):
             self.logger.info("Decode content object")
             try:
-                (name, payload) = self.decode_data(wire_data)
-                return Content(name, payload, wire_data)
+                name = self.decode_data_name(wire_data)
+                NdnTlvEncoder.decode_payload(wire_data) # check the bounds of the Content TLV, the payload is not copied
+                return NdnTlvContent(name, wire_data)
             except:
                 self.logger.info("Decoding failed (malformed packet)")
                 return UnknownPacket(wire_format=wire_data)
@@ -117,6 +118,18 @@ class NdnTlvEncoder(BasicEncoder):
             return UnknownPacket(wire_format=wire_data)
 
 
+    def decode_packet_name(self, wire_data) -> Name:
+        try:
+            if self.is_content(wire_data):
+                return self.decode_data_name(wire_data)
+            if self.is_interest(wire_data):
+                return self.decode_interest(wire_data)
+            if self.is_nack(wire_data):
+                return self.decode_interest(memoryview(wire_data)[13:])
+        except:
+            pass
+        return None
+
     ### Helpers ###
 
     def encode_name(self, name: Name) -> bytearray:
@@ -237,7 +250,7 @@ class NdnTlvEncoder(BasicEncoder):
             else:
                 comps.append(self.decode_name_component(decoder))
         decoder.finishNestedTlvs(endOffset)
-        return Name(suite='ndn2013').__add__(comps).setDigest(dgest)
+        return Name(comps, suite='ndn2013').setDigest(dgest)
 
     def decode_meta_info(self, decoder: TlvDecoder) -> None:
         """
@@ -266,12 +279,39 @@ class NdnTlvEncoder(BasicEncoder):
         :param input: Data packet in NDN-TLV wire format
         :return: Name and payload
         """
+        (name, payload) = self.decode_data_view(input)
+        return (name, payload.tobytes())
+
+    def decode_data_view(self, input: bytearray) -> (Name, memoryview):
+        """
+        Decodes a data packet without copying the payload
+        :param input: Data packet in NDN-TLV wire format
+        :return: Name and payload as memoryview into input
+        """
+        return (self.decode_data_name(input), NdnTlvEncoder.decode_payload(input))
+
+    def decode_data_name(self, input: bytearray) -> Name:
+        """
+        Decodes the name of a data packet
+        :param input: Data packet in NDN-TLV wire format
+        :return: Name
+        """
         decoder = TlvDecoder(input)
         decoder.readNestedTlvsStart(Tlv.Data)
-        name = self.decode_name(decoder)
-        self.decode_meta_info(decoder)
-        payload = decoder.readBlobTlv(Tlv.Content).tobytes()
-        return (name, payload)
+        return self.decode_name(decoder)
+
+    @staticmethod
+    def decode_payload(input: bytearray) -> memoryview:
+        """
+        Decodes the payload of a data packet, skipping name and meta info
+        :param input: Data packet in NDN-TLV wire format
+        :return: payload as memoryview into input
+        """
+        decoder = TlvDecoder(input)
+        decoder.readNestedTlvsStart(Tlv.Data)
+        decoder.seek(decoder.readNestedTlvsStart(Tlv.Name))
+        decoder.seek(decoder.readNestedTlvsStart(Tlv.MetaInfo))
+        return decoder.readBlobTlv(Tlv.Content)
 
     def decode_nack(self, input: bytearray) -> (Name, NackReason):
         """
@@ -280,7 +320,7 @@ class NdnTlvEncoder(BasicEncoder):
         :return: Name
         """
         # decode name
-        name = self.decode_interest(input[13:])
+        name = self.decode_interest(memoryview(input)[13:])
         # decode nack reason
         decoder = TlvDecoder(input)
         decoder.readNestedTlvsStart(Tlv.LpPacket_LpPacket)
@@ -326,3 +366,12 @@ class NdnTlvEncoder(BasicEncoder):
             return input[0] == 0x64 and input[3] == 0x03 and input[4] == 0x20
         except:
             return False
+
+
+class NdnTlvContent(LazyContent):
+    """Content object received in NDN-TLV wire format, the payload is decoded on first access"""
+
+    __slots__ = ()
+
+    def decode_payload(self):
+        return NdnTlvEncoder.decode_payload(self._wire_format)
@@ -0,0 +1,166 @@
+"""NDN TLV Encoder with a fast path for interests and content objects"""
+
+import collections
+import random
+import struct
+
+from PiCN.Layers.PacketEncodingLayer.Encoder.NdnTlvEncoder import NdnTlvEncoder
+from PiCN.Packets import Name
+
+from PiCNExternal.pyndn.encoding.tlv.tlv.tlv import Tlv
+
+
+def var_number_size(value: int) -> int:
+    """
+    Size of a TLV type or length field
+    :param value: type or length
+    :return: number of bytes of the encoded field
+    """
+    if value < 253:
+        return 1
+    if value <= 0xffff:
+        return 3
+    if value <= 0xffffffff:
+        return 5
+    return 9
+
+
+def write_var_number(buffer: bytearray, offset: int, value: int) -> int:
+    """
+    Write a TLV type or length field
+    :param buffer: buffer to write into
+    :param offset: position of the field in the buffer
+    :param value: type or length
+    :return: offset behind the field
+    """
+    if value < 253:
+        buffer[offset] = value
+        return offset + 1
+    if value <= 0xffff:
+        struct.pack_into("!BH", buffer, offset, 253, value)
+        return offset + 3
+    if value <= 0xffffffff:
+        struct.pack_into("!BI", buffer, offset, 254, value)
+        return offset + 5
+    struct.pack_into("!BQ", buffer, offset, 255, value)
+    return offset + 9
+
+
+def encode_tlv(type: int, value: bytes) -> bytes:
+    """
+    Encode a TLV
+    :param type: TLV type
+    :param value: TLV value
+    :return: TLV in wire format
+    """
+    length = len(value)
+    buffer = bytearray(var_number_size(type) + var_number_size(length) + length)
+    offset = write_var_number(buffer, 0, type)
+    offset = write_var_number(buffer, offset, length)
+    buffer[offset:] = value
+    return bytes(buffer)
+
+
+class NdnTlvFastEncoder(NdnTlvEncoder):
+    """
+    Packet Encoder for NDN-TLV with a fast path for interests and content objects. Produces the same wire format as the
+    NdnTlvEncoder, but computes all lengths up front and writes each packet into a single preallocated buffer.
+    The encoded components of name prefixes are cached, so names sharing a prefix (e.g. the chunks of a content object)
+    only encode their last component.
+    Nonces are drawn from a pseudo random generator, since they only serve for loop detection.
+    :param log_level: log level
+    :param name_cache_size: maximum number of name prefixes with cached encoding
+    """
+
+    def __init__(self, log_level=255, name_cache_size: int=1024):
+        NdnTlvEncoder.__init__(self, log_level=log_level)
+        self._name_cache_size = name_cache_size
+        self._prefix_cache: collections.OrderedDict = collections.OrderedDict()
+        self._random = random.Random()
+
+    def encode_name(self, name: Name) -> bytes:
+        """
+        Assembly a name-TLV
+        :param name: Name
+        :return: Name-TLV
+        """
+        value = self.encode_name_value(name)
+        return encode_tlv(Tlv.Name, value)
+
+    def encode_name_value(self, name: Name) -> bytes:
+        """
+        Assembly the value of a name-TLV, i.e. the encoded components
+        :param name: Name
+        :return: encoded components
+        """
+        components = name._components
+        if len(components) == 0:
+            value = b''
+        else:
+            value = self._encode_prefix(tuple(components[:-1])) + self._encode_component(components[-1])
+        if name.digest:
+            value += encode_tlv(Tlv.ImplicitSha256DigestComponent, name.digest)
+        return value
+
+    def encode_interest(self, name: Name) -> bytes:
+        """
+        Assembly an interest packet
+        :param name: Name
+        :return: Interest-TLV
+        """
+        name_value = self.encode_name_value(name)
+        name_size = var_number_size(Tlv.Name) + var_number_size(len(name_value)) + len(name_value)
+        length = name_size + 6
+        buffer = bytearray(var_number_size(Tlv.Interest) + var_number_size(length) + length)
+        offset = write_var_number(buffer, 0, Tlv.Interest)
+        offset = write_var_number(buffer, offset, length)
+        offset = write_var_number(buffer, offset, Tlv.Name)
+        offset = write_var_number(buffer, offset, len(name_value))
+        buffer[offset:offset + len(name_value)] = name_value
+        struct.pack_into("!BBI", buffer, offset + len(name_value), Tlv.Nonce, 4, self._random.getrandbits(32))
+        return bytes(buffer)
+
+    def encode_data(self, name: Name, payload: bytearray) -> bytes:
+        """
+        Assembly a data packet
+        :param name: Name
+        :param payload: Payload
+        :return: Data-TLV
+        """
+        if payload is None:
+            payload = b''
+        name_value = self.encode_name_value(name)
+        payload_size = len(payload)
+        name_size = var_number_size(Tlv.Name) + var_number_size(len(name_value)) + len(name_value)
+        length = name_size + 2 + var_number_size(Tlv.Content) + var_number_size(payload_size) + payload_size
+        buffer = bytearray(var_number_size(Tlv.Data) + var_number_size(length) + length)
+        offset = write_var_number(buffer, 0, Tlv.Data)
+        offset = write_var_number(buffer, offset, length)
+        offset = write_var_number(buffer, offset, Tlv.Name)
+        offset = write_var_number(buffer, offset, len(name_value))
+        buffer[offset:offset + len(name_value)] = name_value
+        offset += len(name_value)
+        offset = write_var_number(buffer, offset, Tlv.MetaInfo)
+        offset = write_var_number(buffer, offset, 0)
+        offset = write_var_number(buffer, offset, Tlv.Content)
+        offset = write_var_number(buffer, offset, payload_size)
+        buffer[offset:] = payload
+        return bytes(buffer)
+
+    def _encode_component(self, component) -> bytes:
+        if type(component) is str:
+            component = component.encode()
+        return encode_tlv(Tlv.NameComponent, component)
+
+    def _encode_prefix(self, prefix: tuple) -> bytes:
+        """encoded components of a name prefix, from the cache if possible"""
+        cache = self._prefix_cache
+        value = cache.get(prefix)
+        if value is not None:
+            cache.move_to_end(prefix)
+            return value
+        value = b''.join([self._encode_component(c) for c in prefix])
+        cache[prefix] = value
+        if len(cache) > self._name_cache_size:
+            cache.popitem(last=False)
+        return value
@@ -1,7 +1,7 @@
 """A extrem simple Packet Encoder for the BasicPacketEncodingLayer"""
 
 from PiCN.Layers.PacketEncodingLayer.Encoder import BasicEncoder
-from PiCN.Packets import Packet, Content, Interest, Name, Nack, NackReason, UnknownPacket
+from PiCN.Packets import Packet, Content, Interest, LazyContent, Name, Nack, NackReason, UnknownPacket
 
 class SimpleStringEncoder(BasicEncoder):
     """An extreme simple Packet Encoder for the BasicPacketEncodingLayer"""
@@ -29,26 +29,52 @@ class SimpleStringEncoder(BasicEncoder):
         return None
 
     def decode(self, wire_data) -> Packet:
-        data: str = wire_data.decode()
-        if data[0] == "I":
-            self.logger.info("Decode interest")
-            name = data.split(":")[1]
-            return Interest(self.unescape_name(Name(name)))
-        elif data[0] == "C":
+        if wire_data[0:1] == b"C":
             self.logger.info("Decode content object")
-            name = data.split(":")[1]
-            content = data.split(":")[3].replace("%58", ":")
-            return Content(self.unescape_name(Name(name)), content)
-        elif data[0] == "N":
-            self.logger.info("Decode NACK")
-            name = data.split(":")[1]
-            reason = NackReason(data.split(":")[3])
-            return Nack(self.unescape_name(Name(name)), reason, None)
-        else:
-            self.logger.info("Decode failed (unknown packet type)")
+            name_end = wire_data.find(b":", 2)
+            # C:<name>::<payload>, colons in the payload are escaped, the payload is not copied
+            if wire_data[1:2] != b":" or name_end < 0 or wire_data[name_end + 1:name_end + 2] != b":" \
+                    or wire_data.find(b":", name_end + 2) >= 0:
+                self.logger.info("Decode failed (malformed content object)")
+                return UnknownPacket(wire_format=wire_data)
+            try:
+                name = wire_data[2:name_end].decode()
+            except UnicodeDecodeError:
+                self.logger.info("Decode failed (malformed content object)")
+                return UnknownPacket(wire_format=wire_data)
+            return SimpleStringContent(self.unescape_name(Name(name)), wire_data)
+        try:
+            data: str = wire_data.decode()
+            if data[0] == "I":
+                self.logger.info("Decode interest")
+                name = data.split(":")[1]
+                return Interest(self.unescape_name(Name(name)))
+            elif data[0] == "N":
+                self.logger.info("Decode NACK")
+                name = data.split(":")[1]
+                reason = NackReason(data.split(":")[3])
+                return Nack(self.unescape_name(Name(name)), reason, None)
+        except (IndexError, ValueError):
+            self.logger.info("Decode failed (malformed packet)")
             return UnknownPacket(wire_format=wire_data)
+        self.logger.info("Decode failed (unknown packet type)")
+        return UnknownPacket(wire_format=wire_data)
 
 
+    def decode_packet_name(self, wire_data) -> Name:
+        name_end = wire_data.find(b":", 2)
+        if wire_data[0:1] not in (b"C", b"I", b"N") or wire_data[1:2] != b":" or name_end < 0:
+            return None
+        try:
+            return self.unescape_name(Name(wire_data[2:name_end].decode()))
+        except UnicodeDecodeError:
+            return None
+
+    @staticmethod
+    def decode_payload(wire_data) -> bytes:
+        """decode the payload of a content object"""
+        return wire_data.decode().split(":")[3].replace("%58", ":").encode()
+
     def escape_name(self, name: Name):
         """escape a name"""
         n2 = Name()
@@ -62,3 +88,12 @@ class SimpleStringEncoder(BasicEncoder):
         for c in name.string_components:
             n2 += c.replace("%2F", "/")
         return n2
+
+
+class SimpleStringContent(LazyContent):
+    """Content object received in simple string wire format, the payload is decoded on first access"""
+
+    __slots__ = ()
+
+    def decode_payload(self):
+        return SimpleStringEncoder.decode_payload(self._wire_format)
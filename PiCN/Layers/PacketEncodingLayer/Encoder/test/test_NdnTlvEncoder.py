@@ -1,9 +1,10 @@
 """Test the NdnTlvEncoder"""
 
+import pickle
 import unittest
 
 from PiCN.Layers.PacketEncodingLayer.Encoder import NdnTlvEncoder
-from PiCN.Packets import Content, Interest, Nack, NackReason, Name
+from PiCN.Packets import Content, Interest, Nack, NackReason, Name, UnknownPacket
 
 class test_NdnTlvEncoder(unittest.TestCase):
     """Test the NdnTlvEncoder"""
@@ -51,4 +52,61 @@ class test_NdnTlvEncoder(unittest.TestCase):
         self.assertFalse(self.encoder.is_content(enc_n1))
         self.assertTrue(self.encoder.is_nack(enc_n1))
         dec_n1 = self.encoder.decode(enc_n1)
-        self.assertEqual(dec_n1, n1)
\ No newline at end of file
+        self.assertEqual(dec_n1, n1)
+
+    def test_Content_Decode_zero_copy(self):
+        """Test that the payload of a decoded content object refers to the wire format until it is requested as bytes"""
+        c1: Content = Content(Name("/test/data"), b"HelloWorld" * 1000)
+        enc_c1 = self.encoder.encode(c1)
+        dec_c1 = self.encoder.decode(enc_c1)
+        self.assertIsInstance(dec_c1.get_view(), memoryview)
+        self.assertIs(dec_c1.get_view().obj, enc_c1)
+        self.assertEqual(self.encoder.encode(Content(dec_c1.name, dec_c1.get_view())), enc_c1)
+        self.assertEqual(dec_c1.get_bytes(), b"HelloWorld" * 1000)
+        self.assertIsInstance(dec_c1.get_bytes(), bytes)
+
+    def test_Decode_data(self):
+        """Test that decode_data returns the payload as bytes and decode_data_view as memoryview"""
+        enc_c1 = self.encoder.encode(Content(Name("/test/data"), "HelloWorld"))
+        (name, payload) = self.encoder.decode_data(enc_c1)
+        self.assertEqual(name, Name("/test/data"))
+        self.assertEqual(payload, b"HelloWorld")
+        self.assertIsInstance(payload, bytes)
+        (name, payload) = self.encoder.decode_data_view(enc_c1)
+        self.assertEqual(name, Name("/test/data"))
+        self.assertIsInstance(payload, memoryview)
+        self.assertEqual(payload, b"HelloWorld")
+
+    def test_Content_Decode_passthrough(self):
+        """Test that a decoded content object carries its payload only in the wire format"""
+        c1: Content = Content(Name("/test/data"), b"x" * 4000)
+        enc_c1 = self.encoder.encode(c1)
+        dec_c1 = pickle.loads(pickle.dumps(self.encoder.decode(enc_c1)))
+        self.assertLess(len(pickle.dumps(dec_c1)), len(enc_c1) + 200)
+        self.assertIs(self.encoder.encode(dec_c1), dec_c1.wire_format)
+        self.assertEqual(dec_c1, c1)
+
+    def test_Content_Decode_lazy(self):
+        """Test that the payload of a decoded content object is decoded on access"""
+        c1: Content = Content(Name("/test/data"), b"HelloWorld")
+        dec_c1 = self.encoder.decode(self.encoder.encode(c1))
+        self.assertIsNone(dec_c1._content)
+        self.assertEqual(dec_c1.name, c1.name)
+        self.assertIsInstance(dec_c1.get_view(), memoryview)
+        self.assertEqual(dec_c1.get_bytes(), b"HelloWorld")
+
+    def test_Content_Decode_malformed_payload(self):
+        """Test that a content object whose Content TLV exceeds the packet is decoded as UnknownPacket"""
+        enc_c1 = bytearray(self.encoder.encode(Content(Name("/test/data"), b"HelloWorld")))
+        enc_c1[enc_c1.index(b"\x15\x0aHelloWorld") + 1] = 0x7f
+        dec_c1 = self.encoder.decode(enc_c1)
+        self.assertIsInstance(dec_c1, UnknownPacket)
+        self.assertEqual(dec_c1.wire_format, enc_c1)
+
+    def test_decode_packet_name(self):
+        """Test reading the name of packets without decoding them"""
+        name = Name("/test/data")
+        for packet in [Interest(name), Content(name, "HelloWorld"), Nack(name, NackReason.NO_ROUTE, Interest(name))]:
+            self.assertEqual(self.encoder.decode_packet_name(self.encoder.encode(packet)), name)
+        self.assertIsNone(self.encoder.decode_packet_name(b"\x06\x7f"))
+        self.assertIsNone(self.encoder.decode_packet_name(b"data"))
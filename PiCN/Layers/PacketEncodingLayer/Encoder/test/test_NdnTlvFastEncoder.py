@@ -0,0 +1,56 @@
+"""Test the NdnTlvFastEncoder"""
+
+import unittest
+
+from PiCN.Layers.PacketEncodingLayer.Encoder import NdnTlvEncoder, NdnTlvFastEncoder
+from PiCN.Packets import Content, Interest, Nack, NackReason, Name
+
+
+class test_NdnTlvFastEncoder(unittest.TestCase):
+    """Test the NdnTlvFastEncoder"""
+
+    def setUp(self):
+        self.encoder = NdnTlvFastEncoder(name_cache_size=2)
+        self.reference_encoder = NdnTlvEncoder()
+
+    def test_Interest_Creation(self):
+        """Test that interests are encoded as by the NdnTlvEncoder, except for the nonce"""
+        for name in [Name("/test/data"), Name("/test/" + "x" * 300), Name("/a/b").setDigest(b"1" * 32)]:
+            enc_i1 = self.encoder.encode(Interest(name))
+            enc_i2 = self.reference_encoder.encode(Interest(name))
+            self.assertTrue(self.encoder.is_interest(enc_i1))
+            self.assertEqual(len(enc_i1), len(enc_i2))
+            self.assertEqual(enc_i1[:-4], enc_i2[:-4])
+            self.assertEqual(self.reference_encoder.decode(enc_i1), Interest(name))
+
+    def test_Interest_Nonce(self):
+        """Test that two interests for the same name differ in their nonce"""
+        enc_i1 = self.encoder.encode(Interest("/test/data"))
+        enc_i2 = self.encoder.encode(Interest("/test/data"))
+        self.assertNotEqual(enc_i1[-4:], enc_i2[-4:])
+
+    def test_Content_Creation(self):
+        """Test that content objects are encoded as by the NdnTlvEncoder"""
+        for payload in [b"", b"HelloWorld", b"x" * 300, b"x" * 70000]:
+            c1 = Content("/test/data", payload)
+            enc_c1 = self.encoder.encode(c1)
+            self.assertEqual(enc_c1, self.reference_encoder.encode(c1))
+            self.assertEqual(self.encoder.decode(enc_c1), c1)
+
+    def test_Nack_Creation(self):
+        """Test that nacks contain an interest encoded by the fast path"""
+        n1 = Nack(Name("/test/data"), NackReason.NO_ROUTE, interest=Interest("/test/data"))
+        enc_n1 = self.encoder.encode(n1)
+        self.assertTrue(self.encoder.is_nack(enc_n1))
+        self.assertEqual(self.reference_encoder.decode(enc_n1), n1)
+
+    def test_name_prefix_cache(self):
+        """Test that encoded prefixes are cached up to the cache size"""
+        for i in range(3):
+            self.encoder.encode(Content("/test/data/c" + str(i), "data"))
+        self.assertEqual(list(self.encoder._prefix_cache.keys()), [(b"test", b"data")])
+        self.encoder.encode(Content("/test/other/c0", "data"))
+        self.encoder.encode(Content("/c0", "data"))
+        self.assertEqual(list(self.encoder._prefix_cache.keys()), [(b"test", b"other"), ()])
+        self.assertEqual(self.encoder.encode(Content("/test/data/c0", "data")),
+                         self.reference_encoder.encode(Content("/test/data/c0", "data")))
@@ -3,7 +3,7 @@
 import unittest
 
 from PiCN.Layers.PacketEncodingLayer.Encoder import SimpleStringEncoder
-from PiCN.Packets import Content, Interest, Nack, NackReason
+from PiCN.Packets import Content, Interest, Nack, NackReason, Name, UnknownPacket
 
 class test_SimpleStringEncoder(unittest.TestCase):
     """Test the SimpleStringEncoder"""
@@ -74,4 +74,26 @@ class test_SimpleStringEncoder(unittest.TestCase):
         n = Nack("/data/test", NackReason.NO_CONTENT, interest=interest)
         en = self.encoder1.encode(n)
         dn = self.encoder1.decode(en)
-        self.assertTrue(n == dn)
\ No newline at end of file
+        self.assertTrue(n == dn)
+
+    def test_Encoder_decode_content_lazy(self):
+        """Test that the payload of a decoded content object is decoded on access"""
+        c = Content("/data/test", "Hello:World")
+        dc = self.encoder1.decode(self.encoder1.encode(c))
+        self.assertIsNone(dc._content)
+        self.assertEqual(dc.name, c.name)
+        self.assertEqual(dc.content, "Hello:World")
+        self.assertEqual(dc, c)
+
+    def test_Encoder_decode_malformed(self):
+        """Test that malformed packets are decoded as UnknownPacket"""
+        for data in [b"C:/a", b"C:/a:x", b"C/a::x", b"C:/a::x:y", b"C:\xff::x", b"I", b"N:/a:", b"N:/a::nonsense"]:
+            self.assertIsInstance(self.encoder1.decode(data), UnknownPacket)
+
+    def test_decode_packet_name(self):
+        """Test reading the name of packets without decoding them"""
+        name = Name("/test/data")
+        for packet in [Interest(name), Content(name, "HelloWorld"), Nack(name, NackReason.NO_ROUTE, Interest(name))]:
+            self.assertEqual(self.encoder1.decode_packet_name(self.encoder1.encode(packet)), name)
+        for data in [b"C:/a", b"X:/a::b", b"I/a:", b"C:\xff::x"]:
+            self.assertIsNone(self.encoder1.decode_packet_name(data))
@@ -0,0 +1,138 @@
+"""A File System Repository serving chunks from memory mapped files"""
+
+import mmap
+import os.path
+from collections import OrderedDict
+from multiprocessing import Manager
+
+from PiCN.Layers.ChunkLayer.Chunkifyer import SimpleContentChunkifyer
+from PiCN.Layers.RepositoryLayer.Repository import BaseRepository
+from PiCN.Packets import Content, Name
+from PiCN.Logger import Logger
+
+
+class MmapFileSystemRepository(BaseRepository):
+    """A File System Repository, which serves the chunks and metadata objects of files itself, as the chunk layer would
+    generate them (see SimpleContentChunkifyer). Files are memory mapped on first access, chunks are served as
+    memoryviews into the mapping, so a file is never read as a whole. Metadata objects are generated from the file size.
+    Names served for a file /prefix/file:
+      * /prefix/file: the file if it is smaller than the chunk size, the first metadata object otherwise
+      * /prefix/file/m<N>: the N-th metadata object
+      * /prefix/file/c<N>: the N-th chunk
+    Mappings are kept in an LRU cache. A cached mapping is only reused while the modification time, size and inode of
+    the file are unchanged, otherwise the file is mapped again.
+    This repository is used without a chunk layer.
+    :param chunk_size: size of the chunks
+    :param max_open_files: maximum number of files mapped at the same time
+    """
+
+    def __init__(self, foldername: str, prefix: Name, manager: Manager, logger: Logger=None, chunk_size: int=4096,
+                 max_open_files: int=64):
+        super().__init__()
+        self._foldername: str = foldername
+        self._safepath = os.path.abspath(self._foldername)
+        self._manager = manager
+        self._prefix = manager.Value(Name, prefix)
+        self.logger = logger
+        self.chunk_size = chunk_size
+        self.chunkifyer = SimpleContentChunkifyer(chunk_size)
+        self._max_open_files = max_open_files
+        self._mappings: OrderedDict = OrderedDict()
+
+    def is_content_available(self, icnname: Name) -> bool:
+        return self.get_content(icnname) is not None
+
+    def get_content(self, icnname: Name) -> Content:
+        request = self._parse_name(icnname)
+        if request is None:
+            return None
+        filename, part, number = request
+        mapping = self._get_mapping(filename)
+        if mapping is None:
+            return None
+        size = len(mapping) if type(mapping) is mmap.mmap else 0
+        num_of_chunks = self.chunkifyer.num_of_chunks(size)
+        if part is None and size < self.chunk_size:
+            return Content(icnname, mapping[:size])
+        if part is None:
+            return self.chunkifyer.generate_meta_data_object(icnname, num_of_chunks, 0)
+        if part == 'm' and 0 < number < self.chunkifyer.num_of_meta_data_objects(num_of_chunks):
+            return self.chunkifyer.generate_meta_data_object(Name(icnname._components[:-1]), num_of_chunks, number)
+        if part == 'c' and number < num_of_chunks:
+            start = number * self.chunk_size
+            return Content(icnname, memoryview(mapping)[start:min(start + self.chunk_size, size)])
+        return None
+
+    def set_prefix(self, prefix: Name):
+        self._prefix.value = prefix
+
+    def close(self):
+        """unmap all files"""
+        for filename in list(self._mappings.keys()):
+            self._unmap(filename)
+
+    def _parse_name(self, icnname: Name):
+        """
+        Find the file, and the chunk or metadata object of it, a name refers to
+        :param icnname: name of an interest
+        :return: tuple of file name, 'c', 'm' or None, and the number of the chunk or metadata object, None if the name
+                 does not refer to a file of this repository
+        """
+        if icnname is None:
+            return None
+        prefix: Name = self._prefix.value
+        if not prefix.is_prefix_of(icnname):
+            return None
+        components = icnname.string_components[len(prefix._components):]
+        part, number = None, None
+        if len(components) == 2 and components[1][:1] in ('c', 'm') and components[1][1:].isdigit():
+            part, number = components[1][0], int(components[1][1:])
+        elif len(components) != 1:
+            return None
+        filename = os.path.abspath(os.path.join(self._foldername, components[0]))
+        if os.path.commonprefix([filename, self._safepath]) != self._safepath: # prevent directory traversal
+            return None
+        return filename, part, number
+
+    def _get_mapping(self, filename: str):
+        """memory map a file, or get the cached mapping of it
+        :return: mmap of the file, b'' for empty files, None if the file does not exist
+        """
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            stat = None
+        cached = self._mappings.get(filename)
+        if cached is not None:
+            if stat is not None and cached[1] == self._file_version(stat):
+                self._mappings.move_to_end(filename)
+                return cached[0]
+            self._unmap(filename) # the file was replaced, changed or removed
+        if not os.path.isfile(filename):
+            return None
+        try:
+            with open(filename, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                if stat.st_size == 0:
+                    mapping = b''
+                else:
+                    mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        self._mappings[filename] = (mapping, self._file_version(stat))
+        if len(self._mappings) > self._max_open_files:
+            self._unmap(next(iter(self._mappings)))
+        return mapping
+
+    @staticmethod
+    def _file_version(stat: os.stat_result):
+        """identifies the content of a file a mapping was created from"""
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _unmap(self, filename: str):
+        mapping, _ = self._mappings.pop(filename)
+        if type(mapping) is mmap.mmap:
+            try:
+                mapping.close()
+            except BufferError:
+                pass # chunks of the file are still in use, the mapping is closed when they are released
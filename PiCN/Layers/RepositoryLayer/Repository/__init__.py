@@ -3,3 +3,4 @@
 from .BaseRepository import BaseRepository
 from .SimpleFileSystemRepository import SimpleFileSystemRepository
 from .SimpleMemoryRepository import SimpleMemoryRepository
+from .MmapFileSystemRepository import MmapFileSystemRepository
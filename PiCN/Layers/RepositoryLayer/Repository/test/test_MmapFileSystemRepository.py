@@ -0,0 +1,119 @@
+"""Test the Memory Mapped File System Repository"""
+
+import os
+import shutil
+import unittest
+import multiprocessing
+
+from unittest import mock
+
+from PiCN.Layers.ChunkLayer.Chunkifyer import SimpleContentChunkifyer
+from PiCN.Layers.RepositoryLayer.Repository import MmapFileSystemRepository
+from PiCN.Packets import Content, Name
+
+
+class test_MmapFileSystemRepository(unittest.TestCase):
+    """Test the Memory Mapped File System Repository"""
+
+    def setUp(self):
+        self.path = "/tmp/repo_unit_test_mmap"
+        try:
+            os.stat(self.path)
+        except:
+            os.mkdir(self.path)
+        self.data2 = bytes(range(32, 128)) * 256
+        with open(self.path + "/f1", 'wb+') as content_file:
+            content_file.write(b"data1")
+        with open(self.path + "/f2", 'wb+') as content_file:
+            content_file.write(self.data2)
+        with open(self.path + "/f3", 'wb+') as content_file:
+            pass
+        with open("/tmp/f4", 'w+') as content_file:
+            content_file.write("data4")
+        manager = multiprocessing.Manager()
+        self.repository = MmapFileSystemRepository(self.path, Name("/test/data"), manager=manager, chunk_size=1024,
+                                                   max_open_files=2)
+        self.chunkifyer = SimpleContentChunkifyer(1024)
+
+    def tearDown(self):
+        self.repository.close()
+        try:
+            shutil.rmtree(self.path)
+            os.remove("/tmp/f4")
+        except:
+            pass
+
+    def test_content_available(self):
+        """Test if the function is_content_available works correct"""
+        self.assertTrue(self.repository.is_content_available(Name("/test/data/f1")))
+        self.assertTrue(self.repository.is_content_available(Name("/test/data/f2/c23")))
+        self.assertFalse(self.repository.is_content_available(Name("/test/data/f2/c24")))
+        self.assertFalse(self.repository.is_content_available(Name("/test/data/f4")))
+        self.assertFalse(self.repository.is_content_available(Name("/other/data/f1")))
+
+    def test_get_small_content(self):
+        """Test that files smaller than a chunk are served as a whole"""
+        self.assertEqual(self.repository.get_content(Name("/test/data/f1")), Content("/test/data/f1", b"data1"))
+        self.assertEqual(self.repository.get_content(Name("/test/data/f3")), Content("/test/data/f3", b""))
+        self.assertIsNone(self.repository.get_content(Name("/test/data/f3/c0")))
+
+    def test_get_chunks_and_metadata(self):
+        """Test that chunks and metadata objects are served as the chunkifyer generates them"""
+        name = Name("/test/data/f2")
+        metadata, chunks = self.chunkifyer.chunk_data(Content(name, self.data2))
+        self.assertEqual(self.repository.get_content(name), metadata[0])
+        for i, md in enumerate(metadata[1:], 1):
+            self.assertEqual(self.repository.get_content(Name("/test/data/f2/m" + str(i))), md)
+        for chunk in chunks:
+            self.assertEqual(self.repository.get_content(chunk.name), chunk)
+        self.assertIsNone(self.repository.get_content(Name("/test/data/f2/m" + str(len(metadata)))))
+        self.assertIsNone(self.repository.get_content(Name("/test/data/f2/x1")))
+
+    def test_chunks_are_views(self):
+        """Test that chunks are views of the mapped file"""
+        chunk = self.repository.get_content(Name("/test/data/f2/c3"))
+        self.assertIs(type(chunk.get_view()), memoryview)
+        self.assertEqual(chunk.get_bytes(), self.data2[3072:4096])
+
+    def test_mapping_lru(self):
+        """Test that the least recently used mappings are closed"""
+        chunk = self.repository.get_content(Name("/test/data/f2/c1"))
+        self.repository.get_content(Name("/test/data/f1"))
+        self.repository.get_content(Name("/test/data/f2/c2"))
+        self.repository.get_content(Name("/test/data/f3"))
+        self.assertEqual(list(self.repository._mappings.keys()),
+                         [os.path.abspath(self.path + "/f2"), os.path.abspath(self.path + "/f3")])
+        self.repository.get_content(Name("/test/data/f1"))
+        self.assertEqual(len(self.repository._mappings), 2)
+        self.assertEqual(chunk.get_bytes(), self.data2[1024:2048])
+
+    def test_changed_file_mapped_again(self):
+        """Test that a file replaced or changed after being mapped is not served from the old mapping"""
+        self.assertEqual(self.repository.get_content(Name("/test/data/f1")).get_bytes(), b"data1")
+        with open(self.path + "/f1.new", 'wb+') as content_file:
+            content_file.write(b"new data1")
+        os.replace(self.path + "/f1.new", self.path + "/f1")
+        self.assertEqual(self.repository.get_content(Name("/test/data/f1")).get_bytes(), b"new data1")
+        with open(self.path + "/f1", 'wb') as content_file:
+            content_file.write(b"data")
+        self.assertEqual(self.repository.get_content(Name("/test/data/f1")).get_bytes(), b"data")
+        os.remove(self.path + "/f1")
+        self.assertIsNone(self.repository.get_content(Name("/test/data/f1")))
+        self.assertEqual(len(self.repository._mappings), 0)
+
+    def test_file_not_readable(self):
+        """Test that files which cannot be opened are not available"""
+        with mock.patch("builtins.open", side_effect=PermissionError):
+            self.assertIsNone(self.repository.get_content(Name("/test/data/f1")))
+        self.assertEqual(self.repository.get_content(Name("/test/data/f1")).get_bytes(), b"data1")
+
+    def test_get_content_directory_traversal(self):
+        """test if the function get content do not allow directory traversal"""
+        self.assertIsNone(self.repository.get_content(Name("/test/data/../f4")))
+        n1 = Name("/test/data")
+        n1 += "../f4"
+        self.assertIsNone(self.repository.get_content(n1))
+        n2 = Name("/test/data")
+        n2 += "../f4"
+        n2 += "c0"
+        self.assertIsNone(self.repository.get_content(n2))
@@ -2,7 +2,6 @@
 from typing import List, Tuple
 
 import multiprocessing
-import threading
 from datetime import datetime, timedelta
 
 from PiCN.Layers.LinkLayer.Interfaces import AddressInfo
@@ -24,18 +23,22 @@ class BasicRoutingLayer(LayerProcess):
         self.fib: BaseForwardingInformationBase = None
         self._rib_maxage: timedelta = timedelta(seconds=3600)
         self._peers: List[Tuple[str, int]] = peers if peers is not None else []
-        self._ageing_interval: float = 5.0
-        self._ageing_timer: threading.Timer = None
+        self.timer_interval = 5.0
 
-    def start_process(self):
-        super().start_process()
-        self._ageing()
+    @property
+    def _ageing_interval(self) -> float:
+        """seconds between ageing the RIB and soliciting routes from the peers"""
+        return self.timer_interval
+
+    @_ageing_interval.setter
+    def _ageing_interval(self, interval: float):
+        self.timer_interval = interval
 
-    def stop_process(self):
-        super().stop_process()
-        if self._ageing_timer is not None:
-            self._ageing_timer.cancel()
-            self._ageing_timer = None
+    def on_start(self):
+        self._send_routing_interest()
+
+    def on_timer(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue):
+        self._ageing()
 
     def data_from_lower(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue, data):
         self.logger.info(f'Received data from lower: {data}')
@@ -75,12 +78,8 @@ class BasicRoutingLayer(LayerProcess):
     def _ageing(self):
         if self.rib is not None:
             self.rib.ageing()
-            self.fib.clear()
-            for entry in self.rib.build_fib():
-                self.fib.add_fib_entry(entry.name, entry.faceid, static=entry.static)
+            self.fib.rebuild(self.rib.build_fib())
         self._send_routing_interest()
-        self._ageing_timer = threading.Timer(self._ageing_interval, self._ageing)
-        self._ageing_timer.start()
 
     def _send_routing_interest(self):
         solicitation: Interest = Interest(self._prefix)
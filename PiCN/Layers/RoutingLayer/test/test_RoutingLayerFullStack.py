@@ -16,28 +16,48 @@ from PiCN.ProgramLibs.ICNDataRepository import ICNDataRepository
 from PiCN.ProgramLibs.ICNForwarder import ICNForwarder
 
 
-class test_RoutingLayerFullStack(unittest.TestCase):
+class cases_RoutingLayerFullStack(object):
+
+    def get_single_process(self):
+        """returns if all layers of the forwarders should run in a single process"""
+        return False
+
+    def get_in_process_data_structs(self):
+        """returns if the data structs of the forwarders should live in the layer processes"""
+        return False
+
+    def get_port_offset(self):
+        """returns the offset added to all ports, sockets of earlier test cases are kept open by their managers"""
+        return 0
 
     def setUp(self):
-        self.f9000 = ICNForwarder(9000, encoder=NdnTlvEncoder(), routing=True,
-                                  peers=[('127.0.0.1', 9001), ('127.0.0.1', 9002), ('127.0.0.1', 9090)])
-        self.f9001 = ICNForwarder(9001, encoder=NdnTlvEncoder(), routing=True,
-                                  peers=[('127.0.0.1', 9000), ('127.0.0.1', 9002), ('127.0.0.1', 9003),
-                                         ('127.0.0.1', 9004)])
-        self.f9002 = ICNForwarder(9002, encoder=NdnTlvEncoder(), routing=True,
-                                  peers=[('127.0.0.1', 9000), ('127.0.0.1', 9001), ('127.0.0.1', 9004)])
-        self.f9003 = ICNForwarder(9003, encoder=NdnTlvEncoder(), routing=True,
-                                  peers=[('127.0.0.1', 9001), ('127.0.0.1', 9004)])
-        self.f9004 = ICNForwarder(9004, encoder=NdnTlvEncoder(), routing=True,
-                                  peers=[('127.0.0.1', 9001), ('127.0.0.1', 9002), ('127.0.0.1', 9003)])
+        o: int = self.get_port_offset()
+        sp: bool = self.get_single_process()
+        ip: bool = self.get_in_process_data_structs()
+        self.f9000 = ICNForwarder(9000 + o, encoder=NdnTlvEncoder(), routing=True,
+                                  single_process=sp, in_process_data_structs=ip,
+                                  peers=[('127.0.0.1', 9001 + o), ('127.0.0.1', 9002 + o), ('127.0.0.1', 9090 + o)])
+        self.f9001 = ICNForwarder(9001 + o, encoder=NdnTlvEncoder(), routing=True,
+                                  single_process=sp, in_process_data_structs=ip,
+                                  peers=[('127.0.0.1', 9000 + o), ('127.0.0.1', 9002 + o), ('127.0.0.1', 9003 + o),
+                                         ('127.0.0.1', 9004 + o)])
+        self.f9002 = ICNForwarder(9002 + o, encoder=NdnTlvEncoder(), routing=True,
+                                  single_process=sp, in_process_data_structs=ip,
+                                  peers=[('127.0.0.1', 9000 + o), ('127.0.0.1', 9001 + o), ('127.0.0.1', 9004 + o)])
+        self.f9003 = ICNForwarder(9003 + o, encoder=NdnTlvEncoder(), routing=True,
+                                  single_process=sp, in_process_data_structs=ip,
+                                  peers=[('127.0.0.1', 9001 + o), ('127.0.0.1', 9004 + o)])
+        self.f9004 = ICNForwarder(9004 + o, encoder=NdnTlvEncoder(), routing=True,
+                                  single_process=sp, in_process_data_structs=ip,
+                                  peers=[('127.0.0.1', 9001 + o), ('127.0.0.1', 9002 + o), ('127.0.0.1', 9003 + o)])
         os.makedirs('/tmp/test_repo', exist_ok=True)
         f = open('/tmp/test_repo/helloworld', 'w')
         f.write('Hello, World!\n')
         f.close()
-        self.repo = ICNDataRepository('/tmp/test_repo', Name('/testrepo'), port=9090, encoder=NdnTlvEncoder())
-        self.fetch = Fetch('127.0.0.1', 9004, encoder=NdnTlvEncoder())
+        self.repo = ICNDataRepository('/tmp/test_repo', Name('/testrepo'), port=9090 + o, encoder=NdnTlvEncoder())
+        self.fetch = Fetch('127.0.0.1', 9004 + o, encoder=NdnTlvEncoder())
         # Create RIB entry for the repository (with Python weirdness)
-        repo_fid: int = self.f9000.linklayer.faceidtable.get_or_create_faceid(AddressInfo(('127.0.0.1', 9090), 0))
+        repo_fid: int = self.f9000.linklayer.faceidtable.get_or_create_faceid(AddressInfo(('127.0.0.1', 9090 + o), 0))
         rib: BaseRoutingInformationBase = self.f9000.routinglayer.rib
         rib.insert(Name('/testrepo'), repo_fid, distance=1, timeout=None)
 
@@ -95,3 +115,25 @@ class test_RoutingLayerFullStack(unittest.TestCase):
                 pass
         self.assertEqual('Hello, World!\n', hw)
         self.assertLess(end-start, timedelta(seconds=4))
+
+
+class test_RoutingLayerFullStack(cases_RoutingLayerFullStack, unittest.TestCase):
+    pass
+
+
+class test_RoutingLayerFullStack_SingleProcess(cases_RoutingLayerFullStack, unittest.TestCase):
+
+    def get_single_process(self):
+        return True
+
+    def get_port_offset(self):
+        return 100
+
+
+class test_RoutingLayerFullStack_InProcessDataStructs(cases_RoutingLayerFullStack, unittest.TestCase):
+
+    def get_in_process_data_structs(self):
+        return True
+
+    def get_port_offset(self):
+        return 200
@@ -0,0 +1,55 @@
+"""Sharding Layer, distributing packets to parallel stacks by name"""
+
+import multiprocessing
+import zlib
+
+from typing import List
+
+from PiCN.Layers.PacketEncodingLayer.Encoder import BasicEncoder
+from PiCN.Packets import Name
+from PiCN.Processes import LayerProcess
+
+
+class BasicShardingLayer(LayerProcess):
+    """Sharding Layer, placed on top of the link layer. Distributes received packets to several stacks (shards) above
+    it by a hash of the packet name, so an interest and the content object or nack answering it are handled by the same
+    shard. Packets from the shards are passed to the link layer. All shards share a single queue to this layer.
+    :param encoder: encoder used to read the names of received packets
+    :param shards: number of shards
+    :param prefix_length: number of name components hashed, the full name if None. Must not exceed the length of the
+                          shortest name a shard can answer an interest with.
+    :param log_level: log level
+    """
+
+    def __init__(self, encoder: BasicEncoder, shards: int, prefix_length: int=None, log_level=255):
+        super().__init__(logger_name="ShardingLayer", log_level=log_level)
+        self._encoder = encoder
+        self.shards = shards
+        self.prefix_length = prefix_length
+        self.queues_to_shards: List[multiprocessing.Queue] = []
+
+    def shard_of(self, name: Name) -> int:
+        """
+        Shard handling the packets of a name, stable across processes
+        :param name: name of a packet, None for undecodable packets
+        :return: index of the shard
+        """
+        if name is None:
+            return 0
+        if self.prefix_length is None:
+            components = name.key[1]
+        else:
+            components = b'/'.join([c.encode() if type(c) is str else c for c in name._components[:self.prefix_length]])
+        return zlib.crc32(components) % self.shards
+
+    def data_from_lower(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue, data):
+        if len(data) != 2:
+            self.logger.warning("Sharding Layer expects queue elements to have size 2")
+            return
+        name = self._encoder.decode_packet_name(data[1]) # the packet is decoded by the encoding layer of the shard
+        shard = self.shard_of(name)
+        self.logger.info("Packet from lower, Name: %s, Shard: %s", name, shard)
+        self.queues_to_shards[shard].put(data)
+
+    def data_from_higher(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue, data):
+        to_lower.put(data)
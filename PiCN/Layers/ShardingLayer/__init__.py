@@ -0,0 +1,3 @@
+"""Sharding Layer, distributing packets to parallel stacks by name"""
+
+from .BasicShardingLayer import BasicShardingLayer
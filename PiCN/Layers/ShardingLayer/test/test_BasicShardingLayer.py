@@ -0,0 +1,63 @@
+"""Test the BasicShardingLayer"""
+
+import multiprocessing
+import unittest
+
+from PiCN.Layers.PacketEncodingLayer.Encoder import NdnTlvEncoder
+from PiCN.Layers.ShardingLayer import BasicShardingLayer
+from PiCN.Packets import Content, Interest, Nack, NackReason, Name
+
+
+class test_BasicShardingLayer(unittest.TestCase):
+    """Test the BasicShardingLayer"""
+
+    def setUp(self):
+        self.encoder = NdnTlvEncoder()
+        self.shardinglayer = BasicShardingLayer(self.encoder, 4)
+        self.queue_from_lower = multiprocessing.Queue()
+        self.queue_from_higher = multiprocessing.Queue()
+        self.queue_to_lower = multiprocessing.Queue()
+        self.queues_to_shards = [multiprocessing.Queue() for i in range(4)]
+        self.shardinglayer.queue_from_lower = self.queue_from_lower
+        self.shardinglayer.queue_from_higher = self.queue_from_higher
+        self.shardinglayer.queue_to_lower = self.queue_to_lower
+        self.shardinglayer.queues_to_shards = self.queues_to_shards
+
+    def tearDown(self):
+        self.shardinglayer.stop_process()
+        for q in self.queues_to_shards:
+            q.close()
+
+    def test_shard_of(self):
+        """Test that names are distributed over all shards, and prefixes decide the shard if configured"""
+        shards = {self.shardinglayer.shard_of(Name("/test/data/" + str(i))) for i in range(100)}
+        self.assertEqual(shards, {0, 1, 2, 3})
+        self.assertEqual(self.shardinglayer.shard_of(Name("/test/data")),
+                         self.shardinglayer.shard_of(Name("/test/data").setDigest(b"1" * 32)))
+        self.assertEqual(self.shardinglayer.shard_of(None), 0)
+        self.shardinglayer.prefix_length = 2
+        shards = {self.shardinglayer.shard_of(Name("/test/data/" + str(i))) for i in range(100)}
+        self.assertEqual(shards, {self.shardinglayer.shard_of(Name("/test/data"))})
+
+    def test_packets_from_lower(self):
+        """Test that interest, content and nack for a name are passed to the same shard"""
+        self.shardinglayer.start_process()
+        for i in range(20):
+            name = Name("/test/data/" + str(i))
+            shard = self.queues_to_shards[self.shardinglayer.shard_of(name)]
+            for packet in [Interest(name), Content(name, "HelloWorld"), Nack(name, NackReason.NO_ROUTE, Interest(name))]:
+                data = [1, self.encoder.encode(packet)]
+                self.queue_from_lower.put(data)
+                self.assertEqual(shard.get(timeout=2.0), data)
+
+    def test_malformed_packet_from_lower(self):
+        """Test that packets without a readable name are passed to the first shard"""
+        self.shardinglayer.start_process()
+        self.queue_from_lower.put([1, b"data"])
+        self.assertEqual(self.queues_to_shards[0].get(timeout=2.0), [1, b"data"])
+
+    def test_packets_from_higher(self):
+        """Test that packets from the shards are passed to the lower layer"""
+        self.shardinglayer.start_process()
+        self.queue_from_higher.put([1, b"data"])
+        self.assertEqual(self.queue_to_lower.get(timeout=2.0), [1, b"data"])
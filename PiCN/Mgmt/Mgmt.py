@@ -132,6 +132,15 @@ class Mgmt(PiCNProcess):
             replysock.send(reply.encode())
             self.logger.info("New content added " + prefix + "|" + content.content)
             return
+        elif(command == "getcsstatistics"):
+            statistics = self.cs.get_statistics()
+            if statistics is None:
+                reply = "HTTP/1.1 200 OK \r\n Content-Type: text/html \r\n\r\n No CS statistics available OK\r\n"
+            else:
+                statistics = ";".join([key + "=" + str(value) for key, value in statistics.items()])
+                reply = "HTTP/1.1 200 OK \r\n Content-Type: text/html \r\n\r\n " + statistics + " OK\r\n"
+            replysock.send(reply.encode())
+            return
         else:
             self.unknown_command(replysock)
             return
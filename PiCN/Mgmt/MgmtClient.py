@@ -1,6 +1,7 @@
 """Client for The Mgmt of PiCN"""
 
 import socket
+from typing import Dict
 
 from PiCN.Packets import Name
 
@@ -39,6 +40,16 @@ class MgmtClient(object):
         param = name.to_string() + ":" + data
         return self.layercommand("icnlayer", "newcontent", param.replace("/", "%2F"))
 
+    def get_cs_statistics(self) -> Dict[str, int]:
+        """get the usage counters of the content store of a relay
+        :return: dict of counter names to values, None if the content store does not provide statistics
+        """
+        reply = self.layercommand("icnlayer", "getcsstatistics", "")
+        reply = self.parseHTTPReply(reply)
+        if "=" not in reply:
+            return None
+        return {key: int(value) for key, value in [field.split("=", 1) for field in reply.split(";")]}
+
     def get_repo_prefix(self) -> str:
         """get the prefix that is used by a repo
         :return reply message of the relay, containing the prefix
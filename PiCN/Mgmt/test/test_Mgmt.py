@@ -8,13 +8,13 @@ from random import randint
 
 from PiCN.Layers.ICNLayer.ForwardingInformationBase import ForwardingInformationBaseMemoryPrefix
 from PiCN.Layers.ICNLayer.PendingInterestTable import PendingInterstTableMemoryExact
-from PiCN.Layers.ICNLayer.ContentStore import ContentStoreMemoryExact
+from PiCN.Layers.ICNLayer.ContentStore import ContentStoreMemoryExact, ContentStoreMemoryBounded
 from PiCN.Layers.LinkLayer import BasicLinkLayer
 from PiCN.Layers.LinkLayer.FaceIDTable import FaceIDDict
 from PiCN.Layers.LinkLayer.Interfaces import UDP4Interface, AddressInfo
 from PiCN.Mgmt import Mgmt
 from PiCN.Mgmt import MgmtClient
-from PiCN.Packets import Name
+from PiCN.Packets import Content, Name
 from PiCN.Processes import PiCNSyncDataStructFactory
 
 
@@ -208,3 +208,28 @@ class test_Mgmt(unittest.TestCase):
         self.mgmt.start_process()
         data = self.mgmt_client.shutdown()
         self.assertEqual(data, "HTTP/1.1 200 OK \r\n Content-Type: text/html \r\n\r\n shutdown\r\n")
+
+    def test_get_cs_statistics_mgmt_client(self):
+        """Test reading CS statistics using MgmtClient, the exact matching CS does not provide any"""
+        self.linklayer.start_process()
+        self.mgmt.start_process()
+
+        self.assertIsNone(self.mgmt_client.get_cs_statistics())
+
+    def test_get_cs_statistics_bounded_cs_mgmt_client(self):
+        """Test reading CS statistics using MgmtClient from a bounded CS, content added by mgmt is pinned"""
+        synced_data_struct_factory = PiCNSyncDataStructFactory()
+        synced_data_struct_factory.register("cs", ContentStoreMemoryBounded)
+        synced_data_struct_factory.create_manager()
+        self.mgmt.cs = synced_data_struct_factory.manager.cs(max_entries=2)
+        self.linklayer.start_process()
+        self.mgmt.start_process()
+
+        self.mgmt_client.add_new_content(Name("/test/data"), "HelloWorld")
+        self.mgmt.cs.add_content_object(Content("/test/data", "GoodBye"))
+        self.mgmt.cs.add_content_object(Content("/data/1", "a"))
+        self.mgmt.cs.add_content_object(Content("/data/2", "b"))
+        self.assertEqual(self.mgmt.cs.find_content_object(Name("/test/data")).content.content, "HelloWorld")
+        self.assertIsNone(self.mgmt.cs.find_content_object(Name("/data/1")))
+        self.assertEqual(self.mgmt_client.get_cs_statistics(),
+                         {'hits': 1, 'misses': 1, 'evictions': 1, 'entries': 2, 'bytes': 11})
@@ -4,28 +4,42 @@ from .Packet import Packet
 
 class Content(Packet):
     """
-    Internal representation of a content object
+    Internal representation of a content object.
+    The payload may be a memoryview, which is materialized to bytes only when the payload is requested as bytes or str,
+    or when the content object is pickled. Encoders create content objects whose payload is decoded lazily
+    (see LazyContent).
     """
 
+    __slots__ = ('_content',)
+
     def __init__(self, name = None, content = None, wire_format = None):
         Packet.__init__(self, name)
         if type(content) == str:
             self._content = content.encode()
         else:
             self._content = content
-        assert (type(self._content) in [bytes, bytearray, type(None)]), "MUST be raw bytes or None"
+        assert (type(self._content) in [bytes, bytearray, memoryview, type(None)]), "MUST be raw bytes or None"
         self._wire_format = wire_format
         assert (type(self._wire_format) in [bytes, bytearray, type(None)]), "MUST be raw bytes or None"
 
     @property
     def content(self) -> str:
-        if self._content == None:
+        payload = self.get_bytes()
+        if payload is None:
             return None
-        return self._content.decode()
+        return payload.decode()
 
     def get_bytes(self) -> bytearray:
+        if type(self._content) is memoryview:
+            self._content = self._content.tobytes()
         return self._content
 
+    def get_view(self) -> memoryview:
+        """payload as memoryview, without copying it"""
+        if self._content is None:
+            return None
+        return memoryview(self._content)
+
     @content.setter
     def content(self, content):
         if type(content) == str:
@@ -33,7 +47,14 @@ class Content(Packet):
         assert (type(content) in [bytes, bytearray]), "MUST be raw bytes"
         self._content = content
 
+    def __getstate__(self):
+        content = self._content.tobytes() if type(self._content) is memoryview else self._content
+        return self._name, content, self._wire_format, self._name_payload
+
+    def __setstate__(self, state):
+        self._name, self._content, self._wire_format, self._name_payload = state
+
     def __eq__(self, other):
-        if type(other) is not Content:
+        if not isinstance(other, Content):
             return False
-        return self.name == other.name and self._content == other._content
+        return self.name == other.name and self.get_view() == other.get_view()
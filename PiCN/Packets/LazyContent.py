@@ -0,0 +1,47 @@
+"""Internal representation of a received content object, whose payload is decoded on demand"""
+
+import abc
+
+from .Content import Content
+from .Name import Name
+
+class LazyContent(Content):
+    """
+    Internal representation of a received content object. Only the name is decoded on reception, the payload is
+    decoded from the wire format when it is accessed. A content object which is only forwarded carries (and pickles)
+    nothing but its name and wire format.
+    Encoders subclass LazyContent and implement decode_payload.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, name: Name, wire_format):
+        Content.__init__(self, name, None, wire_format)
+        assert (wire_format is not None), "MUST have a wire format"
+
+    @abc.abstractmethod
+    def decode_payload(self):
+        """
+        Decode the payload from the wire format
+        :return: payload as raw bytes or memoryview into the wire format
+        """
+
+    def get_bytes(self) -> bytearray:
+        if self._content is None and self._wire_format is not None:
+            self._content = self.decode_payload()
+        return Content.get_bytes(self)
+
+    def get_view(self) -> memoryview:
+        if self._content is None and self._wire_format is not None:
+            self._content = self.decode_payload()
+        return Content.get_view(self)
+
+    @Content.content.setter
+    def content(self, content):
+        Content.content.fset(self, content)
+        self._wire_format = None
+
+    def __getstate__(self):
+        if self._wire_format is None:
+            return Content.__getstate__(self)
+        return self._name, None, self._wire_format, self._name_payload
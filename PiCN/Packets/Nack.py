@@ -10,6 +10,8 @@ class Nack(Packet):
     Internal representation of an NACK (negative acknowledgement) packet
     """
 
+    __slots__ = ('_reason', '_interest')
+
     def __init__(self, name: Name, reason: NackReason, interest, wire_format=None):
         """
         New negative acknowledgement (NACK) object
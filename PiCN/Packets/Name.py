@@ -4,17 +4,89 @@ from typing import List, Union
 
 import binascii
 import json
-import os
 from typing import List, Union
 
+
+class NameComponents(list):
+    """
+    List of the components of a name, which resets the cached key of the name when it is modified
+    """
+
+    __slots__ = ('_name',)
+
+    def __init__(self, components, name: 'Name'):
+        list.__init__(self, components)
+        self._name = name
+
+    def _modified(self):
+        self._name._key = None
+
+    def __setitem__(self, index, value):
+        list.__setitem__(self, index, value)
+        self._modified()
+
+    def __delitem__(self, index):
+        list.__delitem__(self, index)
+        self._modified()
+
+    def __iadd__(self, other):
+        list.extend(self, other)
+        self._modified()
+        return self
+
+    def __imul__(self, n):
+        list.__imul__(self, n)
+        self._modified()
+        return self
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    def append(self, component):
+        list.append(self, component)
+        self._modified()
+
+    def extend(self, components):
+        list.extend(self, components)
+        self._modified()
+
+    def insert(self, index, component):
+        list.insert(self, index, component)
+        self._modified()
+
+    def pop(self, index=-1):
+        component = list.pop(self, index)
+        self._modified()
+        return component
+
+    def remove(self, component):
+        list.remove(self, component)
+        self._modified()
+
+    def clear(self):
+        list.clear(self)
+        self._modified()
+
+    def reverse(self):
+        list.reverse(self)
+        self._modified()
+
+    def sort(self, *args, **kwargs):
+        list.sort(self, *args, **kwargs)
+        self._modified()
+
+
 class Name(object):
     """
     Internal representation of network name
     """
 
+    __slots__ = ('_key', '_suite', '_digest', '__components')
+
     def __init__(self, name: Union[str, List[bytes]] = None, suite='ndn2013'):
-        self.suite = suite
-        self.digest = None
+        self._key = None
+        self._suite = suite
+        self._digest = None
         if name:
             if isinstance(name, str):
                 self.from_string(name)
@@ -23,6 +95,48 @@ class Name(object):
         else:
             self._components = []
 
+    @property
+    def _components(self) -> NameComponents:
+        return self.__components
+
+    @_components.setter
+    def _components(self, components):
+        self.__components = NameComponents(components, self)
+        self._key = None
+
+    @property
+    def suite(self):
+        return self._suite
+
+    @suite.setter
+    def suite(self, suite):
+        self._suite = suite
+        self._key = None
+
+    @property
+    def digest(self):
+        return self._digest
+
+    @digest.setter
+    def digest(self, digest):
+        self._digest = digest
+        self._key = None
+
+    @property
+    def key(self) -> tuple:
+        """
+        Canonical, hashable key of the name: suite, components joined with '/' and digest. Two names have the same key
+        exactly if they are equal. The key is cached until the name is modified.
+        """
+        if self._key is None:
+            try:
+                components = b'/'.join(self.__components)
+            except TypeError:
+                components = b'/'.join([c.encode('ascii') if type(c) is str else c for c in self.__components])
+            key = (self._suite, components, self._digest or None)
+            self._key = (key, hash(key))
+        return self._key[0]
+
     def from_string(self, name: str):
         """Set the name from a string, components separated by /"""
         # FIXME: handle '/' as part of a component, UTF etc
@@ -75,9 +189,9 @@ class Name(object):
     def __eq__(self, other) -> bool:
         if type(other) is not Name:
             return False
-        if self.suite != other.suite:
-            return False
-        return self.to_string() == other.to_string()
+        if self is other:
+            return True
+        return self.key == other.key
 
     def __add__(self, other) -> 'Name':
         components: List[bytes] = []
@@ -101,7 +215,17 @@ class Name(object):
         return Name(components)
 
     def __hash__(self) -> int:
-        return self._components.__str__().__hash__()
+        if self._key is None:
+            self.key
+        return self._key[1]
+
+    def __reduce__(self):
+        if self._digest is None:
+            return Name, (list(self.__components), self._suite)
+        return Name, (list(self.__components), self._suite), self._digest
+
+    def __setstate__(self, digest):
+        self.digest = digest
 
     def __len__(self):
         return len(self._components)
@@ -112,8 +236,9 @@ class Name(object):
         :param name: name
         :return: true if self is prefix of given name, false otherwise
         """
-        pfx = os.path.commonprefix([self._components, name._components])
-        return len(pfx) == len(self._components)
+        components = self.__components
+        length = len(components)
+        return length <= len(name._components) and name._components[:length] == components
 
     def has_prefix(self, name):
         """
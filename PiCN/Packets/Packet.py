@@ -7,12 +7,15 @@ class Packet(object):
     Base class for internal representation of network packets
     """
 
+    __slots__ = ('_name', '_wire_format', '_name_payload')
+
     def __init__(self, name: Name = None, wire_format = None):
         if type(name) == str:
             self._name = Name(name)
         else:
             self._name: Name = name
         self._wire_format = wire_format
+        self._name_payload = None
         assert (type(self._wire_format) in [bytes, bytearray, type(None)]), "MUST be raw bytes or None"
 
     def __eq__(self, other):
@@ -32,6 +35,14 @@ class Packet(object):
     def name(self, name):
         self._name = name
 
+    @property
+    def name_payload(self):
+        return self._name_payload
+
+    @name_payload.setter
+    def name_payload(self, name_payload):
+        self._name_payload = name_payload
+
     @property
     def wire_format(self):
         return self._wire_format
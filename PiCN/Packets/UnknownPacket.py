@@ -7,6 +7,8 @@ class UnknownPacket(Packet):
     Internal representation of a received packet whose type is unknown
     """
 
+    __slots__ = ()
+
     def __init__(self, name = None, wire_format = None):
         Packet.__init__(self, name=None, wire_format=wire_format)
         assert (type(self.wire_format) in [bytes, bytearray]), "MUST be raw bytes ('None' is invalid)"
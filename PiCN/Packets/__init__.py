@@ -1,6 +1,7 @@
 """"Packet and Name Datastructure for internal use in PiCN"""
 
 from .Content import Content
+from .LazyContent import LazyContent
 from .Interest import Interest
 from .Name import Name
 from .Nack import Nack
@@ -1,4 +1,5 @@
 """Test Content Object"""
+import pickle
 import unittest
 
 from PiCN.Packets import Content
@@ -21,4 +22,33 @@ class TestContent(unittest.TestCase):
         """Test if two content objects are not equal"""
         c1 = Content("/test/data", "HelloWorld")
         c2 = Content("/test/data", "HelloWorld2")
-        self.assertNotEqual(c1, c2)
\ No newline at end of file
+        self.assertNotEqual(c1, c2)
+
+    def test_content_memoryview(self):
+        """Test a content object with a memoryview as payload"""
+        wire = b"xxHelloWorld"
+        c1 = Content("/test/data", memoryview(wire)[2:])
+        self.assertEqual(c1, Content("/test/data", "HelloWorld"))
+        self.assertEqual(c1.get_view(), b"HelloWorld")
+        self.assertEqual(c1.content, "HelloWorld")
+        self.assertEqual(c1.get_bytes(), b"HelloWorld")
+        self.assertIsInstance(c1.get_bytes(), bytes)
+
+    def test_content_memoryview_pickle(self):
+        """Test that a memoryview payload is materialized when the content object is pickled"""
+        c1 = Content("/test/data", memoryview(b"xxHelloWorld")[2:])
+        c2 = pickle.loads(pickle.dumps(c1))
+        self.assertEqual(c1, c2)
+        self.assertIsInstance(c1.get_view(), memoryview)
+        self.assertIsInstance(c2.get_bytes(), bytes)
+
+    def test_content_slots(self):
+        """Test that content objects and their names do not carry an attribute dict"""
+        c1 = Content("/test/data", "HelloWorld", b"wire")
+        self.assertFalse(hasattr(c1, '__dict__'))
+        self.assertFalse(hasattr(c1.name, '__dict__'))
+        with self.assertRaises(AttributeError):
+            c1.other = 1
+        c2 = pickle.loads(pickle.dumps(c1))
+        self.assertEqual(c1, c2)
+        self.assertEqual(c2.wire_format, b"wire")
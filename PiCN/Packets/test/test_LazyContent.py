@@ -0,0 +1,66 @@
+"""Test Content Objects with lazily decoded payload"""
+import pickle
+import unittest
+
+from PiCN.Packets import Content, LazyContent
+
+
+class CountingContent(LazyContent):
+    """content object counting the number of payload decodings"""
+
+    __slots__ = ()
+    decodings = 0
+
+    def decode_payload(self):
+        CountingContent.decodings += 1
+        return memoryview(self._wire_format)[2:]
+
+
+class TestLazyContent(unittest.TestCase):
+
+    def setUp(self):
+        CountingContent.decodings = 0
+
+    def test_decode_on_access(self):
+        """Test that the payload is decoded on first access only"""
+        c1 = CountingContent("/test/data", b"xxHelloWorld")
+        self.assertEqual(CountingContent.decodings, 0)
+        self.assertEqual(c1.name, Content("/test/data").name)
+        self.assertEqual(c1.content, "HelloWorld")
+        self.assertEqual(c1.get_bytes(), b"HelloWorld")
+        self.assertEqual(c1.get_view(), b"HelloWorld")
+        self.assertEqual(CountingContent.decodings, 1)
+
+    def test_equal(self):
+        """Test that lazy content objects compare to content objects by name and payload"""
+        c1 = CountingContent("/test/data", b"xxHelloWorld")
+        self.assertEqual(c1, Content("/test/data", "HelloWorld"))
+        self.assertEqual(Content("/test/data", "HelloWorld"), c1)
+        self.assertNotEqual(c1, Content("/test/data", "Other"))
+
+    def test_pickle(self):
+        """Test that only name and wire format are pickled, even after decoding the payload"""
+        c1 = CountingContent("/test/data", b"xx" + b"a" * 1000)
+        c1.get_bytes()
+        data = pickle.dumps(c1)
+        self.assertLess(len(data), 1200)
+        c2 = pickle.loads(data)
+        self.assertIsInstance(c2, CountingContent)
+        self.assertEqual(CountingContent.decodings, 1)
+        self.assertEqual(c2.get_bytes(), b"a" * 1000)
+        self.assertEqual(c1, c2)
+
+    def test_set_content(self):
+        """Test that setting the payload drops the wire format"""
+        c1 = CountingContent("/test/data", b"xxHelloWorld")
+        c1.content = "Other"
+        self.assertIsNone(c1.wire_format)
+        self.assertEqual(c1.get_bytes(), b"Other")
+        c2 = pickle.loads(pickle.dumps(c1))
+        self.assertEqual(c2.content, "Other")
+        self.assertEqual(CountingContent.decodings, 0)
+
+    def test_decode_payload_abstract(self):
+        """Test that LazyContent requires a payload decoder"""
+        self.assertTrue(getattr(LazyContent.decode_payload, "__isabstractmethod__", False))
+        self.assertFalse(getattr(CountingContent.decode_payload, "__isabstractmethod__", False))
@@ -1,4 +1,5 @@
 """Test Name Object"""
+import pickle
 import unittest
 
 from PiCN.Packets import Name
@@ -62,3 +63,57 @@ class TestContent(unittest.TestCase):
         n += 'data'
         self.assertEqual([b'test', b'data'], n._components)
         self.assertEqual('/test/data', n.components_to_string())
+
+    def test_key(self):
+        """Test that equal names have the same key and hash"""
+        n1 = Name('/test/data')
+        n2 = Name([b'test', 'data'])
+        self.assertEqual(n1.key, ('ndn2013', b'test/data', None))
+        self.assertEqual(n1, n2)
+        self.assertEqual(hash(n1), hash(n2))
+        self.assertNotEqual(n1, Name('/test/data', suite='other'))
+        self.assertNotEqual(n1, Name('/test/data').setDigest(b'1' * 32))
+        self.assertNotEqual(n1, '/test/data')
+
+    def test_key_reset_on_modification(self):
+        """Test that the cached key is reset when the name is modified"""
+        n = Name('/test/data')
+        hash(n)
+        n.components.append(b'c0')
+        self.assertEqual(n, Name('/test/data/c0'))
+        n._components.pop()
+        self.assertEqual(n, Name('/test/data'))
+        n.components[1] = b'other'
+        self.assertEqual(n, Name('/test/other'))
+        n.string_components = ['a', 'b']
+        self.assertEqual(n, Name('/a/b'))
+        n.setDigest(b'1' * 32)
+        self.assertEqual(n.key, ('ndn2013', b'a/b', b'1' * 32))
+        n.suite = 'other'
+        self.assertEqual(n.key, ('other', b'a/b', b'1' * 32))
+
+    def test_constructor_copies_components(self):
+        """Test that a name created from the components of another name does not modify it"""
+        n1 = Name('/test/data')
+        n2 = Name(n1.components)
+        n2.components.append(b'c0')
+        self.assertEqual(n1, Name('/test/data'))
+
+    def test_pickle(self):
+        """Test that a pickled name is equal to the original and can be modified"""
+        n1 = Name('/test/data').setDigest(b'1' * 32)
+        hash(n1)
+        n2 = pickle.loads(pickle.dumps(n1))
+        self.assertEqual(n1, n2)
+        self.assertEqual(hash(n1), hash(n2))
+        n2.components.append(b'c0')
+        self.assertNotEqual(n1, n2)
+
+    def test_is_prefix_of(self):
+        """Test the prefix check of names"""
+        self.assertTrue(Name('/test').is_prefix_of(Name('/test/data')))
+        self.assertTrue(Name('/test/data').is_prefix_of(Name('/test/data')))
+        self.assertTrue(Name().is_prefix_of(Name('/test/data')))
+        self.assertFalse(Name('/test/data').is_prefix_of(Name('/test')))
+        self.assertFalse(Name('/test/dat').is_prefix_of(Name('/test/data')))
+        self.assertTrue(Name('/test/data').has_prefix(Name('/test')))
@@ -81,7 +81,6 @@ class HeartbeatForwarderStack(object):
     def start_forwarder(self):
         # start processes
         self.lstack.start_all()
-        self.icn_layer.ageing()
         self.mgmt.start_process()
 
     def stop_forwarder(self):
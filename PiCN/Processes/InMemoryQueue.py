@@ -0,0 +1,85 @@
+"""Queue between two layers running in the same process on an asyncio event loop"""
+
+import asyncio
+import collections
+import multiprocessing
+import queue
+import threading
+
+
+class InMemoryQueue(object):
+    """Queue between two layers running in the same process on an asyncio event loop (see AsyncioLayerStack).
+    Items are kept in a deque and handed to the consuming layer without pickling. Items put by other threads are
+    passed to the thread of the event loop, items put by other processes (e.g. by timers running in the process that
+    created the layer stack) are sent to the event loop through a multiprocessing queue.
+    """
+
+    def __init__(self):
+        self._items = collections.deque()
+        self._remote = multiprocessing.Queue()
+        self._loop: asyncio.AbstractEventLoop = None
+        self._loop_thread: int = None
+        self._handler = None
+        self._scheduled: bool = False
+
+    def consume(self, loop: asyncio.AbstractEventLoop, handler):
+        """hand all items to a handler running on an event loop, called in the process running the loop
+        :param loop: event loop of the consuming layer
+        :param handler: function called with each item
+        """
+        self._loop = loop
+        self._loop_thread = threading.get_ident()
+        self._handler = handler
+        loop.add_reader(self._remote._reader, self._receive_remote)
+        if self._items:
+            self._schedule()
+
+    def put(self, item):
+        if self._loop is None:
+            self._remote.put(item)
+        elif threading.get_ident() != self._loop_thread:
+            self._loop.call_soon_threadsafe(self.put, item)
+        else:
+            self._items.append(item)
+            if not self._scheduled:
+                self._schedule()
+
+    def get_nowait(self):
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def close(self):
+        self._remote.close()
+
+    def join_thread(self):
+        self._remote.join_thread()
+
+    def _schedule(self):
+        """dispatch the items in the next iteration of the event loop"""
+        self._scheduled = True
+        self._loop.call_soon(self._dispatch)
+
+    def _dispatch(self):
+        """hand all items to the handler"""
+        self._scheduled = False
+        items = self._items
+        try:
+            while items:
+                self._handler(items.popleft())
+        finally:
+            if items and not self._scheduled:
+                self._schedule()
+
+    def _receive_remote(self):
+        """move the items sent by other processes into the deque"""
+        while True:
+            try:
+                item = self._remote.get_nowait()
+            except queue.Empty:
+                return
+            self.put(item)
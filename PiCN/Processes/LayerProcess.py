@@ -1,13 +1,20 @@
 """ Abstract Class defining a Process running on a layer"""
 
 import abc
+import asyncio
 import inspect
 import multiprocessing
 import os
+import queue
 import select
 import time
 
+from typing import List
+
 from PiCN.Processes import PiCNProcess
+from PiCN.Processes.PiCNLocalDataStruct import PiCNLocalDataStruct
+from PiCN.Processes.InMemoryQueue import InMemoryQueue
+from PiCN.Processes.QueueBatch import QueueBatch, BatchingQueue
 
 class LayerProcess(PiCNProcess):
     """ Abstract Class defining a Process running on a layer"""
@@ -19,6 +26,12 @@ class LayerProcess(PiCNProcess):
         self._queue_to_lower: multiprocessing.Queue = None
         self._queue_to_higher: multiprocessing.Queue = None
         self.stop: bool = False
+        self._data_structs: List[PiCNLocalDataStruct] = []
+        self._readers: List = []
+        self.batch_size: int = 1
+        self.batch_to_lower: bool = False
+        self.batch_to_higher: bool = False
+        self.timer_interval: float = None
 
     @property
     def queue_from_lower(self):
@@ -56,6 +69,22 @@ class LayerProcess(PiCNProcess):
     def queue_to_higher(self, q):
         self._queue_to_higher = q
 
+    def serve_data_struct(self, data_struct):
+        """Let this layer own a data struct, which then lives in the process of this layer and serves calls of other
+        processes in the process loop. Data structs synced by a manager are ignored, they live in the manager process.
+        :param data_struct: data struct to be owned by this layer
+        """
+        if isinstance(data_struct, PiCNLocalDataStruct):
+            self._data_structs.append(data_struct)
+
+    def add_reader(self, reader, handler):
+        """Let the process loop call a handler whenever a reader is readable, e.g. the _reader of a queue filled by
+        other processes. Must be called before the process is started.
+        :param reader: multiprocessing Connection to wait for
+        :param handler: function without parameters, called when the reader is readable
+        """
+        self._readers.append((reader, handler))
+
     @abc.abstractmethod
     def data_from_lower(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue, data):
         """ handle incoming data from the lower layer """
@@ -64,6 +93,90 @@ class LayerProcess(PiCNProcess):
     def data_from_higher(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue, data):
         """ handle incoming data from the higher layer """
 
+    def on_timer(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue):
+        """ called by the process loop every timer_interval seconds, if timer_interval is set """
+
+    def on_start(self):
+        """ called in the starting process after the process running this layer was started, by start_process or by
+            the AsyncioLayerStack """
+
+    def on_stop(self):
+        """ called in the stopping process before the process running this layer is stopped """
+
+    def data_from_lower_batch(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue, batch: List):
+        """ handle a batch of incoming data from the lower layer, received in a single wakeup of the process loop """
+        for data in batch:
+            self.data_from_lower(to_lower, to_higher, data)
+
+    def data_from_higher_batch(self, to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue, batch: List):
+        """ handle a batch of incoming data from the higher layer, received in a single wakeup of the process loop """
+        for data in batch:
+            self.data_from_higher(to_lower, to_higher, data)
+
+    def _receive(self, in_queue: multiprocessing.Queue, handler, batch_handler, to_lower: multiprocessing.Queue,
+                 to_higher: multiprocessing.Queue):
+        """ Handle data from a queue which is ready to be read. If batch_size is larger than one, up to batch_size
+            items are drained from the queue and handed to the batch handler at once. QueueBatches put by a neighbouring
+            layer are unpacked.
+            :param in_queue: Queue to receive data from
+            :param handler: data_from_lower or data_from_higher
+            :param batch_handler: data_from_lower_batch or data_from_higher_batch
+            :param to_lower: Queue to send data to lower Layer
+            :param to_higher: Queue to send data to higher Layer
+        """
+        if self.batch_size <= 1:
+            data = in_queue.get()
+            if type(data) is QueueBatch:
+                batch_handler(to_lower, to_higher, data)
+            else:
+                handler(to_lower, to_higher, data)
+            return
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                data = in_queue.get_nowait()
+            except queue.Empty:
+                break
+            if type(data) is QueueBatch:
+                batch.extend(data)
+            else:
+                batch.append(data)
+        if batch:
+            batch_handler(to_lower, to_higher, batch)
+
+    def _flush(self, to_lower, to_higher):
+        """ Put the data collected while handling a wakeup of the process loop into the queues to the neighbouring
+            layers, if puts are batched (see batch_to_lower, batch_to_higher)
+        """
+        if type(to_lower) is BatchingQueue:
+            to_lower.flush()
+        if type(to_higher) is BatchingQueue:
+            to_higher.flush()
+
+    def _next_timer(self) -> float:
+        """ Time of the first call of on_timer, None if timer_interval is not set """
+        if not self.timer_interval:
+            return None
+        return time.time() + self.timer_interval
+
+    def _timer_timeout(self, next_timer: float) -> float:
+        """ Seconds the process loop may block waiting for data until on_timer is due, None to block without limit """
+        if next_timer is None:
+            return None
+        return max(0.0, next_timer - time.time())
+
+    def _handle_timer(self, next_timer: float, to_lower, to_higher) -> float:
+        """ Call on_timer if it is due
+            :return: the time of the next call of on_timer
+        """
+        if next_timer is None:
+            return None
+        now = time.time()
+        if now < next_timer:
+            return next_timer
+        self.on_timer(to_lower, to_higher)
+        return now + self.timer_interval
+
     def _run_poll(self, from_lower: multiprocessing.Queue, from_higher: multiprocessing.Queue,
             to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue):
         """ Process loop, handle incoming packets, use poll if many file descriptors are required
@@ -78,13 +191,29 @@ class LayerProcess(PiCNProcess):
             poller.register(from_lower._reader, READ_ONLY)
         if from_higher:
             poller.register(from_higher._reader, READ_ONLY)
+        data_structs = {}
+        for data_struct in self._data_structs:
+            poller.register(data_struct.request_reader, READ_ONLY)
+            data_structs[data_struct.request_reader.fileno()] = data_struct
+        readers = {}
+        for reader, handler in self._readers:
+            poller.register(reader, READ_ONLY)
+            readers[reader.fileno()] = handler
+        next_timer = self._next_timer()
         while True:
-            ready_vars = poller.poll()
+            timeout = self._timer_timeout(next_timer)
+            ready_vars = poller.poll(None if timeout is None else timeout * 1000)
             for filno, var in ready_vars:
-                if from_lower and filno == from_lower._reader.fileno() and not from_lower.empty():
-                    self.data_from_lower(to_lower, to_higher, from_lower.get())
+                if filno in data_structs:
+                    data_structs[filno].handle_requests()
+                elif filno in readers:
+                    readers[filno]()
+                elif from_lower and filno == from_lower._reader.fileno() and not from_lower.empty():
+                    self._receive(from_lower, self.data_from_lower, self.data_from_lower_batch, to_lower, to_higher)
                 elif from_higher and filno == from_higher._reader.fileno() and not from_higher.empty():
-                    self.data_from_higher(to_lower, to_higher, from_higher.get())
+                    self._receive(from_higher, self.data_from_higher, self.data_from_higher_batch, to_lower, to_higher)
+            next_timer = self._handle_timer(next_timer, to_lower, to_higher)
+            self._flush(to_lower, to_higher)
 
     def _run_select(self, from_lower: multiprocessing.Queue, from_higher: multiprocessing.Queue,
              to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue):
@@ -99,15 +228,30 @@ class LayerProcess(PiCNProcess):
             in_queues.append(from_lower._reader)
         if from_higher:
             in_queues.append(from_higher._reader)
+        data_structs = {}
+        for data_struct in self._data_structs:
+            in_queues.append(data_struct.request_reader)
+            data_structs[data_struct.request_reader] = data_struct
+        readers = {}
+        for reader, handler in self._readers:
+            in_queues.append(reader)
+            readers[reader] = handler
+        next_timer = self._next_timer()
         while True:
             if len(in_queues) == 0:
                 continue
-            ready_vars, _, _ = select.select(in_queues, [], [])
+            ready_vars, _, _ = select.select(in_queues, [], [], self._timer_timeout(next_timer))
             for var in ready_vars:
-                if from_lower and var == from_lower._reader and not from_lower.empty():
-                    self.data_from_lower(to_lower, to_higher, from_lower.get())
+                if var in data_structs:
+                    data_structs[var].handle_requests()
+                elif var in readers:
+                    readers[var]()
+                elif from_lower and var == from_lower._reader and not from_lower.empty():
+                    self._receive(from_lower, self.data_from_lower, self.data_from_lower_batch, to_lower, to_higher)
                 elif from_higher and var == from_higher._reader and not from_higher.empty():
-                    self.data_from_higher(to_lower, to_higher, from_higher.get())
+                    self._receive(from_higher, self.data_from_higher, self.data_from_higher_batch, to_lower, to_higher)
+            next_timer = self._handle_timer(next_timer, to_lower, to_higher)
+            self._flush(to_lower, to_higher)
 
     def _run_sleep(self, from_lower: multiprocessing.Queue, from_higher: multiprocessing.Queue,
                    to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue):
@@ -118,15 +262,63 @@ class LayerProcess(PiCNProcess):
             :param to_lower: Queue to send data to lower Layer
             :param to_higher: Queue to send data to higher Layer
          """
+        next_timer = self._next_timer()
         while True:
             dequeued: bool = False
             if from_lower and not from_lower.empty():
-                self.data_from_lower(to_lower, to_higher, from_lower.get())
+                self._receive(from_lower, self.data_from_lower, self.data_from_lower_batch, to_lower, to_higher)
                 dequeued = True
             if from_higher and not from_higher.empty():
-                self.data_from_higher(to_lower, to_higher, from_higher.get())
+                self._receive(from_higher, self.data_from_higher, self.data_from_higher_batch, to_lower, to_higher)
+            for data_struct in self._data_structs:
+                data_struct.handle_requests()
+            for reader, handler in self._readers:
+                if reader.poll():
+                    handler()
+            next_timer = self._handle_timer(next_timer, to_lower, to_higher)
+            self._flush(to_lower, to_higher)
             if not dequeued:
-                time.sleep(0.3)
+                timeout = self._timer_timeout(next_timer)
+                time.sleep(0.3 if timeout is None else min(0.3, timeout))
+
+    def _run_asyncio(self, loop: asyncio.AbstractEventLoop, from_lower, from_higher, to_lower, to_higher):
+        """ Register the handlers of this layer with an event loop, used if all layers of a stack run in a single
+            process (see AsyncioLayerStack). Queues between two layers of the stack are InMemoryQueues.
+            :param loop: event loop running the layer stack
+            :param from_lower: Queue to receive data from lower Layer
+            :param from_higher: Queue to receive data from higher Layer
+            :param to_lower: Queue to send data to lower Layer
+            :param to_higher: Queue to send data to higher Layer
+        """
+        if from_lower:
+            self._add_asyncio_reader(loop, from_lower, lambda data: self.data_from_lower(to_lower, to_higher, data))
+        if from_higher:
+            self._add_asyncio_reader(loop, from_higher, lambda data: self.data_from_higher(to_lower, to_higher, data))
+        for data_struct in self._data_structs:
+            data_struct.bind_owner()
+            loop.add_reader(data_struct.request_reader, data_struct.handle_requests)
+        for reader, handler in self._readers:
+            loop.add_reader(reader, handler)
+        if self.timer_interval:
+            def timer():
+                self.on_timer(to_lower, to_higher)
+                loop.call_later(self.timer_interval, timer)
+            loop.call_later(self.timer_interval, timer)
+
+    def _add_asyncio_reader(self, loop: asyncio.AbstractEventLoop, in_queue, handler):
+        """ Call a handler for each item received from a queue
+            :param loop: event loop running the layer stack
+            :param in_queue: InMemoryQueue or multiprocessing.Queue to receive from
+            :param handler: function called with each item
+        """
+        if isinstance(in_queue, InMemoryQueue):
+            in_queue.consume(loop, handler)
+            return
+
+        def drain():
+            while not in_queue.empty():
+                handler(in_queue.get())
+        loop.add_reader(in_queue._reader, drain)
 
     def _run(self, from_lower: multiprocessing.Queue, from_higher: multiprocessing.Queue,
              to_lower: multiprocessing.Queue, to_higher: multiprocessing.Queue):
@@ -138,6 +330,14 @@ class LayerProcess(PiCNProcess):
         :param to_lower: Queue to send data to lower Layer
         :param to_higher: Queue to send data to higher Layer
         """
+        for data_struct in self._data_structs:
+            data_struct.bind_owner()
+        if self.batch_size > 1 and self.batch_to_lower and to_lower:
+            to_lower = BatchingQueue(to_lower)
+            self.queue_to_lower = to_lower
+        if self.batch_size > 1 and self.batch_to_higher and to_higher:
+            to_higher = BatchingQueue(to_higher)
+            self.queue_to_higher = to_higher
         if os.name == 'nt': # Exception for windows since MS POSIX api do not support select on File Descriptors
             self._run_sleep(from_lower, from_higher, to_lower, to_higher)
         elif self.in_unittest():
@@ -147,15 +347,19 @@ class LayerProcess(PiCNProcess):
 
     def start_process(self):
         """Start the Layer Process"""
+        for data_struct in self._data_structs:
+            data_struct.start_owner()
         self.process = multiprocessing.Process(target=self._run, args=[self._queue_from_lower,
                                                                             self._queue_from_higher,
                                                                             self._queue_to_lower,
                                                                             self._queue_to_higher])
         self.process.daemon = True
         self.process.start()
+        self.on_start()
 
     def stop_process(self):
         """Stop the Layer Process"""
+        self.on_stop()
         if self.process:
             self.process.terminate()
             self.process.join()
@@ -0,0 +1,111 @@
+"""Data structs living in the process of the layer owning them, as alternative to data structs synced by a Manager"""
+
+import multiprocessing
+import os
+import queue
+
+from typing import Dict
+
+
+class PiCNLocalDataStruct(object):
+    """Wraps a data struct (e.g. PIT, FIB, CS) that lives in the process of the layer owning it. The owner calls the
+    data struct directly without any IPC, all other processes send their calls through a request queue to the owner,
+    which executes them in its process loop and replies the result.
+    Until the owner is started, the process that created the data struct uses its local copy directly. This copy is
+    inherited by the owner when its process is forked.
+    The owner must only use the data struct in the thread running its process loop: calls of the owner are not locked
+    and would race with handle_requests, so periodic work of the owner runs in on_timer instead of timer threads.
+    :param data_struct: the wrapped data struct
+    :param timeout: time to wait for a reply of the owner
+    """
+
+    def __init__(self, data_struct, timeout: float=10.0):
+        self._data_struct = data_struct
+        self._timeout = timeout
+        self._owner: bool = False
+        self._creator_pid: int = os.getpid()
+        self._owner_started = multiprocessing.RawValue('b', 0)
+        self._lock = multiprocessing.Lock()
+        self._requests = multiprocessing.Queue()
+        self._replies = multiprocessing.Queue()
+        self._request_id: int = 0
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if self._is_local():
+            return getattr(self._data_struct, name)
+        return lambda *args, **kwargs: self._call(name, args, kwargs)
+
+    def __len__(self):
+        if self._is_local():
+            return len(self._data_struct)
+        return self._call('__len__', (), {})
+
+    def __getitem__(self, key):
+        if self._is_local():
+            return self._data_struct[key]
+        return self._call('__getitem__', (key,), {})
+
+    def _is_local(self) -> bool:
+        """True if the calling process may use the data struct directly"""
+        return self._owner or (not self._owner_started.value and os.getpid() == self._creator_pid)
+
+    def start_owner(self):
+        """called by the owning layer before its process is started, from then on other processes send their calls"""
+        self._owner_started.value = 1
+
+    def bind_owner(self):
+        """make the calling process the owner of the data struct, called by the owning layer in its process"""
+        self._owner = True
+
+    @property
+    def request_reader(self):
+        """file descriptor of the request queue, readable if other processes wait for a reply"""
+        return self._requests._reader
+
+    def handle_requests(self):
+        """execute all pending calls of other processes and reply the results, called by the owner"""
+        while True:
+            try:
+                request_id, name, args, kwargs = self._requests.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                reply = (request_id, True, getattr(self._data_struct, name)(*args, **kwargs))
+            except Exception as e:
+                reply = (request_id, False, e)
+            self._replies.put(reply)
+
+    def _call(self, name: str, args, kwargs):
+        """send a call to the owner and wait for the reply"""
+        with self._lock:
+            self._request_id += 1
+            request_id = (os.getpid(), self._request_id)
+            self._requests.put((request_id, name, args, kwargs))
+            while True:
+                try:
+                    reply_id, success, result = self._replies.get(timeout=self._timeout)
+                except queue.Empty:
+                    raise TimeoutError("No reply from the owner of the data struct to call: " + name)
+                if reply_id == request_id:
+                    break
+        if not success:
+            raise result
+        return result
+
+
+class PiCNLocalDataStructManager(object):
+    """Drop-in for the Manager of the PiCNSyncDataStructFactory, creating PiCNLocalDataStructs of the registered
+    data structs instead of proxies to a manager process
+    :param data_structs: registered data structs by name
+    """
+
+    def __init__(self, data_structs: Dict[str, type]):
+        self._data_structs = data_structs
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name not in self._data_structs:
+            raise AttributeError(name)
+        data_struct = self._data_structs[name]
+        return lambda *args, **kwargs: PiCNLocalDataStruct(data_struct(*args, **kwargs))
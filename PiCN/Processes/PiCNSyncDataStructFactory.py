@@ -2,13 +2,19 @@
 
 from multiprocessing.managers import BaseManager
 
+from PiCN.Processes.PiCNLocalDataStruct import PiCNLocalDataStructManager
+
 class PiCNSyncDataStructFactory(object):
-    """Sync Datastruct Factory for PICN to create synced Datastructs such as PIT, FIB, CS"""
+    """Sync Datastruct Factory for PICN to create synced Datastructs such as PIT, FIB, CS
+    :param in_process: if True, datastructs live in the process of the layer owning them (see PiCNLocalDataStruct)
+        instead of in a manager process
+    """
 
-    def __init__(self):
+    def __init__(self, in_process: bool=False):
         self.manager = None
         self.names = []
-        pass
+        self.in_process = in_process
+        self.data_structs = {}
 
     def register(self, name: str, data_struct):
         """register a new data_struct to the manager
@@ -19,9 +25,13 @@ class PiCNSyncDataStructFactory(object):
             return
         BaseManager.register(name, data_struct)
         self.names.append(name)
+        self.data_structs[name] = data_struct
 
     def create_manager(self):
         """create a manager. call is after all data structs are registered"""
+        if self.in_process:
+            self.manager = PiCNLocalDataStructManager(self.data_structs)
+            return
         self.manager = BaseManager()
         self.manager.start()
 
@@ -32,4 +42,3 @@ class PiCNSyncDataStructFactory(object):
         if self.manager is None:
             self.create_manager()
         return self.manager
-
@@ -0,0 +1,41 @@
+"""Batches of data sent between two layers as a single queue item"""
+
+import threading
+
+
+class QueueBatch(list):
+    """Data items put into a queue between two layers as a single item, unpacked by the receiving LayerProcess"""
+
+
+class BatchingQueue(object):
+    """Wraps the queue to a neighbouring layer and collects the data put by the process loop while it handles a
+    wakeup. On flush, collected data is put into the queue at once, as a QueueBatch if there is more than one item.
+    Data put by other threads is put into the queue directly.
+    :param queue: queue to the neighbouring layer, which must be read by a LayerProcess
+    """
+
+    def __init__(self, queue):
+        self._queue = queue
+        self._items = []
+        self._thread: int = threading.get_ident()
+
+    def put(self, item):
+        if threading.get_ident() != self._thread:
+            self._queue.put(item)
+            return
+        self._items.append(item)
+
+    def flush(self):
+        """put all collected data into the queue"""
+        if not self._items:
+            return
+        if len(self._items) == 1:
+            self._queue.put(self._items[0])
+        else:
+            self._queue.put(QueueBatch(self._items))
+        self._items = []
+
+    def __getattr__(self, name):
+        if name == '_queue':
+            raise AttributeError(name)
+        return getattr(self._queue, name)
@@ -1,5 +1,8 @@
 """Abstract superclasses for PiCN"""
 
 from .PiCNProcess import PiCNProcess
+from .InMemoryQueue import InMemoryQueue
 from .LayerProcess import LayerProcess
+from .PiCNLocalDataStruct import PiCNLocalDataStruct, PiCNLocalDataStructManager
 from .PiCNSyncDataStructFactory import PiCNSyncDataStructFactory
+from .QueueBatch import QueueBatch, BatchingQueue
@@ -0,0 +1,72 @@
+"""Test the InMemoryQueue"""
+
+import asyncio
+import multiprocessing
+import queue
+import threading
+import unittest
+
+from PiCN.Processes import InMemoryQueue
+
+
+class test_InMemoryQueue(unittest.TestCase):
+    """Test the InMemoryQueue"""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.queue = InMemoryQueue()
+        self.received = []
+
+    def tearDown(self):
+        self.queue.close()
+        self.loop.close()
+
+    def handler(self, item):
+        self.received.append(item)
+        if item == "stop":
+            self.loop.stop()
+
+    def test_put_consumed(self):
+        """Test that items are handed to the handler in order"""
+        self.queue.consume(self.loop, self.handler)
+        self.queue.put([1, "a"])
+        self.queue.put([2, "b"])
+        self.queue.put("stop")
+        self.loop.run_forever()
+        self.assertEqual(self.received, [[1, "a"], [2, "b"], "stop"])
+        self.assertTrue(self.queue.empty())
+
+    def test_put_before_consume(self):
+        """Test that items put before the queue is consumed are not lost"""
+        self.queue.put("a")
+        self.queue.put("stop")
+        self.queue.consume(self.loop, self.handler)
+        self.loop.run_forever()
+        self.assertEqual(self.received, ["a", "stop"])
+
+    def test_put_from_other_thread(self):
+        """Test that items put by another thread are handled on the thread of the event loop"""
+        self.queue.consume(self.loop, self.handler)
+        t = threading.Thread(target=self.queue.put, args=["stop"])
+        self.loop.call_soon(t.start)
+        self.loop.run_forever()
+        t.join()
+        self.assertEqual(self.received, ["stop"])
+
+    def test_put_from_other_process(self):
+        """Test that items put by another process are handed to the handler"""
+        p = multiprocessing.Process(target=self.queue.put, args=["stop"])
+        p.start()
+        p.join()
+        self.queue.consume(self.loop, self.handler)
+        self.loop.run_forever()
+        self.assertEqual(self.received, ["stop"])
+
+    def test_get_nowait(self):
+        """Test getting items without a handler"""
+        self.queue.consume(self.loop, self.handler)
+        self.queue._items.append("a")
+        self.assertFalse(self.queue.empty())
+        self.assertEqual(self.queue.get_nowait(), "a")
+        with self.assertRaises(queue.Empty):
+            self.queue.get_nowait()
@@ -16,6 +16,9 @@ class LayerMock(LayerProcess):
     def data_from_higher(self, to_lower: Queue, to_higher: Queue, data):
         to_lower.put(data)
 
+    def on_timer(self, to_lower: Queue, to_higher: Queue):
+        to_higher.put("Timer")
+
 class TestLayerProcess(unittest.TestCase):
     """Test the Abstract Class LayerProcess"""
 
@@ -47,3 +50,12 @@ class TestLayerProcess(unittest.TestCase):
         self.q2_fromLower.put("Testdata")
         output = self.q3_toHigher.get()
         self.assertEqual(output, "Testdata")
+
+    def test_timer(self):
+        """ Test calling on_timer periodically while no data arrives"""
+        self.layer.timer_interval = 0.1
+        self.layer.start_process()
+        self.assertEqual(self.q3_toHigher.get(timeout=2.0), "Timer")
+        self.assertEqual(self.q3_toHigher.get(timeout=2.0), "Timer")
+        self.q1_fromHiger.put("Testdata")
+        self.assertEqual(self.q4_toLower.get(timeout=2.0), "Testdata")
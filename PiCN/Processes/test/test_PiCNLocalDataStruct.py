@@ -0,0 +1,97 @@
+"""Test the PiCNLocalDataStruct and the in process mode of the PiCNSyncDataStructFactory"""
+
+import unittest
+
+from multiprocessing import Queue
+from PiCN.Layers.ICNLayer.ContentStore import ContentStoreMemoryExact
+from PiCN.Layers.ICNLayer.ForwardingInformationBase import ForwardingInformationBaseMemoryTrie
+from PiCN.Packets import Content, Name
+from PiCN.Processes import LayerProcess, PiCNLocalDataStruct, PiCNSyncDataStructFactory
+
+
+class DataStructLayerMock(LayerProcess):
+    """ Mock implementation of a LayerProcess, which answers data from lower with the matching FIB entry"""
+    def __init__(self, fib):
+        LayerProcess.__init__(self)
+        self.fib = fib
+
+    def data_from_lower(self, to_lower: Queue, to_higher: Queue, data):
+        fib_entry = self.fib.find_fib_entry(data)
+        to_higher.put(fib_entry.faceid if fib_entry is not None else None)
+
+    def data_from_higher(self, to_lower: Queue, to_higher: Queue, data):
+        to_lower.put(data)
+
+
+class test_PiCNLocalDataStruct(unittest.TestCase):
+    """Test the PiCNLocalDataStruct"""
+
+    def setUp(self):
+        synced_data_struct_factory = PiCNSyncDataStructFactory(in_process=True)
+        synced_data_struct_factory.register("fib", ForwardingInformationBaseMemoryTrie)
+        synced_data_struct_factory.register("cs", ContentStoreMemoryExact)
+        synced_data_struct_factory.create_manager()
+        self.fib = synced_data_struct_factory.manager.fib()
+        self.cs = synced_data_struct_factory.manager.cs(cs_timeout=20)
+
+        self.q_from_higher: Queue = Queue()
+        self.q_from_lower: Queue = Queue()
+        self.q_to_higher: Queue = Queue()
+        self.q_to_lower: Queue = Queue()
+        self.layer = DataStructLayerMock(self.fib)
+        self.layer.queue_from_higher = self.q_from_higher
+        self.layer.queue_from_lower = self.q_from_lower
+        self.layer.queue_to_higher = self.q_to_higher
+        self.layer.queue_to_lower = self.q_to_lower
+        self.layer.serve_data_struct(self.fib)
+
+    def tearDown(self):
+        self.layer.stop_process()
+
+    def test_create_data_structs(self):
+        """Test that the factory creates local data structs with the given parameters"""
+        self.assertIsInstance(self.fib, PiCNLocalDataStruct)
+        self.assertIsInstance(self.cs, PiCNLocalDataStruct)
+        self.assertEqual(self.cs._data_struct._cs_timeout, 20)
+
+    def test_access_before_owner_started(self):
+        """Test that the creating process uses the data struct directly before the owner is started"""
+        self.fib.add_fib_entry(Name("/test"), 1)
+        self.assertEqual(self.fib.find_fib_entry(Name("/test/data")).faceid, 1)
+        self.assertEqual(self.fib.get_container_size(), 1)
+
+    def test_owner_inherits_data_struct(self):
+        """Test that the owner uses the entries added before it was started"""
+        self.fib.add_fib_entry(Name("/test"), 1)
+        self.layer.start_process()
+        self.q_from_lower.put(Name("/test/data"))
+        self.assertEqual(self.q_to_higher.get(timeout=5), 1)
+
+    def test_access_from_other_process(self):
+        """Test that calls of other processes are executed by the owner"""
+        self.layer.start_process()
+        self.fib.add_fib_entry(Name("/test"), 2)
+        self.q_from_lower.put(Name("/test/data"))
+        self.assertEqual(self.q_to_higher.get(timeout=5), 2)
+        self.assertEqual(self.fib.find_fib_entry(Name("/test/data")).faceid, 2)
+        self.assertIsNone(self.fib.find_fib_entry(Name("/data/test")))
+
+    def test_len_and_getitem_from_other_process(self):
+        """Test that len() and indexing of other processes are executed by the owner"""
+        data_struct = PiCNLocalDataStruct(["a", "b"])
+        self.layer.serve_data_struct(data_struct)
+        self.layer.start_process()
+        self.assertEqual(len(data_struct), 2)
+        self.assertEqual(data_struct[1], "b")
+
+    def test_exception_from_other_process(self):
+        """Test that exceptions raised in the owner are raised in the calling process"""
+        self.layer.start_process()
+        with self.assertRaises(AttributeError):
+            self.fib.find_fib_entry("/test/data")
+
+    def test_not_owned_data_struct(self):
+        """Test that a data struct without owner is used directly by the creating process"""
+        self.layer.start_process()
+        self.cs.add_content_object(Content("/test/data", "HelloWorld"))
+        self.assertEqual(self.cs.find_content_object(Name("/test/data")).content.content, "HelloWorld")
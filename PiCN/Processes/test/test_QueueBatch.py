@@ -0,0 +1,97 @@
+"""Test the QueueBatch, the BatchingQueue and the batched dispatch of the LayerProcess"""
+
+import threading
+import unittest
+
+from multiprocessing import Queue
+from PiCN.Processes import LayerProcess, QueueBatch, BatchingQueue
+
+
+class BatchLayerMock(LayerProcess):
+    """ Mock implementation of a LayerProcess, which forwards each batch it receives from lower as a list"""
+    def __init__(self):
+        LayerProcess.__init__(self)
+
+    def data_from_lower(self, to_lower: Queue, to_higher: Queue, data):
+        to_higher.put([data])
+
+    def data_from_higher(self, to_lower: Queue, to_higher: Queue, data):
+        to_lower.put(data)
+
+    def data_from_lower_batch(self, to_lower: Queue, to_higher: Queue, batch):
+        to_higher.put(list(batch))
+
+
+class test_QueueBatch(unittest.TestCase):
+    """Test the QueueBatch, the BatchingQueue and the batched dispatch of the LayerProcess"""
+
+    def setUp(self):
+        self.q_from_higher: Queue = Queue()
+        self.q_from_lower: Queue = Queue()
+        self.q_to_higher: Queue = Queue()
+        self.q_to_lower: Queue = Queue()
+        self.layer = BatchLayerMock()
+        self.layer.queue_from_higher = self.q_from_higher
+        self.layer.queue_from_lower = self.q_from_lower
+        self.layer.queue_to_higher = self.q_to_higher
+        self.layer.queue_to_lower = self.q_to_lower
+
+    def tearDown(self):
+        self.layer.stop_process()
+
+    def test_batching_queue_flush(self):
+        """Test that the BatchingQueue puts collected data on flush only, as QueueBatch if more than one item"""
+        q = BatchingQueue(self.q_to_higher)
+        q.put("data1")
+        q.flush()
+        self.assertEqual(self.q_to_higher.get(timeout=5), "data1")
+        q.put("data2")
+        q.put("data3")
+        self.assertTrue(self.q_to_higher.empty())
+        q.flush()
+        batch = self.q_to_higher.get(timeout=5)
+        self.assertIsInstance(batch, QueueBatch)
+        self.assertEqual(batch, ["data2", "data3"])
+        q.flush()
+        self.assertTrue(self.q_to_higher.empty())
+
+    def test_batching_queue_other_thread(self):
+        """Test that the BatchingQueue puts data of other threads into the queue directly"""
+        q = BatchingQueue(self.q_to_higher)
+        t = threading.Thread(target=q.put, args=["data"])
+        t.start()
+        t.join()
+        self.assertEqual(self.q_to_higher.get(timeout=5), "data")
+
+    def test_queue_batch_unbatched_layer(self):
+        """Test that a layer with batch size one hands a received QueueBatch to the batch handler"""
+        self.layer.start_process()
+        self.q_from_lower.put(QueueBatch(["data1", "data2"]))
+        self.assertEqual(self.q_to_higher.get(timeout=5), ["data1", "data2"])
+        self.q_from_lower.put("data3")
+        self.assertEqual(self.q_to_higher.get(timeout=5), ["data3"])
+
+    def test_drain_batch(self):
+        """Test that a layer with a batch size drains multiple items and unpacks QueueBatches"""
+        self.layer.batch_size = 8
+        for i in range(4):
+            self.q_from_lower.put(i)
+        self.q_from_lower.put(QueueBatch([4, 5]))
+        self.layer.start_process()
+        received = []
+        while len(received) < 6:
+            received += self.q_to_higher.get(timeout=5)
+        self.assertEqual(received, [0, 1, 2, 3, 4, 5])
+
+    def test_batched_put(self):
+        """Test that a layer batching puts to lower sends one QueueBatch per wakeup"""
+        self.layer.batch_size = 8
+        self.layer.batch_to_lower = True
+        for i in range(3):
+            self.q_from_higher.put(i)
+        self.layer.start_process()
+        received = []
+        while len(received) < 3:
+            data = self.q_to_lower.get(timeout=5)
+            received += data if type(data) is QueueBatch else [data]
+        self.assertEqual(received, [0, 1, 2])
@@ -1,6 +1,6 @@
 """Fetch Tool for PiCN"""
 
-from PiCN.LayerStack import LayerStack
+from PiCN.LayerStack import LayerStack, AsyncioLayerStack
 from PiCN.Layers.AutoconfigLayer import AutoconfigClientLayer
 from PiCN.Layers.ChunkLayer import BasicChunkLayer
 from PiCN.Layers.PacketEncodingLayer import BasicPacketEncodingLayer
@@ -18,7 +18,7 @@ class Fetch(object):
     """Fetch Tool for PiCN"""
 
     def __init__(self, ip: str, port: int, log_level = 255, encoder: BasicEncoder=None, autoconfig: bool = False,
-                 interfaces=None):
+                 interfaces=None, single_process: bool=False):
 
         # create encoder and chunkifyer
         if encoder is None:
@@ -44,7 +44,8 @@ class Fetch(object):
         self.packetencodinglayer = BasicPacketEncodingLayer(self.encoder, log_level=log_level)
         self.chunklayer = BasicChunkLayer(self.chunkifyer, log_level=log_level)
 
-        self.lstack: LayerStack = LayerStack([
+        layer_stack = AsyncioLayerStack if single_process else LayerStack
+        self.lstack: LayerStack = layer_stack([
             self.chunklayer,
             self.packetencodinglayer,
             self.linklayer
@@ -5,7 +5,7 @@ from typing import Optional
 import multiprocessing
 from typing import List
 
-from PiCN.LayerStack.LayerStack import LayerStack
+from PiCN.LayerStack import LayerStack, AsyncioLayerStack
 from PiCN.Layers.ChunkLayer import BasicChunkLayer
 from PiCN.Layers.PacketEncodingLayer import BasicPacketEncodingLayer
 from PiCN.Layers.RepositoryLayer import BasicRepositoryLayer
@@ -18,7 +18,8 @@ from PiCN.Layers.LinkLayer.Interfaces import UDP4Interface, BaseInterface
 from PiCN.Processes.PiCNSyncDataStructFactory import PiCNSyncDataStructFactory
 from PiCN.Layers.PacketEncodingLayer.Encoder import SimpleStringEncoder
 from PiCN.Layers.PacketEncodingLayer.Encoder import BasicEncoder
-from PiCN.Layers.RepositoryLayer.Repository import BaseRepository, SimpleFileSystemRepository, SimpleMemoryRepository
+from PiCN.Layers.RepositoryLayer.Repository import BaseRepository, SimpleFileSystemRepository, SimpleMemoryRepository, \
+    MmapFileSystemRepository
 from PiCN.Logger import Logger
 from PiCN.Packets import Name
 from PiCN.Mgmt import Mgmt
@@ -30,9 +31,14 @@ class ICNDataRepository(object):
 
     def __init__(self, foldername: Optional[str], prefix: Name,
                  port=9000, log_level=255, encoder: BasicEncoder = None,
-                 autoconfig: bool = False, autoconfig_routed: bool = False, interfaces: List[BaseInterface]=None):
+                 autoconfig: bool = False, autoconfig_routed: bool = False, interfaces: List[BaseInterface]=None,
+                 single_process: bool=False, range_serving: bool=False, chunk_size: int=4096):
         """
         :param foldername: If None, use an in-memory repository. Else, use a file system repository.
+        :param single_process: If True, run all layers in a single process (see AsyncioLayerStack).
+        :param range_serving: If True, memory map the files of the repository and serve their chunks and metadata
+                              objects directly from the repository, without a chunk layer (see MmapFileSystemRepository).
+        :param chunk_size: size of the chunks served
         """
 
         logger = Logger("ICNRepo", log_level)
@@ -45,13 +51,16 @@ class ICNDataRepository(object):
             encoder.set_log_level(log_level)
             self.encoder = encoder
         #chunkifyer
-        self.chunkifyer = SimpleContentChunkifyer()
+        self.chunkifyer = SimpleContentChunkifyer(chunk_size)
 
         #repo
         manager = multiprocessing.Manager()
 
         if foldername is None:
             self.repo: BaseRepository = SimpleMemoryRepository(prefix, manager, logger)
+        elif range_serving:
+            self.repo: BaseRepository = MmapFileSystemRepository(foldername, prefix, manager, logger,
+                                                                 chunk_size=chunk_size)
         else:
             self.repo: BaseRepository = SimpleFileSystemRepository(foldername, prefix, manager, logger)
 
@@ -73,19 +82,29 @@ class ICNDataRepository(object):
         self.chunklayer = BasicChunkLayer(self.chunkifyer, log_level=log_level)
         self.repolayer = BasicRepositoryLayer(self.repo, log_level=log_level)
 
-        self.lstack: LayerStack = LayerStack([
-            self.repolayer,
-            self.chunklayer,
-            self.packetencodinglayer,
-            self.linklayer
-        ])
+        layer_stack = AsyncioLayerStack if single_process else LayerStack
+        if foldername is not None and range_serving:
+            self.lstack: LayerStack = layer_stack([
+                self.repolayer,
+                self.packetencodinglayer,
+                self.linklayer
+            ])
+            lowest_repo_layer = self.repolayer
+        else:
+            self.lstack: LayerStack = layer_stack([
+                self.repolayer,
+                self.chunklayer,
+                self.packetencodinglayer,
+                self.linklayer
+            ])
+            lowest_repo_layer = self.chunklayer
 
         if autoconfig:
             self.autoconfiglayer = AutoconfigRepoLayer(name=prefix.string_components[-1],
                                                        addr='127.0.0.1',
                                                        linklayer=self.linklayer, repo=self.repo,
                                                        register_global=autoconfig_routed, log_level=log_level)
-            self.lstack.insert(self.autoconfiglayer, below_of=self.chunklayer)
+            self.lstack.insert(self.autoconfiglayer, below_of=lowest_repo_layer)
 
 
         # mgmt
@@ -14,6 +14,8 @@ from PiCN.Layers.PacketEncodingLayer.Encoder import SimpleStringEncoder, NdnTlvE
 class cases_ICNDataRepository(object):
     """Test the ICN Data Repository using fetch"""
 
+    range_serving = False
+
     @abc.abstractmethod
     def get_encoder(self):
         """returns the encoder to be used """
@@ -37,7 +39,8 @@ class cases_ICNDataRepository(object):
             content_file.write('B' * 20000)
 
         self.ICNRepo: ICNDataRepository = ICNDataRepository("/tmp/repo_unit_test", Name("/test/data"), 0,
-                                                            encoder=self.get_encoder(), log_level=255)
+                                                            encoder=self.get_encoder(), log_level=255,
+                                                            range_serving=self.range_serving)
         self.repo_port = self.ICNRepo.linklayer.interfaces[0].get_port()
         self.fetch = Fetch("127.0.0.1", self.repo_port, encoder=self.get_encoder())
 
@@ -83,3 +86,10 @@ class test_ICNDataRepository_NDNTLVPacketEncoder(cases_ICNDataRepository, unitte
     """Runs tests with the NDNTLVPacketEncoder"""
     def get_encoder(self):
         return NdnTlvEncoder()
+
+class test_ICNDataRepository_RangeServing(cases_ICNDataRepository, unittest.TestCase):
+    """Runs tests with a memory mapped repository serving the chunks, and the NDNTLVPacketEncoder"""
+    range_serving = True
+
+    def get_encoder(self):
+        return NdnTlvEncoder()
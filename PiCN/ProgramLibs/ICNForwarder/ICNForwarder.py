@@ -4,10 +4,10 @@ import multiprocessing
 
 from typing import List
 
-from PiCN.LayerStack.LayerStack import LayerStack
+from PiCN.LayerStack import LayerStack, AsyncioLayerStack
 from PiCN.Layers.ICNLayer import BasicICNLayer
-from PiCN.Layers.ICNLayer.ForwardingInformationBase import ForwardingInformationBaseMemoryPrefix
-from PiCN.Layers.ICNLayer.PendingInterestTable import PendingInterstTableMemoryExact
+from PiCN.Layers.ICNLayer.ForwardingInformationBase import ForwardingInformationBaseMemoryTrie
+from PiCN.Layers.ICNLayer.PendingInterestTable import PendingInterestTableMemoryHashed
 from PiCN.Layers.RoutingLayer import BasicRoutingLayer
 from PiCN.Layers.RoutingLayer.RoutingInformationBase import TreeRoutingInformationBase
 from PiCN.Layers.PacketEncodingLayer import BasicPacketEncodingLayer
@@ -16,9 +16,9 @@ from PiCN.Layers.AutoconfigLayer import AutoconfigServerLayer
 
 from PiCN.Processes import PiCNSyncDataStructFactory
 
-from PiCN.Layers.ICNLayer.ContentStore import ContentStoreMemoryExact
+from PiCN.Layers.ICNLayer.ContentStore import ContentStoreMemoryBounded, BaseReplacementPolicy
 from PiCN.Layers.LinkLayer import BasicLinkLayer
-from PiCN.Layers.LinkLayer.Interfaces import UDP4Interface, AddressInfo, BaseInterface
+from PiCN.Layers.LinkLayer.Interfaces import UDP4Interface, BatchUDP4Interface, AddressInfo, BaseInterface
 from PiCN.Layers.LinkLayer.FaceIDTable import FaceIDDict
 
 from PiCN.Layers.PacketEncodingLayer.Encoder import BasicEncoder, SimpleStringEncoder
@@ -31,7 +31,9 @@ class ICNForwarder(object):
     """A ICN Forwarder using PiCN"""
 
     def __init__(self, port=9000, log_level=255, encoder: BasicEncoder=None, routing: bool=False, peers=None,
-                 autoconfig: bool=False, interfaces: List[BaseInterface] = None, ageing_interval: int=3):
+                 autoconfig: bool=False, interfaces: List[BaseInterface] = None, ageing_interval: int=3,
+                 cs_max_entries: int=None, cs_max_bytes: int=None, cs_replacement_policy: BaseReplacementPolicy=None,
+                 in_process_data_structs: bool=False, single_process: bool=False, queue_batch_size: int=1):
         # debug level
         logger = Logger("ICNForwarder", log_level)
 
@@ -43,15 +45,16 @@ class ICNForwarder(object):
             self.encoder = encoder
 
         # setup data structures
-        synced_data_struct_factory = PiCNSyncDataStructFactory()
-        synced_data_struct_factory.register("cs", ContentStoreMemoryExact)
-        synced_data_struct_factory.register("fib", ForwardingInformationBaseMemoryPrefix)
-        synced_data_struct_factory.register("pit", PendingInterstTableMemoryExact)
+        synced_data_struct_factory = PiCNSyncDataStructFactory(in_process=in_process_data_structs)
+        synced_data_struct_factory.register("cs", ContentStoreMemoryBounded)
+        synced_data_struct_factory.register("fib", ForwardingInformationBaseMemoryTrie)
+        synced_data_struct_factory.register("pit", PendingInterestTableMemoryHashed)
         synced_data_struct_factory.register("rib", TreeRoutingInformationBase)
         synced_data_struct_factory.register("faceidtable", FaceIDDict)
         synced_data_struct_factory.create_manager()
 
-        cs = synced_data_struct_factory.manager.cs()
+        cs = synced_data_struct_factory.manager.cs(max_entries=cs_max_entries, max_bytes=cs_max_bytes,
+                                                  replacement_policy=cs_replacement_policy)
         fib = synced_data_struct_factory.manager.fib()
         pit = synced_data_struct_factory.manager.pit()
         if routing:
@@ -62,6 +65,9 @@ class ICNForwarder(object):
         if interfaces is not None:
             self.interfaces = interfaces
             mgmt_port = port
+        elif queue_batch_size > 1:
+            interfaces = [BatchUDP4Interface(port, batch_size=queue_batch_size)]
+            mgmt_port = interfaces[0].get_port()
         else:
             interfaces = [UDP4Interface(port)]
             mgmt_port = interfaces[0].get_port()
@@ -71,11 +77,15 @@ class ICNForwarder(object):
         self.packetencodinglayer = BasicPacketEncodingLayer(self.encoder, log_level=log_level)
         self.icnlayer = BasicICNLayer(log_level=log_level, ageing_interval=ageing_interval)
 
-        self.lstack: LayerStack = LayerStack([
+        layers = [
             self.icnlayer,
             self.packetencodinglayer,
             self.linklayer
-        ])
+        ]
+        if single_process:
+            self.lstack: LayerStack = AsyncioLayerStack(layers)
+        else:
+            self.lstack: LayerStack = LayerStack(layers, batch_size=queue_batch_size)
 
         if autoconfig:
             self.autoconfiglayer: AutoconfigServerLayer = AutoconfigServerLayer(linklayer=self.linklayer,
@@ -92,11 +102,16 @@ class ICNForwarder(object):
         self.icnlayer.cs = cs
         self.icnlayer.fib = fib
         self.icnlayer.pit = pit
+        self.icnlayer.serve_data_struct(cs)
+        self.icnlayer.serve_data_struct(fib)
+        self.icnlayer.serve_data_struct(pit)
+        self.linklayer.serve_data_struct(faceidtable)
         if autoconfig:
             self.autoconfiglayer.fib = fib
         if routing:
             self.routinglayer.rib = rib
             self.routinglayer.fib = fib
+            self.routinglayer.serve_data_struct(rib)
 
         # mgmt
         self.mgmt = Mgmt(cs, fib, pit, self.linklayer, mgmt_port, self.stop_forwarder,
@@ -105,7 +120,6 @@ class ICNForwarder(object):
     def start_forwarder(self):
         # start processes
         self.lstack.start_all()
-        self.icnlayer.ageing()
         self.mgmt.start_process()
 
     def stop_forwarder(self):
@@ -0,0 +1,161 @@
+"""A ICN Forwarder using PiCN, running several ICN layers in parallel"""
+
+from typing import Dict, List
+
+from PiCN.LayerStack import LayerStack
+from PiCN.Layers.ICNLayer import BasicICNLayer
+from PiCN.Layers.ICNLayer.ContentStore import ContentStoreMemoryBounded, BaseReplacementPolicy
+from PiCN.Layers.ICNLayer.ForwardingInformationBase import ForwardingInformationBaseMemoryTrie
+from PiCN.Layers.ICNLayer.PendingInterestTable import PendingInterestTableMemoryHashed
+from PiCN.Layers.LinkLayer import BasicLinkLayer
+from PiCN.Layers.LinkLayer.Interfaces import UDP4Interface, BaseInterface
+from PiCN.Layers.LinkLayer.FaceIDTable import FaceIDDict
+from PiCN.Layers.PacketEncodingLayer import BasicPacketEncodingLayer
+from PiCN.Layers.PacketEncodingLayer.Encoder import BasicEncoder, SimpleStringEncoder
+from PiCN.Layers.ShardingLayer import BasicShardingLayer
+from PiCN.Logger import Logger
+from PiCN.Mgmt import Mgmt
+from PiCN.Packets import Content, Name
+from PiCN.Processes import PiCNSyncDataStructFactory
+
+
+class ShardedContentStore(object):
+    """Content stores of all shards, as seen by the Mgmt. Content objects are stored in the shard handling their name"""
+
+    def __init__(self, shards: List, shardinglayer: BasicShardingLayer):
+        self.shards = shards
+        self._shardinglayer = shardinglayer
+
+    def add_content_object(self, content: Content, static: bool=False):
+        self.shards[self._shardinglayer.shard_of(content.name)].add_content_object(content, static)
+
+    def find_content_object(self, name: Name):
+        return self.shards[self._shardinglayer.shard_of(name)].find_content_object(name)
+
+    def remove_content_object(self, name: Name):
+        self.shards[self._shardinglayer.shard_of(name)].remove_content_object(name)
+
+    def get_statistics(self) -> Dict[str, int]:
+        statistics = None
+        for cs in self.shards:
+            shard_statistics = cs.get_statistics()
+            if shard_statistics is None:
+                continue
+            if statistics is None:
+                statistics = dict.fromkeys(shard_statistics, 0)
+            for key, value in shard_statistics.items():
+                statistics[key] += value
+        return statistics
+
+
+class BroadcastForwardingInformationBase(object):
+    """Forwarding information bases of all shards, as seen by the Mgmt. Changes are applied to all shards"""
+
+    def __init__(self, shards: List):
+        self.shards = shards
+
+    def add_fib_entry(self, name: Name, fid: int, static: bool=False):
+        for fib in self.shards:
+            fib.add_fib_entry(name, fid, static)
+
+    def remove_fib_entry(self, name: Name):
+        for fib in self.shards:
+            fib.remove_fib_entry(name)
+
+    def find_fib_entry(self, name: Name, already_used=None, incoming_faceids=None):
+        return self.shards[0].find_fib_entry(name, already_used, incoming_faceids)
+
+    def clear(self):
+        for fib in self.shards:
+            fib.clear()
+
+
+class ShardedICNForwarder(object):
+    """A ICN Forwarder using PiCN, running several ICN layers (shards) in parallel, each with its own CS, PIT and FIB.
+    A sharding layer on top of the link layer distributes received packets to the shards by name, so that an interest
+    and the content object answering it are handled by the same shard. FIB changes done by the Mgmt are applied to all
+    shards.
+    :param shards: number of shards
+    :param shard_prefix_length: number of name components deciding the shard, the full name if None
+    """
+
+    def __init__(self, port=9000, log_level=255, encoder: BasicEncoder=None, shards: int=2,
+                 shard_prefix_length: int=None, interfaces: List[BaseInterface]=None, ageing_interval: int=3,
+                 cs_max_entries: int=None, cs_max_bytes: int=None, cs_replacement_policy: BaseReplacementPolicy=None,
+                 in_process_data_structs: bool=False):
+        # debug level
+        logger = Logger("ShardedICNForwarder", log_level)
+
+        # packet encoder
+        if encoder is None:
+            self.encoder = SimpleStringEncoder()
+        else:
+            encoder.set_log_level(log_level)
+            self.encoder = encoder
+
+        # setup data structures
+        synced_data_struct_factory = PiCNSyncDataStructFactory(in_process=in_process_data_structs)
+        synced_data_struct_factory.register("cs", ContentStoreMemoryBounded)
+        synced_data_struct_factory.register("fib", ForwardingInformationBaseMemoryTrie)
+        synced_data_struct_factory.register("pit", PendingInterestTableMemoryHashed)
+        synced_data_struct_factory.register("faceidtable", FaceIDDict)
+        synced_data_struct_factory.create_manager()
+        faceidtable = synced_data_struct_factory.manager.faceidtable()
+
+        #default interface
+        if interfaces is not None:
+            self.interfaces = interfaces
+            mgmt_port = port
+        else:
+            interfaces = [UDP4Interface(port)]
+            mgmt_port = interfaces[0].get_port()
+
+        # link and sharding layer
+        self.linklayer = BasicLinkLayer(interfaces, faceidtable, log_level=log_level)
+        self.shardinglayer = BasicShardingLayer(self.encoder, shards, prefix_length=shard_prefix_length,
+                                                log_level=log_level)
+        self.lstack: LayerStack = LayerStack([self.shardinglayer, self.linklayer])
+        self.linklayer.serve_data_struct(faceidtable)
+
+        # shards, all sending to the sharding layer over a shared queue
+        self.icnlayers: List[BasicICNLayer] = []
+        self.shard_stacks: List[LayerStack] = []
+        for i in range(shards):
+            icnlayer = BasicICNLayer(log_level=log_level, ageing_interval=ageing_interval)
+            packetencodinglayer = BasicPacketEncodingLayer(self.encoder, log_level=log_level)
+            shard_stack = LayerStack([icnlayer, packetencodinglayer])
+            packetencodinglayer.queue_to_lower = self.lstack.queue_from_higher
+            self.shardinglayer.queues_to_shards.append(shard_stack.queue_from_lower)
+            icnlayer.cs = synced_data_struct_factory.manager.cs(max_entries=cs_max_entries, max_bytes=cs_max_bytes,
+                                                                replacement_policy=cs_replacement_policy)
+            icnlayer.fib = synced_data_struct_factory.manager.fib()
+            icnlayer.pit = synced_data_struct_factory.manager.pit()
+            icnlayer.serve_data_struct(icnlayer.cs)
+            icnlayer.serve_data_struct(icnlayer.fib)
+            icnlayer.serve_data_struct(icnlayer.pit)
+            self.icnlayers.append(icnlayer)
+            self.shard_stacks.append(shard_stack)
+
+        # mgmt
+        self.cs = ShardedContentStore([icnlayer.cs for icnlayer in self.icnlayers], self.shardinglayer)
+        self.fib = BroadcastForwardingInformationBase([icnlayer.fib for icnlayer in self.icnlayers])
+        self.mgmt = Mgmt(self.cs, self.fib, [icnlayer.pit for icnlayer in self.icnlayers], self.linklayer, mgmt_port,
+                         self.stop_forwarder, log_level=log_level)
+
+    def start_forwarder(self):
+        # start processes
+        for shard_stack in self.shard_stacks:
+            shard_stack.start_all()
+        self.lstack.start_all()
+        self.mgmt.start_process()
+
+    def stop_forwarder(self):
+        # Stop processes
+        self.mgmt.stop_process()
+        self.lstack.stop_all()
+        for shard_stack in self.shard_stacks:
+            shard_stack.stop_all()
+        # close queues file descriptors
+        self.lstack.close_all()
+        for shard_stack in self.shard_stacks:
+            shard_stack.close_all()
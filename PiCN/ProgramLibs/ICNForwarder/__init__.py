@@ -1,3 +1,4 @@
 """A ICN Forwarder using PiCN"""
 
-from .ICNForwarder import ICNForwarder
\ No newline at end of file
+from .ICNForwarder import ICNForwarder
+from .ShardedICNForwarder import ShardedICNForwarder
@@ -17,10 +17,28 @@ class cases_ICNForwarder(object):
     def get_encoder(self):
         """returns the encoder to be used """
 
+    def get_in_process_data_structs(self):
+        """returns if the data structs should live in the layer processes"""
+        return False
+
+    def get_single_process(self):
+        """returns if all layers should run in a single process"""
+        return False
+
+    def get_queue_batch_size(self):
+        """returns the maximum number of packets a layer handles per wakeup"""
+        return 1
+
     def setUp(self):
         self.encoder = self.get_encoder()
-        self.forwarder1 = ICNForwarder(0, encoder=self.get_encoder(), log_level=255)
-        self.forwarder2 = ICNForwarder(0, encoder=self.get_encoder(), log_level=255)
+        self.forwarder1 = ICNForwarder(0, encoder=self.get_encoder(), log_level=255,
+                                       in_process_data_structs=self.get_in_process_data_structs(),
+                                       single_process=self.get_single_process(),
+                                       queue_batch_size=self.get_queue_batch_size())
+        self.forwarder2 = ICNForwarder(0, encoder=self.get_encoder(), log_level=255,
+                                       in_process_data_structs=self.get_in_process_data_structs(),
+                                       single_process=self.get_single_process(),
+                                       queue_batch_size=self.get_queue_batch_size())
         self.forwarder1_port = self.forwarder1.linklayer.interfaces[0].get_port()
         self.forwarder2_port = self.forwarder2.linklayer.interfaces[0].get_port()
 
@@ -130,4 +148,28 @@ class test_ICNForwarder_SimplePacketEncoder(cases_ICNForwarder, unittest.TestCas
 class test_ICNForwarder_NDNTLVPacketEncoder(cases_ICNForwarder, unittest.TestCase):
     """Runs tests with the NDNTLVPacketEncoder"""
     def get_encoder(self):
-        return NdnTlvEncoder()
\ No newline at end of file
+        return NdnTlvEncoder()
+
+class test_ICNForwarder_InProcessDataStructs(cases_ICNForwarder, unittest.TestCase):
+    """Runs tests with the SimplePacketEncoder and data structs living in the layer processes"""
+    def get_encoder(self):
+        return SimpleStringEncoder()
+
+    def get_in_process_data_structs(self):
+        return True
+
+class test_ICNForwarder_SingleProcess(cases_ICNForwarder, unittest.TestCase):
+    """Runs tests with the SimplePacketEncoder and all layers running in a single process"""
+    def get_encoder(self):
+        return SimpleStringEncoder()
+
+    def get_single_process(self):
+        return True
+
+class test_ICNForwarder_QueueBatch(cases_ICNForwarder, unittest.TestCase):
+    """Runs tests with the SimplePacketEncoder and batched queues between the layers"""
+    def get_encoder(self):
+        return SimpleStringEncoder()
+
+    def get_queue_batch_size(self):
+        return 16
@@ -0,0 +1,77 @@
+"""Test the Sharded ICN Forwarder"""
+
+import socket
+import time
+import unittest
+
+from PiCN.Layers.LinkLayer.Interfaces import AddressInfo
+from PiCN.Layers.PacketEncodingLayer.Encoder import NdnTlvEncoder
+from PiCN.Mgmt import MgmtClient
+from PiCN.Packets import Content, Interest, Name
+from PiCN.ProgramLibs.ICNForwarder import ShardedICNForwarder
+
+
+class test_ShardedICNForwarder(unittest.TestCase):
+    """Test the Sharded ICN Forwarder"""
+
+    def setUp(self):
+        self.encoder = NdnTlvEncoder()
+        self.forwarder = ShardedICNForwarder(0, encoder=NdnTlvEncoder(), shards=3, in_process_data_structs=True)
+        self.forwarder_port = self.forwarder.linklayer.interfaces[0].get_port()
+        self.mgmt_client = MgmtClient(self.forwarder_port)
+        self.testSock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.testSock.bind(("127.0.0.1", 0))
+        self.testSock.settimeout(5)
+        self.producerSock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.producerSock.bind(("127.0.0.1", 0))
+        self.producerSock.settimeout(5)
+
+    def tearDown(self):
+        self.forwarder.stop_forwarder()
+        self.testSock.close()
+        self.producerSock.close()
+
+    def test_mgmt(self):
+        """Test that forwarding rules are added to all shards and content to the shard handling its name"""
+        self.forwarder.start_forwarder()
+        self.mgmt_client.add_face("127.0.0.1", self.producerSock.getsockname()[1], 0)
+        self.mgmt_client.add_forwarding_rule(Name("/test"), 0)
+        for icnlayer in self.forwarder.icnlayers:
+            self.assertEqual(icnlayer.fib.find_fib_entry(Name("/test/data")).faceid, 0)
+
+        self.mgmt_client.add_new_content(Name("/test/data/object"), "HelloWorld")
+        name = Name("/test/data/object")
+        shard = self.forwarder.shardinglayer.shard_of(name)
+        for i, icnlayer in enumerate(self.forwarder.icnlayers):
+            entry = icnlayer.cs.find_content_object(name)
+            if i == shard:
+                self.assertEqual(entry.content, Content(name, "HelloWorld"))
+            else:
+                self.assertIsNone(entry)
+        self.assertEqual(self.forwarder.cs.get_statistics()['entries'], 1)
+
+        self.testSock.sendto(self.encoder.encode(Interest(name)), ("127.0.0.1", self.forwarder_port))
+        encoded_content, addr = self.testSock.recvfrom(8192)
+        self.assertEqual(self.encoder.decode(encoded_content), Content(name, "HelloWorld"))
+
+    def test_forwarding(self):
+        """Test that interests and content objects are handled by the same shard"""
+        self.forwarder.start_forwarder()
+        fid = self.forwarder.linklayer.faceidtable.get_or_create_faceid(
+            AddressInfo(self.producerSock.getsockname(), 0))
+        self.forwarder.fib.add_fib_entry(Name("/test"), fid, True)
+        names = [Name("/test/data/" + str(i)) for i in range(30)]
+        for name in names:
+            self.testSock.sendto(self.encoder.encode(Interest(name)), ("127.0.0.1", self.forwarder_port))
+            encoded_interest, addr = self.producerSock.recvfrom(8192)
+            self.assertEqual(self.encoder.decode(encoded_interest), Interest(name))
+            self.producerSock.sendto(self.encoder.encode(Content(name, "HelloWorld")), addr)
+            encoded_content, addr = self.testSock.recvfrom(8192)
+            self.assertEqual(self.encoder.decode(encoded_content), Content(name, "HelloWorld"))
+        time.sleep(1)
+        for icnlayer in self.forwarder.icnlayers:
+            self.assertEqual(icnlayer.pit.get_container_size(), 0)
+        cached = [len([name for name in names if icnlayer.cs.find_content_object(name)])
+                  for icnlayer in self.forwarder.icnlayers]
+        self.assertEqual(sum(cached), len(names))
+        self.assertTrue(all(cached))
@@ -4,7 +4,7 @@ import multiprocessing
 
 from typing import List
 
-from PiCN.LayerStack import LayerStack
+from PiCN.LayerStack import LayerStack, AsyncioLayerStack
 from PiCN.Layers.NFNLayer import BasicNFNLayer
 from PiCN.Layers.ChunkLayer import BasicChunkLayer
 from PiCN.Layers.ICNLayer import BasicICNLayer
@@ -12,12 +12,13 @@ from PiCN.Layers.PacketEncodingLayer import BasicPacketEncodingLayer
 from PiCN.Layers.LinkLayer import BasicLinkLayer
 
 from PiCN.Layers.ChunkLayer.Chunkifyer import SimpleContentChunkifyer
-from PiCN.Layers.ICNLayer.ForwardingInformationBase import ForwardingInformationBaseMemoryPrefix
-from PiCN.Layers.ICNLayer.PendingInterestTable import PendingInterstTableMemoryExact
+from PiCN.Layers.ICNLayer.ForwardingInformationBase import ForwardingInformationBaseMemoryTrie
+from PiCN.Layers.ICNLayer.PendingInterestTable import PendingInterestTableMemoryHashed
 from PiCN.Layers.NFNLayer.R2C import TimeoutR2CHandler
-from PiCN.Layers.NFNLayer.NFNExecutor import NFNPythonExecutor
-from PiCN.Layers.NFNLayer.NFNComputationTable import NFNComputationList
-from PiCN.Layers.ICNLayer.ContentStore import ContentStoreMemoryExact
+from PiCN.Layers.NFNLayer.NFNExecutor import NFNPythonExecutor, NFNExecutorPool
+from PiCN.Layers.NFNLayer.NFNComputationTable import NFNComputationDict
+from PiCN.Layers.NFNLayer.NFNResultCache import NFNResultCache
+from PiCN.Layers.ICNLayer.ContentStore import ContentStoreMemoryBounded, BaseReplacementPolicy
 from PiCN.Layers.PacketEncodingLayer.Encoder import BasicEncoder, SimpleStringEncoder
 from PiCN.Layers.NFNLayer.Parser import DefaultNFNParser
 from PiCN.Logger import Logger
@@ -31,7 +32,10 @@ class NFNForwarder(object):
     """NFN Forwarder for PICN"""
     # TODO add chunking layer
     def __init__(self, port=9000, log_level=255, encoder: BasicEncoder=None, interfaces: List[BaseInterface]=None,
-                 ageing_interval: int = 3):
+                 ageing_interval: int = 3, cs_max_entries: int=None, cs_max_bytes: int=None,
+                 cs_replacement_policy: BaseReplacementPolicy=None, in_process_data_structs: bool=False,
+                 single_process: bool=False, executor_workers: int=0, executor_queue_size: int=16,
+                 executor_timeout: float=10.0, result_cache_entries: int=0):
         # debug level
         logger = Logger("NFNForwarder", log_level)
         logger.info("Start PiCN NFN Forwarder on port " + str(port))
@@ -44,16 +48,17 @@ class NFNForwarder(object):
             self.encoder = encoder
 
        # setup data structures
-        synced_data_struct_factory = PiCNSyncDataStructFactory()
-        synced_data_struct_factory.register("cs", ContentStoreMemoryExact)
-        synced_data_struct_factory.register("fib", ForwardingInformationBaseMemoryPrefix)
-        synced_data_struct_factory.register("pit", PendingInterstTableMemoryExact)
+        synced_data_struct_factory = PiCNSyncDataStructFactory(in_process=in_process_data_structs)
+        synced_data_struct_factory.register("cs", ContentStoreMemoryBounded)
+        synced_data_struct_factory.register("fib", ForwardingInformationBaseMemoryTrie)
+        synced_data_struct_factory.register("pit", PendingInterestTableMemoryHashed)
         synced_data_struct_factory.register("faceidtable", FaceIDDict)
 
-        synced_data_struct_factory.register("computation_table", NFNComputationList)
+        synced_data_struct_factory.register("computation_table", NFNComputationDict)
         synced_data_struct_factory.create_manager()
 
-        cs = synced_data_struct_factory.manager.cs()
+        cs = synced_data_struct_factory.manager.cs(max_entries=cs_max_entries, max_bytes=cs_max_bytes,
+                                                  replacement_policy=cs_replacement_policy)
         fib = synced_data_struct_factory.manager.fib()
         pit = synced_data_struct_factory.manager.pit()
         faceidtable = synced_data_struct_factory.manager.faceidtable()
@@ -78,12 +83,20 @@ class NFNForwarder(object):
         # setup nfn
         self.icnlayer._interest_to_app = True
         self.executors = {"PYTHON": NFNPythonExecutor()}
+        self.executor_pool = None
+        if executor_workers > 0:
+            self.executor_pool = NFNExecutorPool(self.executors, executor_workers, executor_queue_size, executor_timeout)
+        self.result_cache = None
+        if result_cache_entries > 0:
+            self.result_cache = NFNResultCache(result_cache_entries)
         self.parser = DefaultNFNParser()
         self.r2cclient = TimeoutR2CHandler()
         comp_table = synced_data_struct_factory.manager.computation_table(self.r2cclient, self.parser)
-        self.nfnlayer = BasicNFNLayer(cs, fib, pit, faceidtable, comp_table, self.executors, self.parser, self.r2cclient, log_level=log_level)
+        self.nfnlayer = BasicNFNLayer(cs, fib, pit, faceidtable, comp_table, self.executors, self.parser, self.r2cclient, log_level=log_level,
+                                     executor_pool=self.executor_pool, result_cache=self.result_cache)
 
-        self.lstack: LayerStack = LayerStack([
+        layer_stack = AsyncioLayerStack if single_process else LayerStack
+        self.lstack: LayerStack = layer_stack([
             self.nfnlayer,
             self.chunklayer,
             self.icnlayer,
@@ -94,6 +107,11 @@ class NFNForwarder(object):
         self.icnlayer.cs = cs
         self.icnlayer.fib = fib
         self.icnlayer.pit = pit
+        self.icnlayer.serve_data_struct(cs)
+        self.icnlayer.serve_data_struct(fib)
+        self.icnlayer.serve_data_struct(pit)
+        self.linklayer.serve_data_struct(faceidtable)
+        self.nfnlayer.serve_data_struct(comp_table)
 
         # mgmt
         self.mgmt = Mgmt(self.icnlayer.cs, self.icnlayer.fib, self.icnlayer.pit, self.linklayer,
@@ -102,8 +120,9 @@ class NFNForwarder(object):
 
     def start_forwarder(self):
         # start processes
+        if self.executor_pool is not None:
+            self.executor_pool.start()
         self.lstack.start_all()
-        self.icnlayer.ageing()
         self.mgmt.start_process()
 
     def stop_forwarder(self):
@@ -112,3 +131,5 @@ class NFNForwarder(object):
         self.lstack.stop_all()
         # close queues file descriptors
         self.lstack.close_all()
+        if self.executor_pool is not None:
+            self.executor_pool.stop()
@@ -172,6 +172,33 @@ class cases_NFNForwarder(object):
         time.sleep(2)
         self.assertEqual(self.forwarder1.icnlayer.pit.get_container_size(), 0)
 
+    def test_NFNForwarder_simple_compute_two_nodes_executor_pool(self):
+        """Test a simple forwarding scenario, computing in the executor pool of the second node"""
+        self.forwarder2 = NFNForwarder(0, encoder=self.get_encoder(), log_level=255, executor_workers=2)
+        self.forwarder2_port = self.forwarder2.linklayer.interfaces[0].get_port()
+        self.forwarder1.start_forwarder()
+        self.forwarder2.start_forwarder()
+        # client <---> node1 <---> node2
+
+        fid = self.forwarder1.linklayer.faceidtable.get_or_create_faceid(AddressInfo(("127.0.0.1",
+                                                                                      self.forwarder2_port), 0))
+        self.forwarder1.icnlayer.fib.add_fib_entry(Name("/lib/func"), fid, True)
+        self.forwarder2.icnlayer.cs.add_content_object(Content("/lib/func/f1", "PYTHON\nf\ndef f():\n    return 'Hello World'"),
+                                                       static=True)
+
+        # create interest
+        name = Name("/lib/func/f1")
+        name += "_()"
+        name += "NFN"
+        encoded_interest = self.encoder.encode(Interest(name))
+        # send interest
+        self.testSock.sendto(encoded_interest, ("127.0.0.1", self.forwarder1_port))
+        # receive content
+        encoded_content, addr = self.testSock.recvfrom(8192)
+        content: Content = self.encoder.decode(encoded_content)
+        self.assertEqual("Hello World", content.content)
+        self.assertEqual(name, content.name)
+
     def test_NFNForwarder_compute_param_two_nodes(self):
         """Test a simple forwarding scenario with one additional node forwarding the data"""
         self.forwarder1.start_forwarder()
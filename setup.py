@@ -27,7 +27,8 @@ config_PiCN = {
                  'PiCN.Layers.RepositoryLayer', 'PiCN.Layers.RepositoryLayer.Repository',
                  'PiCN.ProgramLibs.ICNDataRepository', 'PiCN.Layers.NFNLayer', 'PiCN.Layers.NFNLayer.Parser',
                  'PiCN.Layers.NFNLayer.NFNOptimizer', 'PiCN.Layers.NFNLayer.NFNExecutor',
-                 'PiCN.ProgramLibs.NFNForwarder', 'PiCN.Simulations'],
+                 'PiCN.Layers.NFNLayer.NFNResultCache',
+                 'PiCN.ProgramLibs.NFNForwarder', 'PiCN.Simulations', 'PiCN.Benchmarks'],
     'scripts': [],
     'test_suite': 'nose2.collector.collector',
     'tests_require': ['nose2', 'rednose', 'nose-progressive'],